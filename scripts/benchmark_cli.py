@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Benchmark: CLI startup and command latency
+
+Runs each scenario in a fresh interpreter N times against a throwaway home
+directory, reports median and p95 wall time plus the slowest top-level
+imports (from -X importtime), and exits 1 when a scenario's p95 exceeds its
+budget or any run exits with a code other than the scenario's expected one.
+
+Usage:
+    python scripts/benchmark_cli.py
+    python scripts/benchmark_cli.py --runs 20 --only version help
+    python scripts/benchmark_cli.py --budget version=150 --budget-scale 2
+    python scripts/benchmark_cli.py --budgets ci-budgets.json --json results.json
+"""
+
+import argparse
+import json
+import math
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+TYPER_MAIN = (
+    "import sys\n"
+    "sys.argv = ['superclaude'] + sys.argv[1:]\n"
+    "from superclaude.cli.app import cli_main\n"
+    "cli_main()\n"
+)
+
+SETUP_INSTALL_DRY_RUN = (
+    "import argparse, sys\n"
+    "from setup.cli.commands.install import run\n"
+    "sys.exit(run(argparse.Namespace(\n"
+    "    install_dir=__import__('pathlib').Path(sys.argv[1]),\n"
+    "    force=False, dry_run=True, verbose=False, quiet=True, yes=True,\n"
+    "    components=['framework_docs', 'modes', 'commands', 'agents'],\n"
+    "    no_backup=True, list_components=False, diagnose=False,\n"
+    ")))\n"
+)
+
+# name -> (python code, arguments); "{install_dir}" is filled in per run
+SCENARIOS: Dict[str, Tuple[str, List[str]]] = {
+    "version": (TYPER_MAIN, ["--version"]),
+    "help": (TYPER_MAIN, ["--help"]),
+    "doctor": (TYPER_MAIN, ["doctor"]),
+    "config-show": (TYPER_MAIN, ["config", "show"]),
+    "install-dry-run": (
+        TYPER_MAIN,
+        ["install", "all", "--dry-run", "--install-dir", "{install_dir}"],
+    ),
+    "setup-install-dry-run": (SETUP_INSTALL_DRY_RUN, ["{install_dir}"]),
+}
+
+# Default p95 budgets in milliseconds
+DEFAULT_BUDGETS_MS: Dict[str, float] = {
+    "version": 300,
+    "help": 400,
+    "doctor": 800,
+    "config-show": 600,
+    "install-dry-run": 1500,
+    "setup-install-dry-run": 1500,
+}
+
+# Expected exit codes where not 0; the sandbox has nothing installed, so
+# doctor reports failed checks
+EXPECTED_EXIT_CODES: Dict[str, int] = {
+    "doctor": 1,
+}
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of values"""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def parse_import_times(stderr: str, depth: int = 0) -> List[Tuple[str, int]]:
+    """
+    Parse -X importtime output
+
+    Args:
+        stderr: Interpreter stderr
+        depth: Nesting level to report (0 = modules imported directly)
+
+    Returns:
+        (module, cumulative microseconds) pairs, slowest first
+    """
+    times = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        if not cumulative.strip().isdigit():
+            continue  # Header line
+        level = (len(name) - len(name.lstrip()) - 1) // 2
+        if level == depth:
+            times.append((name.strip(), int(cumulative)))
+    return sorted(times, key=lambda item: item[1], reverse=True)
+
+
+class Sandbox:
+    """Throwaway home directory so runs never touch the real ~/.claude"""
+
+    def __enter__(self) -> "Sandbox":
+        # The installer refuses targets under /tmp, so stay inside home
+        self.home = Path(tempfile.mkdtemp(prefix=".sc-bench-", dir=Path.home()))
+        self.install_dir = self.home / ".claude" / "superclaude"
+        (self.home / ".claude" / "commands").mkdir(parents=True)  # Claude Code creates it
+        self.env = dict(
+            os.environ,
+            HOME=str(self.home),
+            USERPROFILE=str(self.home),
+            PYTHONPATH=os.pathsep.join(
+                filter(None, [str(PROJECT_ROOT), os.environ.get("PYTHONPATH")])
+            ),
+            SUPERCLAUDE_NO_UPDATE_CHECK="1",
+        )
+        self.env.pop("SUPERCLAUDE_TRACE", None)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        shutil.rmtree(self.home, ignore_errors=True)
+
+    def command(
+        self, scenario: str, python_flags: Optional[List[str]] = None
+    ) -> List[str]:
+        code, arguments = SCENARIOS[scenario]
+        arguments = [arg.format(install_dir=self.install_dir) for arg in arguments]
+        return [sys.executable, *(python_flags or []), "-c", code, *arguments]
+
+
+def run_scenario(sandbox: Sandbox, scenario: str, runs: int) -> Dict[str, object]:
+    """Time a scenario in fresh interpreters and capture its import profile"""
+    # Profile first; this also warms filesystem and bytecode caches
+    profile = subprocess.run(
+        sandbox.command(scenario, ["-X", "importtime"]),
+        cwd=sandbox.home,
+        env=sandbox.env,
+        capture_output=True,
+        text=True,
+    )
+
+    timings = []
+    exit_codes = set()
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run(
+            sandbox.command(scenario),
+            cwd=sandbox.home,
+            env=sandbox.env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        timings.append((time.perf_counter() - start) * 1000)
+        exit_codes.add(result.returncode)
+
+    return {
+        "median_ms": statistics.median(timings),
+        "p95_ms": percentile(timings, 0.95),
+        "min_ms": min(timings),
+        "exit_codes": sorted(exit_codes),
+        "imports": parse_import_times(profile.stderr)[:8],
+    }
+
+
+def load_budgets(args: argparse.Namespace) -> Dict[str, float]:
+    """Default budgets, overridden by --budgets file and --budget, then scaled"""
+    budgets = dict(DEFAULT_BUDGETS_MS)
+    if args.budgets:
+        with open(args.budgets, "r") as f:
+            budgets.update({name: float(ms) for name, ms in json.load(f).items()})
+    for item in args.budget or []:
+        name, _, ms = item.partition("=")
+        if name not in SCENARIOS or not ms:
+            raise SystemExit(f"Invalid --budget {item!r}; expected <scenario>=<ms>")
+        budgets[name] = float(ms)
+    return {name: ms * args.budget_scale for name, ms in budgets.items()}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark CLI startup and commands")
+    parser.add_argument("--runs", type=int, default=10, help="Runs per scenario")
+    parser.add_argument(
+        "--only", nargs="+", choices=sorted(SCENARIOS), help="Scenarios to run"
+    )
+    parser.add_argument(
+        "--budget",
+        action="append",
+        metavar="SCENARIO=MS",
+        help="Override one scenario's p95 budget (repeatable)",
+    )
+    parser.add_argument("--budgets", type=Path, help="JSON file of {scenario: ms}")
+    parser.add_argument(
+        "--budget-scale",
+        type=float,
+        default=1.0,
+        help="Multiply every budget (e.g. 2 on slow CI machines)",
+    )
+    parser.add_argument("--json", type=Path, help="Write results to this file")
+    args = parser.parse_args(argv)
+
+    budgets = load_budgets(args)
+    scenarios = args.only or list(SCENARIOS)
+    results = {}
+    over_budget = []
+    failed = []
+
+    print(f"Python {sys.version.split()[0]}   runs per scenario: {args.runs}\n")
+    print(f"{'scenario':<24}{'median':>10}{'p95':>10}{'budget':>10}")
+
+    with Sandbox() as sandbox:
+        for scenario in scenarios:
+            result = run_scenario(sandbox, scenario, args.runs)
+            result["budget_ms"] = budgets.get(scenario)
+            result["expected_exit_code"] = EXPECTED_EXIT_CODES.get(scenario, 0)
+            results[scenario] = result
+
+            # Timings of a failing command say nothing about the real one
+            flag = ""
+            if result["exit_codes"] != [result["expected_exit_code"]]:
+                failed.append(scenario)
+                codes = ", ".join(str(code) for code in result["exit_codes"])
+                flag = f"  FAILED (exit {codes})"
+            elif (
+                result["budget_ms"] is not None
+                and result["p95_ms"] > result["budget_ms"]
+            ):
+                over_budget.append(scenario)
+                flag = "  OVER BUDGET"
+            print(
+                f"{scenario:<24}{result['median_ms']:8.1f}ms{result['p95_ms']:8.1f}ms"
+                f"{result['budget_ms'] or 0:8.0f}ms{flag}"
+            )
+
+    print("\nSlowest top-level imports (cumulative):")
+    for scenario, result in results.items():
+        imports = ", ".join(
+            f"{name} {us / 1000:.1f}ms" for name, us in result["imports"][:5]
+        )
+        print(f"  {scenario:<22} {imports}")
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+
+    if failed:
+        print(f"\nFailed: {', '.join(failed)}")
+    if over_budget:
+        print(f"\nOver budget: {', '.join(over_budget)}")
+    return 1 if failed or over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
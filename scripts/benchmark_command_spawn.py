@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: MCP command spawning
+
+Compares per-call latency of running a command through the user's shell
+(the previous MCPComponent behaviour) with direct exec of the resolved binary.
+
+Usage:
+    python scripts/benchmark_command_spawn.py
+    python scripts/benchmark_command_spawn.py --runs 50 -- git --version
+"""
+
+import argparse
+import os
+import shlex
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from setup.components.mcp import MCPComponent  # noqa: E402
+
+
+def run_via_shell(cmd: List[str]) -> None:
+    """Previous behaviour: quote argv and run it through $SHELL"""
+    cmd_str = " ".join(shlex.quote(arg) for arg in cmd)
+    subprocess.run(
+        cmd_str,
+        shell=True,
+        env=os.environ,
+        executable=os.environ.get("SHELL", "/bin/bash"),
+        capture_output=True,
+    )
+
+
+def measure(label: str, call: Callable[[], None], runs: int) -> List[float]:
+    """Time a call, returning per-call latencies in milliseconds"""
+    call()  # Warm up filesystem caches
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        call()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    print(
+        f"{label:<12} median {statistics.median(timings):7.2f} ms   "
+        f"min {min(timings):7.2f} ms   max {max(timings):7.2f} ms"
+    )
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark MCP command spawning")
+    parser.add_argument("--runs", type=int, default=20, help="Calls per variant")
+    parser.add_argument(
+        "command",
+        nargs="*",
+        default=["git", "--version"],
+        help="Command to run (default: git --version)",
+    )
+    args = parser.parse_args()
+
+    component = MCPComponent()
+    cmd = args.command
+
+    print(f"Command: {' '.join(cmd)}   shell: {os.environ.get('SHELL', '/bin/bash')}")
+    before = measure("shell", lambda: run_via_shell(cmd), args.runs)
+    after = measure(
+        "direct exec",
+        lambda: component._run_command_cross_platform(cmd, capture_output=True),
+        args.runs,
+    )
+
+    speedup = statistics.median(before) / statistics.median(after)
+    print(f"Speedup: {speedup:.1f}x per call")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,16 +3,28 @@ SuperClaude Backup Operation Module
 Refactored from backup.py for unified CLI hub
 """
 
+import bz2
+import contextlib
+import fnmatch
+import gzip
+import hashlib
+import io
+import os
 import sys
+import tempfile
 import time
 import tarfile
 import json
+import zlib
 from pathlib import Path
 from ...utils.paths import get_home_directory
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Tuple, Callable
 import argparse
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
+from ...services.backup_catalog import BackupCatalog
+from ...services.backup_store import SNAPSHOT_SUFFIX, BackupStore
 from ...services.settings import SettingsService
 from ...utils.ui import (
     display_header,
@@ -26,11 +38,74 @@ from ...utils.ui import (
     Colors,
     format_size,
 )
+from ...utils.compression import (
+    COMPRESSION_LEVEL,
+    ParallelCompressWriter,
+    open_tar_stream,
+)
+from ...utils.path_filter import PathFilter
 from ...utils.logger import get_logger
 from ... import DEFAULT_INSTALL_DIR
 from . import OperationBase
 
 
+BACKUP_METADATA_NAME = "backup_metadata.json"
+BACKUP_CHECKSUMS_NAME = "backup_checksums.json"  # Trailing member
+CHECKSUM_PAX_KEY = "SUPERCLAUDE.sha256"
+INLINE_READ_LIMIT = 8 * 1024 * 1024  # Larger files are hashed then streamed
+CHUNK_SIZE = 1024 * 1024
+
+# Raised while reading a truncated or corrupted archive
+ARCHIVE_READ_ERRORS = (tarfile.TarError, EOFError, OSError, zlib.error)
+
+# Never archived: earlier backups and machine-local state
+ALWAYS_EXCLUDED = ["/backups/", "/local/"]
+
+# Claude Code session data and caches; large and not part of the setup
+SESSION_DATA_EXCLUDES = [
+    "/projects/",
+    "/todos/",
+    "/shell-snapshots/",
+    "/statsig/",
+    "/logs/",
+    "/debug/",
+    "/ide/",
+    "/file-history/",
+    "/session-env/",
+    "/plugins/cache/",
+    "cache/",
+    "__pycache__/",
+    "*.log",
+    "*.tmp",
+    ".DS_Store",
+]
+
+# Profiles are include lists (top-level entries; None means everything)
+# plus gitignore-style excludes applied afterwards
+BACKUP_PROFILES = {
+    "full": {"include": None, "exclude": []},
+    "standard": {"include": None, "exclude": SESSION_DATA_EXCLUDES},
+    "framework": {
+        "include": ["/*.md", "/commands/", "/agents/", "/.superclaude-metadata.json"],
+        "exclude": SESSION_DATA_EXCLUDES,
+    },
+    "config": {
+        "include": ["/*.json", "/CLAUDE.md"],
+        "exclude": SESSION_DATA_EXCLUDES,
+    },
+}
+
+SIZE_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3}
+
+
+def file_sha256(fileobj) -> str:
+    """Hash a binary file object from its current position"""
+    hasher = hashlib.sha256()
+    for chunk in iter(lambda: fileobj.read(CHUNK_SIZE), b""):
+        hasher.update(chunk)
+    return hasher.hexdigest()
+
+
 class BackupOperation(OperationBase):
     """Backup operation implementation"""
 
@@ -49,9 +124,11 @@ def register_parser(subparsers, global_parser=None) -> argparse.ArgumentParser:
         epilog="""
 Examples:
   SuperClaude backup --create               # Create new backup
+  SuperClaude backup --create --incremental # Deduplicated snapshot backup
   SuperClaude backup --list --verbose       # List available backups (verbose)
   SuperClaude backup --restore              # Interactive restore
   SuperClaude backup --restore backup.tar.gz  # Restore specific backup
+  SuperClaude backup --restore backup.tar.gz --component agents  # Restore one component
   SuperClaude backup --info backup.tar.gz   # Show backup information
   SuperClaude backup --cleanup --force      # Clean up old backups (forced)
         """,
@@ -85,6 +162,19 @@ Examples:
         "--cleanup", action="store_true", help="Clean up old backup files"
     )
 
+    operation_group.add_argument(
+        "--verify",
+        nargs="*",
+        metavar="BACKUP",
+        help="Check backup checksums without extracting (default: all backups)",
+    )
+
+    operation_group.add_argument(
+        "--rebuild-catalog",
+        action="store_true",
+        help="Re-read every backup and rewrite the backup catalog",
+    )
+
     # Backup options
     parser.add_argument(
         "--backup-dir",
@@ -94,6 +184,36 @@ Examples:
 
     parser.add_argument("--name", type=str, help="Custom backup name (for --create)")
 
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Create a deduplicated snapshot that only stores changed files (for --create)",
+    )
+
+    parser.add_argument(
+        "--profile",
+        choices=sorted(BACKUP_PROFILES),
+        default="full",
+        help=(
+            "What to back up: full (everything), standard (all but session data "
+            "and caches), framework or config (default: full)"
+        ),
+    )
+
+    parser.add_argument(
+        "--exclude",
+        action="append",
+        metavar="PATTERN",
+        help="gitignore-style pattern to leave out; prefix with ! to re-include (repeatable)",
+    )
+
+    parser.add_argument(
+        "--max-file-size",
+        type=parse_size,
+        metavar="SIZE",
+        help="Skip files larger than SIZE, e.g. 500K, 20M or 1G",
+    )
+
     parser.add_argument(
         "--compress",
         choices=["none", "gzip", "bzip2"],
@@ -101,6 +221,14 @@ Examples:
         help="Compression method (default: gzip)",
     )
 
+    parser.add_argument(
+        "--compress-threads",
+        type=int,
+        default=min(4, os.cpu_count() or 1),
+        help="Threads for block-parallel gzip/bzip2 compression; 1 writes a single stream"
+        " instead of one per 4 MiB block",
+    )
+
     # Restore options
     parser.add_argument(
         "--overwrite",
@@ -108,6 +236,34 @@ Examples:
         help="Overwrite existing files during restore",
     )
 
+    parser.add_argument(
+        "--component",
+        action="append",
+        metavar="NAME",
+        help="Restore only this component's files (repeatable, for --restore)",
+    )
+
+    parser.add_argument(
+        "--path",
+        action="append",
+        metavar="PATTERN",
+        help="Restore only paths under this prefix or matching this glob (repeatable)",
+    )
+
+    parser.add_argument(
+        "--restore-jobs",
+        type=int,
+        default=4,
+        help="Number of threads writing restored files (default: 4)",
+    )
+
+    parser.add_argument(
+        "--verify-jobs",
+        type=int,
+        default=min(4, os.cpu_count() or 1),
+        help="Number of backups verified at once",
+    )
+
     # Cleanup options
     parser.add_argument(
         "--keep",
@@ -123,6 +279,44 @@ Examples:
     return parser
 
 
+def parse_size(value: str) -> int:
+    """Parse a size like 512, 500K, 20M or 1G (binary units) into bytes"""
+    text = value.strip().upper().rstrip("B")
+    unit = text[-1:] if text[-1:] in SIZE_UNITS else ""
+    try:
+        number = float(text[: len(text) - len(unit)])
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid size: {value}")
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"Invalid size: {value}")
+    return int(number * SIZE_UNITS[unit])
+
+
+def build_path_filter(
+    profile: str = "full", extra_excludes: Optional[List[str]] = None
+) -> PathFilter:
+    """
+    Compile a backup profile and extra patterns into a path filter
+
+    Args:
+        profile: Name in BACKUP_PROFILES
+        extra_excludes: User patterns, applied after the profile's
+
+    Returns:
+        PathFilter for paths relative to the install directory
+    """
+    settings = BACKUP_PROFILES[profile]
+    rules = []
+    if settings["include"] is not None:
+        # Whitelist: exclude every top-level entry, then re-include
+        rules.append("/*")
+        rules.extend(f"!{pattern}" for pattern in settings["include"])
+    rules.extend(settings["exclude"])
+    rules.extend(extra_excludes or [])
+    rules.extend(ALWAYS_EXCLUDED)  # Last so no pattern can re-include them
+    return PathFilter(rules)
+
+
 def get_backup_directory(args: argparse.Namespace) -> Path:
     """Get the backup directory path"""
     if args.backup_dir:
@@ -160,6 +354,14 @@ def get_backup_info(backup_path: Path) -> Dict[str, Any]:
         info["size"] = stats.st_size
         info["created"] = datetime.fromtimestamp(stats.st_mtime)
 
+        if backup_path.name.endswith(SNAPSHOT_SUFFIX):
+            manifest = BackupStore(backup_path.parent).load_snapshot(backup_path)
+            info["metadata"] = manifest.get("metadata", {})
+            info["files"] = len(manifest["files"])
+            # Logical size of the snapshot; blobs are shared between snapshots
+            info["size"] = sum(entry["size"] for entry in manifest["files"].values())
+            return info
+
         # Try to read metadata from backup
         if backup_path.suffix == ".gz":
             mode = "r:gz"
@@ -171,15 +373,19 @@ def get_backup_info(backup_path: Path) -> Dict[str, Any]:
         with tarfile.open(backup_path, mode) as tar:
             # Look for metadata file
             try:
-                metadata_member = tar.getmember("backup_metadata.json")
+                metadata_member = tar.getmember(BACKUP_METADATA_NAME)
                 metadata_file = tar.extractfile(metadata_member)
                 if metadata_file:
                     info["metadata"] = json.loads(metadata_file.read().decode())
             except KeyError:
                 pass  # No metadata file
 
-            # Get list of files in backup
-            info["files"] = len(tar.getnames())
+            # Count archived files, not the bookkeeping members
+            info["files"] = sum(
+                1
+                for name in tar.getnames()
+                if name not in (BACKUP_METADATA_NAME, BACKUP_CHECKSUMS_NAME)
+            )
 
     except Exception as e:
         info["error"] = str(e)
@@ -187,25 +393,132 @@ def get_backup_info(backup_path: Path) -> Dict[str, Any]:
     return info
 
 
+def find_backup_files(backup_dir: Path) -> List[Path]:
+    """Find backup files (tarballs and incremental snapshots)"""
+    if not backup_dir.exists():
+        return []
+
+    backup_files = list(backup_dir.glob("*.tar*")) + list(
+        backup_dir.glob(f"*{SNAPSHOT_SUFFIX}")
+    )
+    return [path for path in backup_files if path.is_file()]
+
+
+def catalog_entry_from_info(info: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a catalog entry from get_backup_info output (reads the file)"""
+    backup_path = info["path"]
+    with open(backup_path, "rb") as f:
+        sha256 = file_sha256(f)
+
+    is_snapshot = backup_path.name.endswith(SNAPSHOT_SUFFIX)
+    return BackupCatalog.make_entry(
+        backup_path,
+        info.get("files"),
+        info["metadata"],
+        sha256,
+        logical_size=info["size"] if is_snapshot else None,
+    )
+
+
+def backup_info_from_entry(backup_path: Path, entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the get_backup_info dict from a catalog entry"""
+    size = entry.get("logical_size")
+    return {
+        "path": backup_path,
+        "exists": True,
+        "size": entry["size"] if size is None else size,
+        "created": datetime.fromtimestamp(entry["mtime_ns"] / 1e9),
+        "metadata": entry.get("metadata", {}),
+        "files": entry.get("files"),
+        "sha256": entry.get("sha256"),
+    }
+
+
 def list_backups(backup_dir: Path) -> List[Dict[str, Any]]:
-    """List all available backups"""
-    backups = []
+    """
+    List all available backups
 
-    if not backup_dir.exists():
-        return backups
+    Backups are described from the catalog; only backups that are missing
+    from it or changed since they were recorded are opened, and the catalog
+    is updated with what was read.
+    """
+    backups = []
+    catalog = BackupCatalog(backup_dir)
+    entries = catalog.load()
+    updated = {}
+
+    for backup_file in find_backup_files(backup_dir):
+        try:
+            stats = backup_file.stat()
+        except OSError:
+            continue
+
+        entry = entries.get(backup_file.name)
+        if entry and BackupCatalog.is_current(entry, stats):
+            backups.append(backup_info_from_entry(backup_file, entry))
+            updated[backup_file.name] = entry
+            continue
+
+        info = get_backup_info(backup_file)
+        backups.append(info)
+        if "error" not in info:
+            try:
+                updated[backup_file.name] = catalog_entry_from_info(info)
+            except OSError:
+                pass
 
-    # Find all backup files
-    for backup_file in backup_dir.glob("*.tar*"):
-        if backup_file.is_file():
-            info = get_backup_info(backup_file)
-            backups.append(info)
+    if updated != entries:
+        try:
+            catalog.save(updated)
+        except OSError as e:
+            get_logger().debug(f"Could not update backup catalog: {e}")
 
     # Sort by creation date (newest first)
-    backups.sort(key=lambda x: x.get("created", datetime.min), reverse=True)
+    backups.sort(key=lambda x: x.get("created") or datetime.min, reverse=True)
 
     return backups
 
 
+def rebuild_catalog(backup_dir: Path) -> bool:
+    """Re-read every backup and rewrite the catalog from scratch"""
+    logger = get_logger()
+
+    entries = {}
+    for backup_file in find_backup_files(backup_dir):
+        info = get_backup_info(backup_file)
+        if "error" in info:
+            logger.warning(f"Skipping unreadable backup {backup_file.name}: {info['error']}")
+            continue
+        entries[backup_file.name] = catalog_entry_from_info(info)
+
+    try:
+        BackupCatalog(backup_dir).save(entries)
+    except OSError as e:
+        logger.error(f"Could not write backup catalog: {e}")
+        return False
+
+    logger.success(f"Backup catalog rebuilt with {len(entries)} backups")
+    return True
+
+
+def record_in_catalog(
+    backup_dir: Path,
+    backup_path: Path,
+    files: int,
+    metadata: Dict[str, Any],
+    sha256: str,
+    logical_size: Optional[int] = None,
+) -> None:
+    """Record a new backup in the catalog; failures only cost a later re-read"""
+    try:
+        entry = BackupCatalog.make_entry(
+            backup_path, files, metadata, sha256, logical_size
+        )
+        BackupCatalog(backup_dir).record(backup_path, entry)
+    except OSError as e:
+        get_logger().warning(f"Could not update backup catalog: {e}")
+
+
 def display_backup_list(backups: List[Dict[str, Any]]) -> None:
     """Display list of available backups"""
     print(f"\n{Colors.CYAN}{Colors.BRIGHT}Available Backups{Colors.RESET}")
@@ -233,7 +546,74 @@ def display_backup_list(backups: List[Dict[str, Any]]) -> None:
     print()
 
 
-def create_backup_metadata(install_dir: Path) -> Dict[str, Any]:
+def map_component_files(install_dir: Path, rel_paths: List[str]) -> Dict[str, List[str]]:
+    """
+    Map installed components to the archived paths of their tracked files
+
+    Uses each component's install manifest (install-relative paths). Installs
+    that predate the manifest only record file names, which are resolved
+    under the component's recorded install directory, or matched by name
+    when exactly one archived file has that name.
+
+    Args:
+        install_dir: Installation directory
+        rel_paths: Archived paths relative to install_dir (posix style)
+
+    Returns:
+        Dict of component name -> archived paths
+    """
+    archived = set(rel_paths)
+    by_filename: Dict[str, List[str]] = {}
+    for rel_path in rel_paths:
+        by_filename.setdefault(rel_path.rsplit("/", 1)[-1], []).append(rel_path)
+
+    try:
+        settings = SettingsService(install_dir)
+        registrations = settings.get_installed_components()
+    except (ValueError, OSError):
+        return {}
+
+    component_files = {}
+    for component_name, info in registrations.items():
+        if not isinstance(info, dict):
+            continue
+
+        try:
+            manifest = settings.get_file_manifest(component_name)
+        except (ValueError, OSError):
+            manifest = {}
+        if manifest:
+            component_files[component_name] = sorted(archived.intersection(manifest))
+            continue
+
+        base = _component_base(install_dir, info.get("install_directory"))
+        paths = set()
+        for filename in info.get("files", []):
+            if base is not None:
+                rel_path = f"{base}/{filename}" if base else filename
+                if rel_path in archived:
+                    paths.add(rel_path)
+            elif len(by_filename.get(filename, [])) == 1:
+                paths.add(by_filename[filename][0])
+        component_files[component_name] = sorted(paths)
+
+    return component_files
+
+
+def _component_base(install_dir: Path, install_directory: Any) -> Optional[str]:
+    """Install-relative posix directory of a component, if recorded"""
+    if not isinstance(install_directory, str):
+        return None
+    try:
+        base = Path(install_directory).relative_to(install_dir).as_posix()
+    except ValueError:
+        return None
+    return "" if base == "." else base
+
+
+def create_backup_metadata(
+    install_dir: Path, rel_paths: Optional[List[str]] = None
+) -> Dict[str, Any]:
     """Create metadata for the backup"""
     from setup import __version__
 
@@ -261,9 +641,297 @@ def create_backup_metadata(install_dir: Path) -> Dict[str, Any]:
     except Exception:
         pass  # Continue without metadata
 
+    if rel_paths is not None:
+        # Lets restore select a component before any file data is read
+        metadata["component_files"] = map_component_files(install_dir, rel_paths)
+
     return metadata
 
 
+def iter_backup_files(
+    install_dir: Path,
+    skip: Optional[Path] = None,
+    path_filter: Optional[PathFilter] = None,
+):
+    """
+    Yield files under install_dir that belong in a backup
+
+    Walks the tree once with os.scandir, in sorted order for reproducible
+    archives, without following directory symlinks. Excluded directories
+    are pruned rather than walked.
+
+    Args:
+        install_dir: Installation directory
+        skip: A file to leave out (e.g. the archive being written)
+        path_filter: Exclude rules (defaults to the "full" profile)
+    """
+    if path_filter is None:
+        path_filter = build_path_filter()
+    pending = [(install_dir, "")]
+
+    while pending:
+        directory, prefix = pending.pop()
+        try:
+            with os.scandir(directory) as scan:
+                entries = sorted(scan, key=lambda entry: entry.name)
+        except OSError:
+            continue
+
+        subdirs = []
+        for entry in entries:
+            rel_path = prefix + entry.name
+            is_dir = entry.is_dir(follow_symlinks=False)
+            if path_filter.is_excluded(rel_path, is_dir):
+                continue
+
+            path = Path(entry.path)
+            if is_dir:
+                subdirs.append((path, rel_path + "/"))
+            elif entry.is_file() and path != skip:
+                yield path
+
+        pending.extend(reversed(subdirs))
+
+
+def select_backup_files(
+    args: argparse.Namespace, skip: Optional[Path] = None
+) -> Tuple[List[Path], List[Tuple[Path, int]]]:
+    """
+    Apply the backup profile, excludes and size limit to the installation
+
+    Args:
+        args: Parsed arguments (profile, exclude, max_file_size)
+        skip: A file to leave out (e.g. the archive being written)
+
+    Returns:
+        Tuple of (files to back up, (path, size) of files over the size limit)
+    """
+    path_filter = build_path_filter(
+        getattr(args, "profile", None) or "full", getattr(args, "exclude", None)
+    )
+    max_file_size = getattr(args, "max_file_size", None)
+
+    files, oversized = [], []
+    for path in iter_backup_files(args.install_dir, skip, path_filter):
+        if max_file_size is not None:
+            try:
+                size = path.stat().st_size
+            except OSError:
+                continue
+            if size > max_file_size:
+                oversized.append((path, size))
+                continue
+        files.append(path)
+
+    return files, oversized
+
+
+def describe_excludes(args: argparse.Namespace) -> List[str]:
+    """Patterns the chosen profile and --exclude leave out of a backup"""
+    settings = BACKUP_PROFILES[getattr(args, "profile", None) or "full"]
+    excluded = []
+    if settings["include"] is not None:
+        excluded.append(f"everything but {', '.join(settings['include'])}")
+    excluded.extend(settings["exclude"])
+    excluded.extend(getattr(args, "exclude", None) or [])
+    return excluded + ALWAYS_EXCLUDED
+
+
+def display_backup_estimate(
+    install_dir: Path,
+    files: List[Path],
+    oversized: List[Tuple[Path, int]],
+    excluded: Optional[List[str]] = None,
+) -> None:
+    """Print what a backup would contain without writing it"""
+    sizes = {}
+    for path in files:
+        try:
+            sizes[path] = path.stat().st_size
+        except OSError:
+            continue
+
+    by_top_level: Dict[str, int] = {}
+    for path, size in sizes.items():
+        parts = path.relative_to(install_dir).parts
+        key = parts[0] + "/" if len(parts) > 1 else "(top-level files)"
+        by_top_level[key] = by_top_level.get(key, 0) + size
+
+    print(f"\n{Colors.CYAN}{Colors.BRIGHT}Backup Estimate (dry run){Colors.RESET}")
+    print("=" * 50)
+    print(f"Files: {len(sizes)}")
+    print(f"Total size (uncompressed): {format_size(sum(sizes.values()))}")
+
+    if by_top_level:
+        print("\nLargest entries:")
+        ranked = sorted(by_top_level.items(), key=lambda item: item[1], reverse=True)
+        for name, size in ranked[:10]:
+            print(f"  {name:<36} {format_size(size):>10}")
+
+    if excluded:
+        print(f"\nExcluded: {', '.join(excluded)}")
+
+    if oversized:
+        print(f"\n{Colors.YELLOW}Skipped {len(oversized)} files over the size limit:{Colors.RESET}")
+        for path, size in sorted(oversized, key=lambda item: item[1], reverse=True)[:10]:
+            print(f"  {path.relative_to(install_dir).as_posix():<36} {format_size(size):>10}")
+
+    print()
+
+
+class HashingWriter:
+    """File object wrapper that hashes everything written through it"""
+
+    def __init__(self, fileobj):
+        self._fileobj = fileobj
+        self.hasher = hashlib.sha256()
+
+    def write(self, data) -> int:
+        self.hasher.update(data)
+        return self._fileobj.write(data)
+
+    def flush(self) -> None:
+        self._fileobj.flush()
+
+
+def write_backup_archive(
+    backup_file: Path,
+    install_dir: Path,
+    metadata: Dict[str, Any],
+    compress: str = "gzip",
+    threads: int = 1,
+    files: Optional[List[Path]] = None,
+) -> Tuple[int, int, str]:
+    """
+    Stream a tar archive of the installation to backup_file
+
+    Each member carries its sha256 in a PAX header (SUPERCLAUDE.sha256) so
+    restore can verify files while streaming, and a trailing
+    backup_checksums.json member lists every file's checksum so verify can
+    also detect missing members.
+
+    Args:
+        backup_file: Archive path to write
+        install_dir: Installation directory to archive
+        metadata: Backup metadata stored as backup_metadata.json
+        compress: "gzip", "bzip2" or "none"
+        threads: Compression threads; above 1 blocks are compressed in parallel
+        files: Files to archive (defaults to iter_backup_files)
+
+    Returns:
+        Tuple of (files archived, uncompressed bytes read, archive sha256)
+    """
+    if files is None:
+        files = iter_backup_files(install_dir, skip=backup_file)
+
+    logger = get_logger()
+    files_added = 0
+    bytes_read = 0
+    checksums: Dict[str, str] = {}
+
+    with open(backup_file, "wb") as archive:
+        raw = HashingWriter(archive)  # Checksum the archive for the catalog
+        if compress == "none":
+            stream = contextlib.nullcontext(raw)
+        elif threads > 1:
+            stream = ParallelCompressWriter(raw, compress, threads)
+        elif compress == "bzip2":
+            stream = bz2.BZ2File(raw, "wb", compresslevel=COMPRESSION_LEVEL)
+        else:
+            stream = gzip.GzipFile(
+                fileobj=raw, mode="wb", compresslevel=COMPRESSION_LEVEL
+            )
+
+        with stream as out, tarfile.open(fileobj=out, mode="w|") as tar:
+            # Add metadata file straight from memory
+            data = json.dumps(metadata, indent=2).encode("utf-8")
+            metadata_info = tarfile.TarInfo(BACKUP_METADATA_NAME)
+            metadata_info.size = len(data)
+            metadata_info.mtime = int(time.time())
+            metadata_info.mode = 0o644
+            tar.addfile(metadata_info, io.BytesIO(data))
+
+            # Add installation directory contents (excluding backups and local dirs)
+            for item in files:
+                rel_path = item.relative_to(install_dir).as_posix()
+                try:
+                    source = open(item, "rb")
+                except OSError as e:
+                    logger.warning(f"Could not add {item} to backup: {e}")
+                    continue
+
+                with source:
+                    tarinfo = tar.gettarinfo(arcname=rel_path, fileobj=source)
+                    if tarinfo.size <= INLINE_READ_LIMIT:
+                        # Single read: checksum and archived bytes always agree
+                        data = source.read()
+                        tarinfo.size = len(data)
+                        digest = hashlib.sha256(data).hexdigest()
+                        content = io.BytesIO(data)
+                    else:
+                        digest = file_sha256(source)
+                        source.seek(0)
+                        content = source
+                    tarinfo.pax_headers = {CHECKSUM_PAX_KEY: digest}
+                    tar.addfile(tarinfo, content)
+
+                checksums[rel_path] = digest
+                files_added += 1
+                bytes_read += tarinfo.size
+                if files_added % 10 == 0:
+                    logger.debug(f"Added {files_added} files to backup")
+
+            data = json.dumps({"algorithm": "sha256", "files": checksums}).encode()
+            checksums_info = tarfile.TarInfo(BACKUP_CHECKSUMS_NAME)
+            checksums_info.size = len(data)
+            checksums_info.mtime = int(time.time())
+            checksums_info.mode = 0o644
+            tar.addfile(checksums_info, io.BytesIO(data))
+
+    return files_added, bytes_read, raw.hasher.hexdigest()
+
+
+def create_incremental_backup(
+    args: argparse.Namespace,
+    backup_dir: Path,
+    backup_name: str,
+    files: List[Path],
+    metadata: Dict[str, Any],
+) -> bool:
+    """Create a deduplicated snapshot in the backup directory's blob store"""
+    logger = get_logger()
+
+    snapshot_file = backup_dir / f"{backup_name}{SNAPSHOT_SUFFIX}"
+    logger.info(f"Creating incremental backup: {snapshot_file}")
+
+    start_time = time.time()
+    stats = BackupStore(backup_dir).create_snapshot(
+        args.install_dir, files, snapshot_file, metadata
+    )
+    duration = time.time() - start_time
+
+    with open(snapshot_file, "rb") as f:
+        manifest_sha256 = file_sha256(f)
+    record_in_catalog(
+        backup_dir,
+        snapshot_file,
+        stats["files"],
+        metadata,
+        manifest_sha256,
+        logical_size=stats["bytes_total"],
+    )
+
+    logger.success(f"Backup created successfully in {duration:.1f} seconds")
+    logger.info(f"Snapshot: {snapshot_file}")
+    logger.info(
+        f"Files: {stats['files']} ({stats['reused']} unchanged, {stats['new_blobs']} new blobs)"
+    )
+    logger.info(
+        f"Data: {format_size(stats['bytes_total'])} total, {format_size(stats['bytes_written'])} written"
+    )
+    return True
+
+
 def create_backup(args: argparse.Namespace) -> bool:
     """Create a new backup"""
     logger = get_logger()
@@ -274,9 +942,7 @@ def create_backup(args: argparse.Namespace) -> bool:
             logger.error(f"No SuperClaude installation found in {args.install_dir}")
             return False
 
-        # Setup backup directory
         backup_dir = get_backup_directory(args)
-        backup_dir.mkdir(parents=True, exist_ok=True)
 
         # Generate backup filename
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -288,62 +954,73 @@ def create_backup(args: argparse.Namespace) -> bool:
         # Determine compression
         if args.compress == "gzip":
             backup_file = backup_dir / f"{backup_name}.tar.gz"
-            mode = "w:gz"
         elif args.compress == "bzip2":
             backup_file = backup_dir / f"{backup_name}.tar.bz2"
-            mode = "w:bz2"
         else:
             backup_file = backup_dir / f"{backup_name}.tar"
-            mode = "w"
 
-        logger.info(f"Creating backup: {backup_file}")
+        files, oversized = select_backup_files(args, skip=backup_file)
 
-        # Create metadata
-        metadata = create_backup_metadata(args.install_dir)
+        excluded = describe_excludes(args)
+        if getattr(args, "dry_run", False):
+            display_backup_estimate(args.install_dir, files, oversized, excluded)
+            return True
 
-        # Create backup
-        start_time = time.time()
+        for path, size in oversized:
+            logger.warning(
+                f"Skipping {path.relative_to(args.install_dir)} ({format_size(size)}): "
+                f"over the --max-file-size limit"
+            )
 
-        with tarfile.open(backup_file, mode) as tar:
-            # Add metadata file
-            import tempfile
+        backup_dir.mkdir(parents=True, exist_ok=True)
 
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".json", delete=False
-            ) as temp_file:
-                json.dump(metadata, temp_file, indent=2)
-                temp_file.flush()
-                tar.add(temp_file.name, arcname="backup_metadata.json")
-                Path(temp_file.name).unlink()  # Clean up temp file
+        # Create metadata
+        metadata = create_backup_metadata(
+            args.install_dir,
+            [path.relative_to(args.install_dir).as_posix() for path in files],
+        )
+        metadata["profile"] = getattr(args, "profile", None) or "full"
+        if getattr(args, "exclude", None):
+            metadata["exclude"] = list(args.exclude)
 
-            # Add installation directory contents (excluding backups and local dirs)
-            files_added = 0
-            for item in args.install_dir.rglob("*"):
-                if item.is_file() and item != backup_file:
-                    try:
-                        # Create relative path for archive
-                        rel_path = item.relative_to(args.install_dir)
+        if getattr(args, "incremental", False):
+            return create_incremental_backup(
+                args, backup_dir, backup_name, files, metadata
+            )
+
+        threads = getattr(args, "compress_threads", 1)
+        logger.info(f"Creating backup: {backup_file}")
 
-                        # Skip files in excluded directories
-                        if rel_path.parts and rel_path.parts[0] in ["backups", "local"]:
-                            continue
+        # Checksums are only known once files are read, so they trail the data
+        metadata["checksums"] = {"algorithm": "sha256", "member": BACKUP_CHECKSUMS_NAME}
 
-                        tar.add(item, arcname=str(rel_path))
-                        files_added += 1
+        # Create backup
+        start_time = time.time()
 
-                        if files_added % 10 == 0:
-                            logger.debug(f"Added {files_added} files to backup")
+        try:
+            files_added, bytes_read, archive_sha256 = write_backup_archive(
+                backup_file, args.install_dir, metadata, args.compress, threads, files
+            )
+        except BaseException:
+            backup_file.unlink(missing_ok=True)  # Never leave a truncated archive
+            raise
 
-                    except Exception as e:
-                        logger.warning(f"Could not add {item} to backup: {e}")
+        record_in_catalog(backup_dir, backup_file, files_added, metadata, archive_sha256)
 
         duration = time.time() - start_time
         file_size = backup_file.stat().st_size
+        throughput = bytes_read / (1024 * 1024) / max(duration, 1e-6)
 
         logger.success(f"Backup created successfully in {duration:.1f} seconds")
         logger.info(f"Backup file: {backup_file}")
         logger.info(f"Files archived: {files_added}")
+        if excluded:
+            logger.info(f"Excluded: {', '.join(excluded)}")
         logger.info(f"Backup size: {format_size(file_size)}")
+        logger.info(
+            f"Throughput: {throughput:.1f} MB/s ({format_size(bytes_read)} read, "
+            f"{args.compress}, {threads} thread{'s' if threads != 1 else ''})"
+        )
 
         return True
 
@@ -361,66 +1038,405 @@ def restore_backup(backup_path: Path, args: argparse.Namespace) -> bool:
             logger.error(f"Backup file not found: {backup_path}")
             return False
 
-        # Check backup file
-        info = get_backup_info(backup_path)
-        if "error" in info:
-            logger.error(f"Invalid backup file: {info['error']}")
-            return False
-
         logger.info(f"Restoring from backup: {backup_path}")
 
-        # Determine compression
-        if backup_path.suffix == ".gz":
-            mode = "r:gz"
-        elif backup_path.suffix == ".bz2":
-            mode = "r:bz2"
-        else:
-            mode = "r"
+        if backup_path.name.endswith(SNAPSHOT_SUFFIX):
+            return restore_incremental_backup(backup_path, args)
 
         # Create backup of current installation if it exists
         if check_installation_exists(args.install_dir) and not args.dry_run:
             logger.info("Creating backup of current installation before restore")
             # This would call create_backup internally
 
-        # Extract backup
-        start_time = time.time()
-        files_restored = 0
+        return restore_tar_backup(backup_path, args)
 
-        with tarfile.open(backup_path, mode) as tar:
-            # Extract all files except metadata
-            for member in tar.getmembers():
-                if member.name == "backup_metadata.json":
-                    continue
+    except (tarfile.TarError, EOFError) as e:
+        logger.error(f"Invalid backup file: {e}")
+        return False
+    except ValueError as e:
+        logger.error(str(e))
+        return False
+    except Exception as e:
+        logger.exception(f"Failed to restore backup: {e}")
+        return False
 
-                try:
-                    target_path = args.install_dir / member.name
 
-                    # Check if file exists and overwrite flag
-                    if target_path.exists() and not args.overwrite:
-                        logger.warning(f"Skipping existing file: {target_path}")
-                        continue
+def path_matches(rel_path: str, pattern: str) -> bool:
+    """Match an archived path against a --path prefix or glob"""
+    pattern = pattern.strip("/")
+    return (
+        rel_path == pattern
+        or rel_path.startswith(pattern + "/")
+        or fnmatch.fnmatch(rel_path, pattern)
+    )
+
+
+def build_restore_selector(
+    metadata: Dict[str, Any], components: List[str], patterns: List[str]
+) -> Optional[Callable[[str], bool]]:
+    """
+    Build a predicate selecting archived paths for a partial restore
+
+    Args:
+        metadata: Backup metadata (component_files maps components to paths)
+        components: Components to restore
+        patterns: Path prefixes or glob patterns to restore
 
-                    # Extract file
-                    tar.extract(member, args.install_dir)
-                    files_restored += 1
+    Returns:
+        Predicate on archived paths, or None to restore everything
 
-                    if files_restored % 10 == 0:
-                        logger.debug(f"Restored {files_restored} files")
+    Raises:
+        ValueError: If a requested component is not in the backup
+    """
+    if not components and not patterns:
+        return None
+
+    selected = set()
+    if components:
+        component_files = metadata.get("component_files")
+        if component_files is None:
+            raise ValueError(
+                "Backup has no component manifest; select files with --path instead"
+            )
+
+        unknown = [name for name in components if name not in component_files]
+        if unknown:
+            raise ValueError(
+                f"Components not in backup: {', '.join(unknown)} "
+                f"(available: {', '.join(sorted(component_files)) or 'none'})"
+            )
+        for name in components:
+            selected.update(component_files[name])
+
+    def select(rel_path: str) -> bool:
+        return rel_path in selected or any(
+            path_matches(rel_path, pattern) for pattern in patterns
+        )
 
+    return select
+
+
+def write_restored_file(
+    target: Path, source, expected_sha256: Optional[str], mode: int, mtime: float
+) -> None:
+    """
+    Write a restored file atomically, verifying its checksum first
+
+    Raises:
+        ValueError: If the content does not match expected_sha256
+    """
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=str(target.parent), suffix=".restore")
+    hasher = hashlib.sha256()
+
+    try:
+        with os.fdopen(fd, "wb") as out:
+            for chunk in iter(lambda: source.read(CHUNK_SIZE), b""):
+                hasher.update(chunk)
+                out.write(chunk)
+
+        if expected_sha256 and hasher.hexdigest() != expected_sha256:
+            raise ValueError("checksum mismatch (corrupted backup)")
+
+        os.chmod(temp_path, mode & 0o7777)
+        os.utime(temp_path, (mtime, mtime))
+        os.replace(temp_path, target)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def restore_tar_backup(backup_path: Path, args: argparse.Namespace) -> bool:
+    """
+    Stream a tar backup into the installation directory
+
+    Members are read once in archive order. Small files are handed to a
+    bounded pool of writer threads; large files are written inline. Every
+    member with a recorded checksum is verified before it replaces anything.
+    If the archive becomes unreadable part way through, queued writes are
+    cancelled and the files already replaced are reported.
+    """
+    logger = get_logger()
+
+    root = args.install_dir.resolve()
+    jobs = max(1, getattr(args, "restore_jobs", 4))
+    components = getattr(args, "component", None) or []
+    patterns = getattr(args, "path", None) or []
+
+    start_time = time.time()
+    restored: List[str] = []
+    skipped = 0
+    errors: List[str] = []
+    read_error = None
+    select = None
+    selector_ready = False
+    in_flight: Dict[Any, str] = {}
+
+    def collect(futures) -> None:
+        for future in futures:
+            rel_path = in_flight.pop(future)
+            if future.cancelled():
+                continue
+            try:
+                future.result()
+                restored.append(rel_path)
+                if len(restored) % 10 == 0:
+                    logger.debug(f"Restored {len(restored)} files")
+            except Exception as e:
+                errors.append(f"{rel_path}: {e}")
+
+    def restore_members(tar: tarfile.TarFile, pool: ThreadPoolExecutor) -> None:
+        nonlocal select, selector_ready, skipped
+        for member in tar:
+            if member.name == BACKUP_METADATA_NAME:
+                metadata = json.loads(tar.extractfile(member).read().decode())
+                select = build_restore_selector(metadata, components, patterns)
+                selector_ready = True
+                continue
+
+            if member.name == BACKUP_CHECKSUMS_NAME:
+                continue  # Only used by --verify
+
+            if not selector_ready:
+                # Archive without leading metadata: only --path can select
+                select = build_restore_selector({}, components, patterns)
+                selector_ready = True
+
+            if not member.isfile():
+                continue  # Backups only contain regular files
+
+            rel_path = member.name
+            if select and not select(rel_path):
+                continue
+
+            target = (root / rel_path).resolve()
+            if root not in target.parents:
+                errors.append(f"{rel_path}: path escapes installation directory")
+                continue
+
+            if target.exists() and not args.overwrite:
+                logger.warning(f"Skipping existing file: {target}")
+                skipped += 1
+                continue
+
+            expected = member.pax_headers.get(CHECKSUM_PAX_KEY)
+            source = tar.extractfile(member)
+
+            if member.size > INLINE_READ_LIMIT:
+                # Stream large files straight from the archive
+                try:
+                    write_restored_file(
+                        target, source, expected, member.mode, member.mtime
+                    )
+                    restored.append(rel_path)
                 except Exception as e:
-                    logger.warning(f"Could not restore {member.name}: {e}")
+                    errors.append(f"{rel_path}: {e}")
+                continue
 
-        duration = time.time() - start_time
+            # Bound buffered file data to a few files per writer thread
+            if len(in_flight) >= 2 * jobs:
+                done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+                collect(done)
+
+            data = io.BytesIO(source.read())
+            future = pool.submit(
+                write_restored_file, target, data, expected, member.mode, member.mtime
+            )
+            in_flight[future] = rel_path
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        try:
+            with open_tar_stream(backup_path) as tar:
+                restore_members(tar, pool)
+        except ARCHIVE_READ_ERRORS as e:
+            # The rest of the archive can't be trusted; write nothing more
+            read_error = e
+            for future in in_flight:
+                future.cancel()
+        collect(list(in_flight))
+
+    duration = time.time() - start_time
+
+    if not selector_ready and read_error is None:
+        # Still report unknown components for an empty archive
+        build_restore_selector({}, components, patterns)
+
+    for error in errors:
+        logger.warning(f"Could not restore {error}")
+
+    if read_error is not None:
+        logger.error(f"Backup archive unreadable, restore aborted: {read_error}")
+        if restored:
+            logger.warning(f"{len(restored)} files were already replaced:")
+            for rel_path in sorted(restored):
+                logger.warning(f"  {rel_path}")
+        return False
 
-        logger.success(f"Restore completed successfully in {duration:.1f} seconds")
-        logger.info(f"Files restored: {files_restored}")
+    if errors:
+        logger.error(f"Restore finished with {len(errors)} errors")
+        return False
 
-        return True
+    logger.success(f"Restore completed successfully in {duration:.1f} seconds")
+    logger.info(f"Files restored: {len(restored)}")
+    if skipped:
+        logger.info(f"Existing files skipped: {skipped} (use --overwrite to replace)")
 
-    except Exception as e:
-        logger.exception(f"Failed to restore backup: {e}")
+    return True
+
+
+def restore_incremental_backup(snapshot_file: Path, args: argparse.Namespace) -> bool:
+    """Reassemble a snapshot from the blob store"""
+    logger = get_logger()
+
+    store = BackupStore(snapshot_file.parent)
+    select = build_restore_selector(
+        store.load_snapshot(snapshot_file).get("metadata", {}),
+        getattr(args, "component", None) or [],
+        getattr(args, "path", None) or [],
+    )
+
+    start_time = time.time()
+    restored, skipped, errors = store.restore_snapshot(
+        snapshot_file,
+        args.install_dir,
+        overwrite=args.overwrite,
+        select=select,
+        jobs=max(1, getattr(args, "restore_jobs", 4)),
+    )
+    duration = time.time() - start_time
+
+    for error in errors:
+        logger.warning(f"Could not restore {error}")
+    if skipped:
+        logger.warning(f"Skipped {skipped} existing files (use --overwrite to replace)")
+
+    if errors:
+        logger.error(f"Restore finished with {len(errors)} errors")
         return False
 
+    logger.success(f"Restore completed successfully in {duration:.1f} seconds")
+    logger.info(f"Files restored: {restored}")
+    return True
+
+
+def verify_tar_backup(backup_path: Path) -> Tuple[int, List[str]]:
+    """
+    Check a tar backup in one streaming pass without extracting it
+
+    Every member is hashed and compared with its PAX header checksum; the
+    trailing checksum list, when present, also catches missing or unexpected
+    members. Decompression errors surface as problems too.
+
+    Args:
+        backup_path: Archive to verify
+
+    Returns:
+        Tuple of (files checked, problems found)
+    """
+    problems = []
+    digests: Dict[str, str] = {}
+    pax_checked = set()
+    recorded = None
+
+    try:
+        with open_tar_stream(backup_path) as tar:
+            for member in tar:
+                if member.name == BACKUP_CHECKSUMS_NAME:
+                    recorded = json.loads(tar.extractfile(member).read().decode())
+                    continue
+                if member.name == BACKUP_METADATA_NAME or not member.isfile():
+                    continue
+
+                digest = file_sha256(tar.extractfile(member))
+                digests[member.name] = digest
+                expected = member.pax_headers.get(CHECKSUM_PAX_KEY)
+                if expected:
+                    pax_checked.add(member.name)
+                    if expected != digest:
+                        problems.append(f"{member.name}: checksum mismatch")
+    except ARCHIVE_READ_ERRORS + (ValueError,) as e:
+        problems.append(f"archive unreadable after {len(digests)} files: {e}")
+        return len(digests), problems
+
+    if recorded is None:
+        unchecked = sum(1 for name in digests if name not in pax_checked)
+        if unchecked:
+            get_logger().warning(
+                f"{backup_path.name}: {unchecked} files have no recorded checksum; "
+                f"only archive readability was checked for them"
+            )
+        return len(digests), problems
+
+    expected_files = recorded.get("files", {})
+    for name in sorted(set(expected_files) - set(digests)):
+        problems.append(f"{name}: missing from archive")
+    for name in sorted(set(digests) - set(expected_files)):
+        problems.append(f"{name}: not in checksum list")
+    for name in sorted(set(digests) & set(expected_files)):
+        if digests[name] != expected_files[name] and (
+            f"{name}: checksum mismatch" not in problems
+        ):
+            problems.append(f"{name}: checksum mismatch")
+
+    return len(digests), problems
+
+
+def verify_backup(backup_path: Path, jobs: int = 1) -> Tuple[int, List[str]]:
+    """Verify a tar backup or incremental snapshot; see verify_tar_backup"""
+    if backup_path.name.endswith(SNAPSHOT_SUFFIX):
+        try:
+            return BackupStore(backup_path.parent).verify_snapshot(backup_path, jobs)
+        except (OSError, ValueError) as e:
+            return 0, [f"snapshot unreadable: {e}"]
+    return verify_tar_backup(backup_path)
+
+
+def verify_backups(backup_paths: List[Path], jobs: int = 4) -> bool:
+    """
+    Verify several backups concurrently
+
+    hashlib and zlib release the GIL on large buffers, so archives are
+    checked in parallel on multiple cores.
+
+    Args:
+        backup_paths: Backups to verify
+        jobs: Number of backups verified at once
+
+    Returns:
+        True if every backup verified cleanly
+    """
+    logger = get_logger()
+
+    if not backup_paths:
+        logger.info("No backups found to verify")
+        return True
+
+    missing = [path for path in backup_paths if not path.is_file()]
+    for path in missing:
+        logger.error(f"Backup file not found: {path}")
+
+    present = [path for path in backup_paths if path.is_file()]
+    start_time = time.time()
+    all_ok = not missing
+
+    with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(present) or 1))) as pool:
+        results = pool.map(verify_backup, present)
+        for path, (files_checked, problems) in zip(present, results):
+            if problems:
+                all_ok = False
+                logger.error(f"{path.name}: {len(problems)} problems")
+                for problem in problems:
+                    logger.warning(f"  {problem}")
+            else:
+                logger.success(f"{path.name}: {files_checked} files OK")
+
+    duration = time.time() - start_time
+    logger.info(f"Verified {len(present)} backups in {duration:.1f} seconds")
+    return all_ok
+
 
 def interactive_restore_selection(backups: List[Dict[str, Any]]) -> Optional[Path]:
     """Interactive backup selection for restore"""
@@ -451,6 +1467,17 @@ def interactive_restore_selection(backups: List[Dict[str, Any]]) -> Optional[Pat
     return backups[choice]["path"]
 
 
+def collect_unreferenced_blobs(backup_dir: Path) -> None:
+    """Garbage-collect snapshot blobs no remaining snapshot references"""
+    logger = get_logger()
+
+    removed, freed = BackupStore(backup_dir).gc()
+    if removed:
+        logger.info(
+            f"Removed {removed} unreferenced snapshot blobs ({format_size(freed)})"
+        )
+
+
 def cleanup_old_backups(backup_dir: Path, args: argparse.Namespace) -> bool:
     """Clean up old backup files"""
     logger = get_logger()
@@ -481,17 +1508,26 @@ def cleanup_old_backups(backup_dir: Path, args: argparse.Namespace) -> bool:
 
         if not to_remove:
             logger.info("No backups need to be cleaned up")
+            collect_unreferenced_blobs(backup_dir)
             return True
 
         logger.info(f"Cleaning up {len(to_remove)} old backups")
 
+        removed = []
         for backup in to_remove:
             try:
                 backup["path"].unlink()
+                removed.append(backup["path"].name)
                 logger.info(f"Removed backup: {backup['path'].name}")
             except Exception as e:
                 logger.warning(f"Could not remove {backup['path'].name}: {e}")
 
+        try:
+            BackupCatalog(backup_dir).remove(removed)
+        except OSError as e:
+            logger.warning(f"Could not update backup catalog: {e}")
+
+        collect_unreferenced_blobs(backup_dir)
         return True
 
     except Exception as e:
@@ -588,6 +1624,19 @@ def run(args: argparse.Namespace) -> int:
         elif args.cleanup:
             success = cleanup_old_backups(backup_dir, args)
 
+        elif getattr(args, "verify", None) is not None:
+            if args.verify:
+                backup_paths = [
+                    path if path.is_absolute() else backup_dir / path
+                    for path in map(Path, args.verify)
+                ]
+            else:
+                backup_paths = sorted(find_backup_files(backup_dir))
+            success = verify_backups(backup_paths, getattr(args, "verify_jobs", 4))
+
+        elif getattr(args, "rebuild_catalog", False):
+            success = rebuild_catalog(backup_dir)
+
         else:
             logger.error("No backup operation specified")
             success = False
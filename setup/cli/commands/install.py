@@ -22,13 +22,14 @@ from ...utils.ui import (
     display_warning,
     Menu,
     confirm,
-    ProgressBar,
     Colors,
     format_size,
     prompt_api_key,
 )
 from ...utils.environment import setup_environment_variables
 from ...utils.logger import get_logger
+from ...utils.progress import create_progress_renderer
+from ...utils.trace import traced
 from ... import DEFAULT_INSTALL_DIR, PROJECT_ROOT, DATA_DIR
 from . import OperationBase
 
@@ -80,12 +81,25 @@ Examples:
         help="Run system diagnostics and show installation help",
     )
 
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore cached tool probe results and re-check installed tools",
+    )
+
     parser.add_argument(
         "--legacy",
         action="store_true",
         help="Use legacy mode: install individual official MCP servers instead of unified gateway",
     )
 
+    parser.add_argument(
+        "--mcp-jobs",
+        type=int,
+        default=4,
+        help="Maximum number of MCP servers to install concurrently (default: 4)",
+    )
+
     return parser
 
 
@@ -498,6 +512,7 @@ def run_system_diagnostics(validator: Validator) -> None:
         print("  3. Run 'superclaude install --diagnose' again to verify")
 
 
+@traced(category="operation")
 def perform_installation(
     components: List[str],
     args: argparse.Namespace,
@@ -530,11 +545,6 @@ def perform_installation(
         # The 'components' list is already resolved, so we can use it directly.
         ordered_components = components
 
-        # Setup progress tracking
-        progress = ProgressBar(
-            total=len(ordered_components), prefix="Installing: ", suffix=""
-        )
-
         # Install components
         logger.info(f"Installing {len(ordered_components)} components...")
 
@@ -543,22 +553,18 @@ def perform_installation(
             "backup": not args.no_backup,
             "dry_run": args.dry_run,
             "legacy_mode": getattr(args, "legacy", False),
+            "mcp_jobs": getattr(args, "mcp_jobs", 4),
             "selected_mcp_servers": getattr(
                 config_manager, "_installation_context", {}
             ).get("selected_mcp_servers", []),
         }
 
-        success = installer.install_components(ordered_components, config)
-
-        # Update progress
-        for i, component_name in enumerate(ordered_components):
-            if component_name in installer.installed_components:
-                progress.update(i + 1, f"Installed {component_name}")
-            else:
-                progress.update(i + 1, f"Failed {component_name}")
-            time.sleep(0.1)  # Brief pause for visual effect
-
-        progress.finish("Installation complete")
+        # Progress is reported as each component and file completes
+        with create_progress_renderer(
+            "Installing", len(ordered_components)
+        ) as progress:
+            installer.progress = progress
+            success = installer.install_components(ordered_components, config)
 
         # Show results
         duration = time.time() - start_time
@@ -671,7 +677,7 @@ def run(args: argparse.Namespace) -> int:
 
         # Handle diagnostic mode
         if args.diagnose:
-            validator = Validator()
+            validator = Validator(refresh=getattr(args, "refresh", False))
             run_system_diagnostics(validator)
             return 0
 
@@ -682,7 +688,7 @@ def run(args: argparse.Namespace) -> int:
         registry.discover_components()
 
         config_manager = ConfigService(DATA_DIR)
-        validator = Validator()
+        validator = Validator(refresh=getattr(args, "refresh", False))
 
         # Validate configuration
         config_errors = config_manager.validate_config_files()
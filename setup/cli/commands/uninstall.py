@@ -21,7 +21,6 @@ from ...utils.ui import (
     display_warning,
     Menu,
     confirm,
-    ProgressBar,
     Colors,
 )
 from ...utils.environment import (
@@ -29,115 +28,17 @@ from ...utils.environment import (
     cleanup_environment_variables,
 )
 from ...utils.logger import get_logger
+from ...utils.progress import (
+    COMPONENT_FINISHED,
+    COMPONENT_STARTED,
+    ProgressEvent,
+    create_progress_renderer,
+)
+from ...utils.trace import traced
 from ... import DEFAULT_INSTALL_DIR, PROJECT_ROOT
 from . import OperationBase
 
 
-def verify_superclaude_file(file_path: Path, component: str) -> bool:
-    """
-    Verify this is a SuperClaude file before removal
-
-    Args:
-        file_path: Path to the file to verify
-        component: Component name this file belongs to
-
-    Returns:
-        True if safe to remove, False if uncertain (preserve by default)
-    """
-    try:
-        # Known SuperClaude file patterns by component
-        superclaude_patterns = {
-            "core": [
-                "CLAUDE.md",
-                "FLAGS.md",
-                "PRINCIPLES.md",
-                "RULES.md",
-                "ORCHESTRATOR.md",
-                "SESSION_LIFECYCLE.md",
-            ],
-            "commands": [
-                # Commands are only in sc/ subdirectory
-            ],
-            "agents": [
-                "backend-engineer.md",
-                "brainstorm-PRD.md",
-                "code-educator.md",
-                "code-refactorer.md",
-                "devops-engineer.md",
-                "frontend-specialist.md",
-                "performance-optimizer.md",
-                "python-ultimate-expert.md",
-                "qa-specialist.md",
-                "root-cause-analyzer.md",
-                "security-auditor.md",
-                "system-architect.md",
-                "technical-writer.md",
-            ],
-            "modes": [
-                "MODE_Brainstorming.md",
-                "MODE_Introspection.md",
-                "MODE_Task_Management.md",
-                "MODE_Token_Efficiency.md",
-            ],
-        }
-
-        # For commands component, verify it's in the sc/ subdirectory
-        if component == "commands":
-            return "commands/sc/" in str(file_path)
-
-        # For other components, check against known file lists
-        if component in superclaude_patterns:
-            filename = file_path.name
-            return filename in superclaude_patterns[component]
-
-        # For MCP component, it doesn't remove files but modifies .claude.json
-        if component == "mcp":
-            return True  # MCP component has its own safety logic
-
-        # Default to preserve if uncertain
-        return False
-
-    except Exception:
-        # If any error occurs in verification, preserve the file
-        return False
-
-
-def verify_directory_safety(directory: Path, component: str) -> bool:
-    """
-    Verify it's safe to remove a directory
-
-    Args:
-        directory: Directory path to verify
-        component: Component name
-
-    Returns:
-        True if safe to remove (only if empty or only contains SuperClaude files)
-    """
-    try:
-        if not directory.exists():
-            return True
-
-        # Check if directory is empty
-        contents = list(directory.iterdir())
-        if not contents:
-            return True
-
-        # Check if all contents are SuperClaude files for this component
-        for item in contents:
-            if item.is_file():
-                if not verify_superclaude_file(item, component):
-                    return False
-            elif item.is_dir():
-                # Don't remove directories that contain non-SuperClaude subdirectories
-                return False
-
-        return True
-
-    except Exception:
-        # If any error occurs, preserve the directory
-        return False
-
-
 class UninstallOperation(OperationBase):
     """Uninstall operation implementation"""
 
@@ -567,9 +468,17 @@ def display_component_details(component: str, info: Dict[str, Any]) -> Dict[str,
     if component in component_paths:
         details["description"] = component_paths[component]["description"]
 
-        # Get actual file count from metadata if available
+        # Get actual file count from the install manifest or metadata
         component_metadata = info["components"].get(component, {})
-        if isinstance(component_metadata, dict):
+        try:
+            manifest = SettingsService(install_dir).get_file_manifest(component)
+        except ValueError:
+            manifest = {}
+
+        if manifest:
+            details["files"] = sorted(manifest)
+            details["file_count"] = len(manifest)
+        elif isinstance(component_metadata, dict):
             if "files_count" in component_metadata:
                 details["file_count"] = component_metadata["files_count"]
             elif "agents_count" in component_metadata:
@@ -710,6 +619,7 @@ def create_uninstall_backup(install_dir: Path, components: List[str]) -> Optiona
         return None
 
 
+@traced(category="operation")
 def perform_uninstall(
     components: List[str],
     args: argparse.Namespace,
@@ -730,40 +640,36 @@ def perform_uninstall(
             components, args.install_dir
         )
 
-        # Setup progress tracking
-        progress = ProgressBar(
-            total=len(components), prefix="Uninstalling: ", suffix=""
-        )
-
         # Uninstall components
         logger.info(f"Uninstalling {len(components)} components...")
 
         uninstalled_components = []
         failed_components = []
 
-        for i, component_name in enumerate(components):
-            progress.update(i, f"Uninstalling {component_name}")
-
-            try:
-                if component_name in component_instances:
-                    instance = component_instances[component_name]
-                    if instance.uninstall():
-                        uninstalled_components.append(component_name)
-                        logger.debug(f"Successfully uninstalled {component_name}")
+        with create_progress_renderer("Uninstalling", len(components)) as progress:
+            for component_name in components:
+                progress(ProgressEvent(COMPONENT_STARTED, component_name))
+                ok = False
+
+                try:
+                    if component_name in component_instances:
+                        instance = component_instances[component_name]
+                        instance.progress_callback = progress
+                        if instance.uninstall():
+                            ok = True
+                            uninstalled_components.append(component_name)
+                            logger.debug(f"Successfully uninstalled {component_name}")
+                        else:
+                            failed_components.append(component_name)
+                            logger.error(f"Failed to uninstall {component_name}")
                     else:
-                        failed_components.append(component_name)
-                        logger.error(f"Failed to uninstall {component_name}")
-                else:
-                    logger.warning(f"Component {component_name} not found, skipping")
-
-            except Exception as e:
-                logger.error(f"Error uninstalling {component_name}: {e}")
-                failed_components.append(component_name)
+                        logger.warning(f"Component {component_name} not found, skipping")
 
-            progress.update(i + 1, f"Processed {component_name}")
-            time.sleep(0.1)  # Brief pause for visual effect
+                except Exception as e:
+                    logger.error(f"Error uninstalling {component_name}: {e}")
+                    failed_components.append(component_name)
 
-        progress.finish("Uninstall complete")
+                progress(ProgressEvent(COMPONENT_FINISHED, component_name, ok=ok))
 
         # Handle complete uninstall cleanup
         if args.complete:
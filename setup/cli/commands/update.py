@@ -22,15 +22,17 @@ from ...utils.ui import (
     display_warning,
     Menu,
     confirm,
-    ProgressBar,
     Colors,
     format_size,
     prompt_api_key,
 )
 from ...utils.environment import setup_environment_variables
 from ...utils.logger import get_logger
+from ...utils.progress import create_progress_renderer
+from ...utils.trace import traced
 from ... import DEFAULT_INSTALL_DIR, PROJECT_ROOT, DATA_DIR
 from . import OperationBase
+from .install import validate_system_requirements
 
 
 class UpdateOperation(OperationBase):
@@ -84,6 +86,19 @@ Examples:
         help="Reinstall components even if versions match",
     )
 
+    parser.add_argument(
+        "--mcp-jobs",
+        type=int,
+        default=4,
+        help="Maximum number of MCP servers to update concurrently (default: 4)",
+    )
+
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore cached tool probe results and re-check installed tools",
+    )
+
     return parser
 
 
@@ -298,6 +313,7 @@ def display_update_plan(
     print()
 
 
+@traced(category="operation")
 def perform_update(
     components: List[str], args: argparse.Namespace, registry: ComponentRegistry
 ) -> bool:
@@ -345,9 +361,6 @@ def perform_update(
         # Register components with installer
         installer.register_components(list(component_instances.values()))
 
-        # Setup progress tracking
-        progress = ProgressBar(total=len(components), prefix="Updating: ", suffix="")
-
         # Update components
         logger.info(f"Updating {len(components)} components...")
 
@@ -359,6 +372,7 @@ def perform_update(
             "backup": backup,
             "dry_run": args.dry_run,
             "update_mode": True,
+            "mcp_jobs": getattr(args, "mcp_jobs", 4),
             "selected_mcp_servers": (
                 list(mcp_instance.mcp_servers.keys())
                 if "mcp" in component_instances
@@ -366,17 +380,10 @@ def perform_update(
             ),
         }
 
-        success = installer.update_components(components, config)
-
-        # Update progress
-        for i, component_name in enumerate(components):
-            if component_name in installer.updated_components:
-                progress.update(i + 1, f"Updated {component_name}")
-            else:
-                progress.update(i + 1, f"Failed {component_name}")
-            time.sleep(0.1)  # Brief pause for visual effect
-
-        progress.finish("Update complete")
+        # Progress is reported as each component and file completes
+        with create_progress_renderer("Updating", len(components)) as progress:
+            installer.progress = progress
+            success = installer.update_components(components, config)
 
         # Show results
         duration = time.time() - start_time
@@ -476,6 +483,17 @@ def run(args: argparse.Namespace) -> int:
             logger.info("No components selected for update")
             return 0
 
+        # Validate system requirements for the components being updated
+        validator = Validator(refresh=getattr(args, "refresh", False))
+        if not validate_system_requirements(validator, components):
+            if not args.force:
+                logger.error("System requirements not met. Use --force to override.")
+                return 1
+            else:
+                logger.warning(
+                    "System requirements not met, but continuing due to --force flag"
+                )
+
         # Display update plan
         if not args.quiet:
             display_update_plan(
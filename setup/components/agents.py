@@ -94,25 +94,11 @@ class AgentsComponent(Component):
         try:
             self.logger.info("Uninstalling SuperClaude agents component...")
 
-            # Remove agent files
-            removed_count = 0
-            for filename in self.component_files:
-                file_path = self.install_component_subdir / filename
-                if self.file_manager.remove_file(file_path):
-                    removed_count += 1
-                    self.logger.debug(f"Removed agent: {filename}")
-                else:
-                    self.logger.warning(f"Could not remove agent: {filename}")
-
-            # Remove agents directory if empty
-            try:
-                if self.install_component_subdir.exists() and not any(
-                    self.install_component_subdir.iterdir()
-                ):
-                    self.install_component_subdir.rmdir()
-                    self.logger.debug("Removed empty agents directory")
-            except Exception as e:
-                self.logger.warning(f"Could not remove agents directory: {e}")
+            # Remove agent files (and the agents directory once empty)
+            removed_count, _ = self.remove_installed_files(
+                self.install_component_subdir / filename
+                for filename in self.component_files
+            )
 
             # Update metadata to remove agents component
             try:
@@ -102,57 +102,17 @@ class CommandsComponent(Component):
         try:
             self.logger.info("Uninstalling SuperClaude commands component...")
 
-            # Remove command files from sc subdirectory
+            # Remove command files, including any left in the old root
+            # commands directory; sc/ and commands/ are pruned once empty
             commands_dir = self.install_dir / "commands" / "sc"
-            removed_count = 0
-
-            for filename in self.component_files:
-                file_path = commands_dir / filename
-                if self.file_manager.remove_file(file_path):
-                    removed_count += 1
-                    self.logger.debug(f"Removed {filename}")
-                else:
-                    self.logger.warning(f"Could not remove {filename}")
-
-            # Also check and remove any old commands in root commands directory
             old_commands_dir = self.install_dir / "commands"
-            old_removed_count = 0
-
-            for filename in self.component_files:
-                old_file_path = old_commands_dir / filename
-                if old_file_path.exists() and old_file_path.is_file():
-                    if self.file_manager.remove_file(old_file_path):
-                        old_removed_count += 1
-                        self.logger.debug(f"Removed old {filename}")
-                    else:
-                        self.logger.warning(f"Could not remove old {filename}")
-
-            if old_removed_count > 0:
-                self.logger.info(
-                    f"Also removed {old_removed_count} commands from old location"
-                )
-
-            removed_count += old_removed_count
-
-            # Remove sc subdirectory if empty
-            try:
-                if commands_dir.exists():
-                    remaining_files = list(commands_dir.iterdir())
-                    if not remaining_files:
-                        commands_dir.rmdir()
-                        self.logger.debug("Removed empty sc commands directory")
-
-                        # Also remove parent commands directory if empty
-                        parent_commands_dir = self.install_dir / "commands"
-                        if parent_commands_dir.exists():
-                            remaining_files = list(parent_commands_dir.iterdir())
-                            if not remaining_files:
-                                parent_commands_dir.rmdir()
-                                self.logger.debug(
-                                    "Removed empty parent commands directory"
-                                )
-            except Exception as e:
-                self.logger.warning(f"Could not remove commands directory: {e}")
+            fallback_paths = [commands_dir / filename for filename in self.component_files]
+            fallback_paths += [
+                old_commands_dir / filename
+                for filename in self.component_files
+                if (old_commands_dir / filename).is_file()
+            ]
+            removed_count, _ = self.remove_installed_files(fallback_paths)
 
             # Update metadata to remove commands component
             try:
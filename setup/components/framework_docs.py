@@ -114,14 +114,9 @@ class FrameworkDocsComponent(Component):
             self.logger.info("Uninstalling SuperClaude framework docs component...")
 
             # Remove framework files
-            removed_count = 0
-            for filename in self.component_files:
-                file_path = self.install_dir / filename
-                if self.file_manager.remove_file(file_path):
-                    removed_count += 1
-                    self.logger.debug(f"Removed {filename}")
-                else:
-                    self.logger.warning(f"Could not remove {filename}")
+            removed_count, _ = self.remove_installed_files(
+                self.install_dir / filename for filename in self.component_files
+            )
 
             # Update metadata to remove framework docs component
             try:
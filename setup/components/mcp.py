@@ -2,30 +2,118 @@
 MCP component for MCP server integration
 """
 
+import json
 import os
 import platform
 import shlex
+import shutil
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from setup import __version__
 
 AIRIS_MCP_GITHUB_REPO = "https://github.com/agiletec-inc/airis-mcp-gateway"
+AIRIS_MCP_BRANCH = "master"
+# Shallow clone/fetch: only the branch tip is needed to run the installer
 AIRIS_MCP_CLONE_COMMAND = [
     "git",
     "clone",
-    AIRIS_MCP_GITHUB_REPO,
-    str(Path.home() / ".airis-mcp-gateway"),
+    "--depth",
+    "1",
+    "--single-branch",
+    "--branch",
+    AIRIS_MCP_BRANCH,
 ]
-AIRIS_MCP_UPDATE_COMMAND = ["git", "pull", "origin", "master"]
+AIRIS_MCP_UPDATE_COMMAND = ["git", "fetch", "--depth", "1", "origin", AIRIS_MCP_BRANCH]
+AIRIS_MCP_CHECKOUT_COMMAND = ["git", "checkout", "-q", "-B", AIRIS_MCP_BRANCH, "FETCH_HEAD"]
+AIRIS_MCP_HEAD_COMMAND = ["git", "rev-parse", "HEAD"]
+AIRIS_MCP_COMMIT_SETTING = "mcp.airis_gateway_commit"
 AIRIS_MCP_INSTALL_COMMAND = ["make", "install-claude"]
 AIRIS_MCP_GATEWAY_DIR = Path.home() / ".airis-mcp-gateway"
 AIRIS_MCP_CONFIG_PATH = Path.home() / ".claude" / "mcp.json"
 AIRIS_MCP_EXPECTED_CONFIG_TARGET = "mcp.json"
+MCP_INSTALL_JOBS = 4  # Default number of MCP servers installed concurrently
 
 from ..core.base import Component
+from ..services.mcp_config import MCPConfigService
+from ..utils.json_stream import read_json_keys
+from ..utils.trace import span
+
+
+class MCPServerSnapshot:
+    """Parsed point-in-time view of the servers reported by `claude mcp list`"""
+
+    def __init__(
+        self,
+        servers: Optional[Dict[str, str]] = None,
+        raw_output: str = "",
+        error: Optional[str] = None,
+    ):
+        """
+        Initialize snapshot
+
+        Args:
+            servers: Mapping of lower-cased server name to its status line
+            raw_output: Unparsed command output
+            error: Error message if the server list could not be fetched
+        """
+        self.servers = servers or {}
+        self.raw_output = raw_output
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """Whether the server list was fetched successfully"""
+        return self.error is None
+
+    @classmethod
+    def parse(cls, output: str) -> "MCPServerSnapshot":
+        """
+        Parse `claude mcp list` output into a snapshot
+
+        Lines look like `name: command - status`; banner lines such as
+        "Checking MCP server health..." or "No MCP servers configured" are ignored.
+        """
+        servers = {}
+        for line in output.strip().split("\n"):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            lowered = line.lower()
+            if lowered.startswith("no ") or lowered.startswith("checking "):
+                continue
+
+            if ":" in line:
+                name = line.split(":", 1)[0].strip()
+            else:
+                name = line.split()[0]
+
+            if name:
+                servers[name.lower()] = line
+
+        return cls(servers=servers, raw_output=output)
+
+    @classmethod
+    def from_config(cls, servers: Dict[str, Dict[str, Any]]) -> "MCPServerSnapshot":
+        """Build a snapshot from `mcpServers` config entries"""
+        lines = {}
+        for name, entry in servers.items():
+            command = " ".join(
+                [str(entry.get("command", entry.get("url", "")))]
+                + [str(arg) for arg in entry.get("args", [])]
+            )
+            lines[name.lower()] = f"{name}: {command}".rstrip()
+
+        return cls(servers=lines, raw_output="\n".join(lines.values()))
+
+    def has(self, server_name: str) -> bool:
+        """Check whether a server is registered"""
+        return server_name.lower() in self.servers
 
 
 class MCPComponent(Component):
@@ -36,6 +124,31 @@ class MCPComponent(Component):
         super().__init__(install_dir)
         self.installed_servers_in_session: List[str] = []
 
+        # Cached `claude mcp list` result, invalidated after add/remove
+        self._mcp_snapshot: Optional[MCPServerSnapshot] = None
+        self._mcp_snapshot_lock = threading.Lock()
+
+        # Registration rewrites ~/.claude.json (directly or via `claude mcp
+        # add/remove`, which read-modify-write it without locking), so only one
+        # runs at a time; prefetches and checks still run concurrently
+        self._registration_lock = threading.Lock()
+
+        # Resolved argv prefixes for direct exec, keyed on command name
+        self._command_cache: Dict[str, Optional[List[str]]] = {}
+        self._command_cache_lock = threading.Lock()
+
+        # Read/write ~/.claude.json directly; SUPERCLAUDE_MCP_BACKEND=cli forces
+        # every operation through the Claude CLI
+        self.mcp_config = MCPConfigService()
+        self.use_native_mcp_config = (
+            os.environ.get("SUPERCLAUDE_MCP_BACKEND", "native").lower() != "cli"
+        )
+
+        # AIRIS MCP Gateway source checkout
+        self.airis_repo_url = AIRIS_MCP_GITHUB_REPO
+        self.airis_gateway_dir = AIRIS_MCP_GATEWAY_DIR
+        self.airis_config_path = AIRIS_MCP_CONFIG_PATH
+
         # Define MCP servers to install
         # Default: airis-mcp-gateway (unified gateway with all tools)
         # Legacy mode (--legacy flag): individual official servers
@@ -105,20 +218,75 @@ class MCPComponent(Component):
 
         Returns:
             CompletedProcess result
+
+        Raises:
+            FileNotFoundError: If the command is neither on PATH nor aliased
         """
+        with span("subprocess", "subprocess", argv=" ".join(map(str, cmd))) as args:
+            result = self._run_command(cmd, **kwargs)
+            args["returncode"] = result.returncode
+            return result
+
+    def _run_command(self, cmd: List[str], **kwargs) -> subprocess.CompletedProcess:
+        """Run a command for _run_command_cross_platform"""
         if platform.system() == "Windows":
             # On Windows, wrap command in 'cmd /c' to properly handle commands like npx
             cmd = ["cmd", "/c"] + cmd
             return subprocess.run(cmd, **kwargs)
-        else:
-            # macOS/Linux: Use string format with proper shell to support aliases
-            cmd_str = " ".join(shlex.quote(str(arg)) for arg in cmd)
 
-            # Use the user's shell to execute the command, supporting aliases
-            user_shell = os.environ.get("SHELL", "/bin/bash")
-            return subprocess.run(
-                cmd_str, shell=True, env=os.environ, executable=user_shell, **kwargs
+        # macOS/Linux: exec the resolved binary directly instead of paying for a
+        # login shell (and its plugins) on every claude/npx/git/make call
+        argv = [str(arg) for arg in cmd]
+        resolved = self._resolve_command(argv[0])
+        if resolved is None:
+            # Shell aliases and functions are not consulted; map them explicitly
+            raise FileNotFoundError(
+                f"Command not found: {argv[0]} (not on PATH; add it to "
+                f"SUPERCLAUDE_COMMAND_ALIASES if it is a shell alias)"
             )
+        return subprocess.run(resolved + argv[1:], env=os.environ, **kwargs)
+
+    def _resolve_command(self, name: str) -> Optional[List[str]]:
+        """
+        Resolve a command name to an argv prefix, caching the lookup
+
+        Entries in SUPERCLAUDE_COMMAND_ALIASES (a JSON object mapping a command
+        name to a replacement command line) take precedence over PATH.
+
+        Args:
+            name: Command name, e.g. "claude"
+
+        Returns:
+            Argv prefix to exec, or None if the command cannot be resolved
+        """
+        with self._command_cache_lock:
+            if name not in self._command_cache:
+                alias = self._load_command_aliases().get(name)
+                if alias:
+                    self._command_cache[name] = [
+                        os.path.expanduser(part) for part in shlex.split(alias)
+                    ]
+                else:
+                    path = shutil.which(name)
+                    self._command_cache[name] = [path] if path else None
+            return self._command_cache[name]
+
+    def _load_command_aliases(self) -> Dict[str, str]:
+        """Load the command alias map from SUPERCLAUDE_COMMAND_ALIASES"""
+        raw = os.environ.get("SUPERCLAUDE_COMMAND_ALIASES", "")
+        if not raw:
+            return {}
+
+        try:
+            aliases = json.loads(raw)
+        except ValueError:
+            self.logger.warning("Ignoring invalid SUPERCLAUDE_COMMAND_ALIASES (not JSON)")
+            return {}
+
+        if not isinstance(aliases, dict):
+            self.logger.warning("Ignoring SUPERCLAUDE_COMMAND_ALIASES (expected an object)")
+            return {}
+        return {str(k): str(v) for k, v in aliases.items()}
 
     def validate_prerequisites(
         self, installSubPath: Optional[Path] = None
@@ -295,44 +463,23 @@ class MCPComponent(Component):
                     self.logger.info(
                         f"Registering {server_name} with Claude CLI for project: {current_dir}"
                     )
-                    reg_cmd = [
-                        "claude",
-                        "mcp",
-                        "add",
-                        "-s",
-                        "user",
-                        "--",
-                        server_name,
-                    ] + shlex.split(serena_run_cmd)
+                    server_command = shlex.split(serena_run_cmd)
                 else:
                     self.logger.info(
                         f"Registering {server_name} with Claude CLI. Run command: {run_command}"
                     )
-                    reg_cmd = [
-                        "claude",
-                        "mcp",
-                        "add",
-                        "-s",
-                        "user",
-                        "--",
-                        server_name,
-                    ] + shlex.split(run_command)
-
-                reg_result = self._run_command_cross_platform(
-                    reg_cmd, capture_output=True, text=True, timeout=120
+                    server_command = shlex.split(run_command)
+
+                registered, error_msg = self._add_mcp_server(
+                    server_name, server_command
                 )
 
-                if reg_result.returncode == 0:
+                if registered:
                     self.logger.success(
                         f"Successfully registered {server_name} with Claude CLI."
                     )
                     return True
                 else:
-                    error_msg = (
-                        reg_result.stderr.strip()
-                        if reg_result.stderr
-                        else "Unknown error"
-                    )
                     self.logger.error(
                         f"Failed to register MCP server {server_name} with Claude CLI: {error_msg}"
                     )
@@ -423,31 +570,16 @@ class MCPComponent(Component):
                 self.logger.info(
                     f"Registering {server_name} with Claude CLI. Run command: {run_command}"
                 )
-                reg_cmd = [
-                    "claude",
-                    "mcp",
-                    "add",
-                    "-s",
-                    "user",
-                    "--",
-                    server_name,
-                ] + shlex.split(run_command)
-
-                reg_result = self._run_command_cross_platform(
-                    reg_cmd, capture_output=True, text=True, timeout=120
+                registered, error_msg = self._add_mcp_server(
+                    server_name, shlex.split(run_command)
                 )
 
-                if reg_result.returncode == 0:
+                if registered:
                     self.logger.success(
                         f"Successfully registered {server_name} with Claude CLI."
                     )
                     return True
                 else:
-                    error_msg = (
-                        reg_result.stderr.strip()
-                        if reg_result.stderr
-                        else "Unknown error"
-                    )
                     self.logger.error(
                         f"Failed to register MCP server {server_name} with Claude CLI: {error_msg}"
                     )
@@ -470,25 +602,147 @@ class MCPComponent(Component):
             )
             return False
 
-    def _check_mcp_server_installed(self, server_name: str) -> bool:
-        """Check if MCP server is already installed"""
+    def _get_mcp_snapshot(self, refresh: bool = False) -> MCPServerSnapshot:
+        """
+        Get the cached MCP server snapshot, fetching it on first use
+
+        Args:
+            refresh: Discard the cached snapshot and fetch a new one
+
+        Returns:
+            MCPServerSnapshot (check `ok` before trusting an empty server set)
+        """
+        with self._mcp_snapshot_lock:
+            if self._mcp_snapshot is None or refresh:
+                self._mcp_snapshot = self._fetch_mcp_snapshot()
+            return self._mcp_snapshot
+
+    def _fetch_mcp_snapshot(self) -> MCPServerSnapshot:
+        """
+        Build a snapshot from the Claude config file, or from a single
+        `claude mcp list` call when the config format is not recognized
+        """
+        if self.use_native_mcp_config:
+            servers = self.mcp_config.read_servers()
+            if servers is not None:
+                return MCPServerSnapshot.from_config(servers)
+
         try:
             result = self._run_command_cross_platform(
                 ["claude", "mcp", "list"], capture_output=True, text=True, timeout=60
             )
+        except (subprocess.TimeoutExpired, subprocess.SubprocessError, OSError) as e:
+            return MCPServerSnapshot(error=str(e))
 
-            if result.returncode != 0:
-                self.logger.warning(f"Could not list MCP servers: {result.stderr}")
-                return False
+        if result.returncode != 0:
+            return MCPServerSnapshot(
+                raw_output=result.stdout or "",
+                error=(result.stderr or "").strip() or "Unknown error",
+            )
+
+        return MCPServerSnapshot.parse(result.stdout or "")
+
+    def _invalidate_mcp_snapshot(self) -> None:
+        """Drop the cached snapshot after an add/remove mutation"""
+        with self._mcp_snapshot_lock:
+            self._mcp_snapshot = None
 
-            # Parse output to check if server is installed
-            output = result.stdout.lower()
-            return server_name.lower() in output
+    def _check_mcp_server_installed(self, server_name: str) -> bool:
+        """Check if MCP server is already installed"""
+        snapshot = self._get_mcp_snapshot()
 
-        except (subprocess.TimeoutExpired, subprocess.SubprocessError) as e:
-            self.logger.warning(f"Error checking MCP server status: {e}")
+        if not snapshot.ok:
+            self.logger.warning(f"Could not list MCP servers: {snapshot.error}")
             return False
 
+        return snapshot.has(server_name)
+
+    def _add_mcp_server(
+        self, server_name: str, server_command: List[str], timeout: int = 120
+    ) -> Tuple[bool, str]:
+        """
+        Register a user-scope stdio MCP server
+
+        Writes the entry straight into the Claude config file when its format
+        is recognized, otherwise falls back to `claude mcp add`.
+
+        Args:
+            server_name: Server name
+            server_command: Executable and arguments that launch the server
+            timeout: Timeout for the CLI fallback in seconds
+
+        Returns:
+            Tuple of (success: bool, error_message: str)
+        """
+        with self._registration_lock:
+            try:
+                if self.use_native_mcp_config and self.mcp_config.add_server(
+                    server_name, server_command[0], server_command[1:]
+                ):
+                    self.logger.debug(
+                        f"Registered {server_name} in {self.mcp_config.config_file}"
+                    )
+                    return True, ""
+
+                self.logger.debug(
+                    f"Running: claude mcp add -s user -- {server_name} {' '.join(server_command)}"
+                )
+                result = self._run_command_cross_platform(
+                    ["claude", "mcp", "add", "-s", "user", "--", server_name]
+                    + server_command,
+                    capture_output=True,
+                    text=True,
+                    timeout=timeout,
+                )
+            finally:
+                self._invalidate_mcp_snapshot()
+
+        if result.returncode == 0:
+            return True, ""
+        return False, result.stderr.strip() if result.stderr else "Unknown error"
+
+    def _remove_mcp_server(
+        self, server_name: str, timeout: int = 60
+    ) -> Tuple[bool, str]:
+        """
+        Remove an MCP server registration
+
+        User-scope entries are removed from the Claude config file directly;
+        anything else falls back to `claude mcp remove` (auto-detect scope).
+
+        Args:
+            server_name: Server name
+            timeout: Timeout for the CLI fallback in seconds
+
+        Returns:
+            Tuple of (success: bool, error_message: str)
+        """
+        with self._registration_lock:
+            try:
+                if self.use_native_mcp_config and self.mcp_config.remove_server(
+                    server_name
+                ):
+                    self.logger.debug(
+                        f"Removed {server_name} from {self.mcp_config.config_file}"
+                    )
+                    return True, ""
+
+                self.logger.debug(
+                    f"Running: claude mcp remove {server_name} (auto-detect scope)"
+                )
+                result = self._run_command_cross_platform(
+                    ["claude", "mcp", "remove", server_name],
+                    capture_output=True,
+                    text=True,
+                    timeout=timeout,
+                )
+            finally:
+                self._invalidate_mcp_snapshot()
+
+        if result.returncode == 0:
+            return True, ""
+        return False, result.stderr.strip() if result.stderr else "Unknown error"
+
     def _detect_existing_mcp_servers_from_config(self) -> List[str]:
         """Detect existing MCP servers from Claude Desktop config"""
         detected_servers = []
@@ -521,10 +775,9 @@ class MCPComponent(Component):
                 self.logger.debug("No Claude Desktop config file found")
                 return detected_servers
 
-            import json
-
-            with open(config_file, "r") as f:
-                config = json.load(f)
+            # ~/.claude.json can hold megabytes of per-project history, so
+            # only the mcpServers section is decoded
+            config = read_json_keys(config_file, ["mcpServers"])
 
             # Extract MCP server names from mcpServers section
             mcp_servers = config.get("mcpServers", {})
@@ -549,24 +802,16 @@ class MCPComponent(Component):
         detected_servers = []
 
         try:
-            result = self._run_command_cross_platform(
-                ["claude", "mcp", "list"], capture_output=True, text=True, timeout=60
-            )
+            snapshot = self._get_mcp_snapshot()
 
-            if result.returncode != 0:
-                self.logger.debug(f"Could not list MCP servers: {result.stderr}")
+            if not snapshot.ok:
+                self.logger.debug(f"Could not list MCP servers: {snapshot.error}")
                 return detected_servers
 
-            # Parse the output to extract server names
-            output_lines = result.stdout.strip().split("\n")
-            for line in output_lines:
-                line = line.strip().lower()
-                if line and not line.startswith("#") and not line.startswith("no"):
-                    # Extract server name (usually the first word or before first space/colon)
-                    server_name = line.split()[0] if line.split() else ""
-                    normalized_name = self._normalize_server_name(server_name)
-                    if normalized_name and normalized_name in self.mcp_servers:
-                        detected_servers.append(normalized_name)
+            for server_name in snapshot.servers:
+                normalized_name = self._normalize_server_name(server_name)
+                if normalized_name and normalized_name in self.mcp_servers:
+                    detected_servers.append(normalized_name)
 
             if detected_servers:
                 self.logger.info(
@@ -687,15 +932,11 @@ class MCPComponent(Component):
                     return True
 
                 self.logger.debug(
-                    f"Running: claude mcp add -s user {server_name} {' '.join(install_args)}"
+                    f"Registering: {server_name} {' '.join(install_args)}"
                 )
 
-                result = self._run_command_cross_platform(
-                    ["claude", "mcp", "add", "-s", "user", "--", server_name]
-                    + install_args,
-                    capture_output=True,
-                    text=True,
-                    timeout=120,  # 2 minutes timeout for installation
+                registered, error_msg = self._add_mcp_server(
+                    server_name, install_args
                 )
             else:
                 # Use npm_package
@@ -706,34 +947,19 @@ class MCPComponent(Component):
                     return True
 
                 self.logger.debug(
-                    f"Running: claude mcp add -s user {server_name} {command} -y {npm_package}"
+                    f"Registering: {server_name} {command} -y {npm_package}"
                 )
 
-                result = self._run_command_cross_platform(
-                    [
-                        "claude",
-                        "mcp",
-                        "add",
-                        "-s",
-                        "user",
-                        "--",
-                        server_name,
-                        command,
-                        "-y",
-                        npm_package,
-                    ],
-                    capture_output=True,
-                    text=True,
-                    timeout=120,  # 2 minutes timeout for installation
+                registered, error_msg = self._add_mcp_server(
+                    server_name, [command, "-y", npm_package]
                 )
 
-            if result.returncode == 0:
+            if registered:
                 self.logger.success(
                     f"Successfully installed MCP server (user scope): {server_name}"
                 )
                 return True
             else:
-                error_msg = result.stderr.strip() if result.stderr else "Unknown error"
                 self.logger.error(
                     f"Failed to install MCP server {server_name}: {error_msg}"
                 )
@@ -746,6 +972,82 @@ class MCPComponent(Component):
             self.logger.error(f"Error installing MCP server {server_name}: {e}")
             return False
 
+    def _run_server_jobs(
+        self,
+        server_names: List[str],
+        job: Callable[[str], bool],
+        max_jobs: int = MCP_INSTALL_JOBS,
+        stop_on_required_failure: bool = True,
+    ) -> Tuple[Dict[str, Tuple[bool, float]], Optional[str]]:
+        """
+        Run a per-server job with bounded concurrency
+
+        Args:
+            server_names: Servers to process
+            job: Callable taking a server name and returning success
+            max_jobs: Maximum number of servers processed at once
+            stop_on_required_failure: Skip servers that have not started yet
+                once a required server fails
+
+        Returns:
+            Tuple of (server name -> (success, seconds) in input order for
+            servers that ran, name of the required server that failed or None)
+        """
+        if not server_names:
+            return {}, None
+
+        def timed(server_name: str) -> Tuple[bool, float]:
+            start = time.monotonic()
+            try:
+                success = job(server_name)
+            except Exception as e:
+                self.logger.error(f"Error processing MCP server {server_name}: {e}")
+                success = False
+            return success, time.monotonic() - start
+
+        completed: Dict[str, Tuple[bool, float]] = {}
+        aborted_by = None
+        queue = list(server_names)
+        workers = max(1, min(max_jobs, len(queue)))
+
+        # Submit only as slots free up so nothing new starts after an abort
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            running = {}
+            while queue or running:
+                while queue and len(running) < workers and aborted_by is None:
+                    server_name = queue.pop(0)
+                    running[executor.submit(timed, server_name)] = server_name
+
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    server_name = running.pop(future)
+                    completed[server_name] = future.result()
+                    success, elapsed = completed[server_name]
+                    self.logger.info(
+                        f"MCP server {server_name}: {'ok' if success else 'failed'} ({elapsed:.1f}s)"
+                    )
+
+                    required = self.mcp_servers.get(server_name, {}).get(
+                        "required", False
+                    )
+                    if (
+                        not success
+                        and required
+                        and stop_on_required_failure
+                        and aborted_by is None
+                    ):
+                        aborted_by = server_name
+
+        skipped = [name for name in server_names if name not in completed]
+        if skipped:
+            self.logger.warning(f"Skipped MCP servers: {', '.join(skipped)}")
+
+        results = {name: completed[name] for name in server_names if name in completed}
+        return results, aborted_by
+
     def _install_airis_gateway(
         self, server_info: Dict[str, Any], config: Dict[str, Any]
     ) -> bool:
@@ -763,84 +1065,35 @@ class MCPComponent(Component):
             return True
 
         self.logger.info(
-            f"Installing {server_name} from {AIRIS_MCP_GITHUB_REPO} into {AIRIS_MCP_GATEWAY_DIR}"
+            f"Installing {server_name} from {self.airis_repo_url} into {self.airis_gateway_dir}"
         )
 
-        # Step 1: Clone repository if necessary
-        if not AIRIS_MCP_GATEWAY_DIR.exists():
-            self.logger.info("Cloning AIRIS MCP Gateway repository...")
-            try:
-                clone_result = self._run_command_cross_platform(
-                    AIRIS_MCP_CLONE_COMMAND,
-                    capture_output=True,
-                    text=True,
-                    timeout=600,
-                )
-            except subprocess.TimeoutExpired:
-                self.logger.error(
-                    f"Timeout while cloning {AIRIS_MCP_GITHUB_REPO}"
-                )
-                return False
-            except Exception as exc:
-                self.logger.error(
-                    f"Error cloning AIRIS MCP Gateway repository: {exc}"
-                )
-                return False
-
-            if clone_result.returncode != 0:
-                stderr = (
-                    clone_result.stderr.strip()
-                    if clone_result.stderr
-                    else "Unknown error"
-                )
-                self.logger.error(
-                    f"Failed to clone AIRIS MCP Gateway repository: {stderr}"
-                )
-                if clone_result.stdout:
-                    self.logger.debug(clone_result.stdout)
-                return False
-        else:
-            self.logger.info("Updating existing AIRIS MCP Gateway checkout...")
-            try:
-                update_result = self._run_command_cross_platform(
-                    AIRIS_MCP_UPDATE_COMMAND,
-                    capture_output=True,
-                    text=True,
-                    timeout=180,
-                    cwd=str(AIRIS_MCP_GATEWAY_DIR),
-                )
-            except subprocess.TimeoutExpired:
-                self.logger.warning(
-                    "Timeout while updating AIRIS MCP Gateway repository (continuing with current version)"
-                )
-                update_result = None
-            except Exception as exc:
-                self.logger.warning(
-                    f"Error updating AIRIS MCP Gateway repository: {exc}"
-                )
-                update_result = None
+        # Step 1: Clone or fast-update the checkout
+        head = self._sync_airis_checkout()
+        if head is None:
+            return False
 
-            if update_result and update_result.returncode != 0:
-                stderr = (
-                    update_result.stderr.strip()
-                    if update_result.stderr
-                    else "Unknown error"
-                )
-                self.logger.warning(
-                    f"Failed to update AIRIS MCP Gateway repository: {stderr}"
-                )
-                if update_result.stdout:
-                    self.logger.debug(update_result.stdout)
+        # Skip the installer when this commit is already provisioned
+        installed_commit = self.settings_manager.get_metadata_setting(
+            AIRIS_MCP_COMMIT_SETTING
+        )
+        if head == installed_commit and self._airis_config_linked():
+            self.logger.info(
+                f"AIRIS MCP Gateway unchanged at {head[:12]}; skipping make install-claude"
+            )
+            return self._verify_airis_gateway(server_name)
 
         # Step 2: Run make install-claude to provision MCP configuration
         try:
-            install_result = self._run_command_cross_platform(
-                AIRIS_MCP_INSTALL_COMMAND,
-                capture_output=True,
-                text=True,
-                timeout=900,
-                cwd=str(AIRIS_MCP_GATEWAY_DIR),
-            )
+            # It registers the gateway, so it must not race other registrations
+            with self._registration_lock:
+                install_result = self._run_command_cross_platform(
+                    AIRIS_MCP_INSTALL_COMMAND,
+                    capture_output=True,
+                    text=True,
+                    timeout=900,
+                    cwd=str(self.airis_gateway_dir),
+                )
         except subprocess.TimeoutExpired:
             self.logger.error(
                 f"Timeout while running make install-claude for {server_name}"
@@ -852,6 +1105,9 @@ class MCPComponent(Component):
             )
             return False
 
+        # make install-claude registers the gateway with Claude
+        self._invalidate_mcp_snapshot()
+
         if install_result.returncode != 0:
             stderr = (
                 install_result.stderr.strip()
@@ -868,37 +1124,138 @@ class MCPComponent(Component):
         if install_result.stdout:
             self.logger.debug(install_result.stdout)
 
+        if head:
+            self.settings_manager.update_metadata(
+                {"mcp": {"airis_gateway_commit": head}}
+            )
+
+        return self._verify_airis_gateway(server_name)
+
+    def _verify_airis_gateway(self, server_name: str) -> bool:
+        """Confirm the gateway is registered with Claude after provisioning"""
         # Re-check using Claude CLI to confirm registration
         if self._check_mcp_server_installed(server_name):
             self.logger.success(f"Successfully installed MCP server: {server_name}")
             return True
 
         # Fallback: inspect ~/.claude/mcp.json symlink to ensure installation completed
-        try:
-            if AIRIS_MCP_CONFIG_PATH.is_symlink():
-                target_path = AIRIS_MCP_CONFIG_PATH.resolve()
-                if (
-                    target_path.name == AIRIS_MCP_EXPECTED_CONFIG_TARGET
-                    and AIRIS_MCP_GATEWAY_DIR in target_path.parents
-                ):
-                    self.logger.success(
-                        f"Linked Claude configuration to AIRIS MCP Gateway ({target_path})"
+        if self._airis_config_linked():
+            self.logger.success(
+                f"Linked Claude configuration to AIRIS MCP Gateway ({self.airis_config_path.resolve()})"
+            )
+            self.logger.info("Please restart Claude Code to refresh MCP server list.")
+            return True
+
+        self.logger.error(
+            "AIRIS MCP Gateway installer finished, but the server was not detected. "
+            "Verify Docker containers are running with `airis-gateway status`."
+        )
+        return False
+
+    def _sync_airis_checkout(self) -> Optional[str]:
+        """
+        Shallow-clone or fetch the AIRIS MCP Gateway checkout
+
+        Returns:
+            Commit checked out afterwards ("" if it cannot be determined), or
+            None if the repository could not be cloned
+        """
+        checkout_dir = str(self.airis_gateway_dir)
+
+        if not self.airis_gateway_dir.exists():
+            self.logger.info("Cloning AIRIS MCP Gateway repository...")
+            try:
+                clone_result = self._run_command_cross_platform(
+                    AIRIS_MCP_CLONE_COMMAND + [self.airis_repo_url, checkout_dir],
+                    capture_output=True,
+                    text=True,
+                    timeout=600,
+                )
+            except subprocess.TimeoutExpired:
+                self.logger.error(f"Timeout while cloning {self.airis_repo_url}")
+                return None
+            except Exception as exc:
+                self.logger.error(
+                    f"Error cloning AIRIS MCP Gateway repository: {exc}"
+                )
+                return None
+
+            if clone_result.returncode != 0:
+                stderr = (
+                    clone_result.stderr.strip()
+                    if clone_result.stderr
+                    else "Unknown error"
+                )
+                self.logger.error(
+                    f"Failed to clone AIRIS MCP Gateway repository: {stderr}"
+                )
+                if clone_result.stdout:
+                    self.logger.debug(clone_result.stdout)
+                return None
+        else:
+            self.logger.info("Updating existing AIRIS MCP Gateway checkout...")
+            for command in (AIRIS_MCP_UPDATE_COMMAND, AIRIS_MCP_CHECKOUT_COMMAND):
+                try:
+                    update_result = self._run_command_cross_platform(
+                        command,
+                        capture_output=True,
+                        text=True,
+                        timeout=180,
+                        cwd=checkout_dir,
                     )
-                    self.logger.info(
-                        "Please restart Claude Code to refresh MCP server list."
+                except subprocess.TimeoutExpired:
+                    self.logger.warning(
+                        "Timeout while updating AIRIS MCP Gateway repository (continuing with current version)"
                     )
-                    return True
-            elif AIRIS_MCP_CONFIG_PATH.exists():
+                    break
+                except Exception as exc:
+                    self.logger.warning(
+                        f"Error updating AIRIS MCP Gateway repository: {exc}"
+                    )
+                    break
+
+                if update_result.returncode != 0:
+                    stderr = (
+                        update_result.stderr.strip()
+                        if update_result.stderr
+                        else "Unknown error"
+                    )
+                    self.logger.warning(
+                        f"Failed to update AIRIS MCP Gateway repository: {stderr}"
+                    )
+                    if update_result.stdout:
+                        self.logger.debug(update_result.stdout)
+                    break
+
+        try:
+            head_result = self._run_command_cross_platform(
+                AIRIS_MCP_HEAD_COMMAND,
+                capture_output=True,
+                text=True,
+                timeout=30,
+                cwd=checkout_dir,
+            )
+        except (subprocess.SubprocessError, OSError):
+            return ""
+
+        return head_result.stdout.strip() if head_result.returncode == 0 else ""
+
+    def _airis_config_linked(self) -> bool:
+        """Check that ~/.claude/mcp.json links into the gateway checkout"""
+        try:
+            if self.airis_config_path.is_symlink():
+                target_path = self.airis_config_path.resolve()
+                return (
+                    target_path.name == AIRIS_MCP_EXPECTED_CONFIG_TARGET
+                    and self.airis_gateway_dir.resolve() in target_path.parents
+                )
+            if self.airis_config_path.exists():
                 self.logger.warning(
                     "Claude MCP configuration exists but is not linked to AIRIS Gateway."
                 )
         except OSError as exc:
             self.logger.warning(f"Could not inspect Claude MCP configuration: {exc}")
 
-        self.logger.error(
-            "AIRIS MCP Gateway installer finished, but the server was not detected. "
-            "Verify Docker containers are running with `airis-gateway status`."
-        )
         return False
 
     def _uninstall_mcp_server(self, server_name: str) -> bool:
@@ -911,24 +1268,14 @@ class MCPComponent(Component):
                 self.logger.info(f"MCP server {server_name} not installed")
                 return True
 
-            self.logger.debug(
-                f"Running: claude mcp remove {server_name} (auto-detect scope)"
-            )
-
-            result = self._run_command_cross_platform(
-                ["claude", "mcp", "remove", server_name],
-                capture_output=True,
-                text=True,
-                timeout=60,
-            )
+            removed, error_msg = self._remove_mcp_server(server_name)
 
-            if result.returncode == 0:
+            if removed:
                 self.logger.success(
                     f"Successfully uninstalled MCP server: {server_name}"
                 )
                 return True
             else:
-                error_msg = result.stderr.strip() if result.stderr else "Unknown error"
                 self.logger.error(
                     f"Failed to uninstall MCP server {server_name}: {error_msg}"
                 )
@@ -986,40 +1333,41 @@ class MCPComponent(Component):
 
         self.logger.info(f"Managing MCP servers: {', '.join(all_servers)}")
 
-        # Install/verify each server
-        installed_count = 0
+        # Verify each server, then install the missing ones concurrently
         failed_servers = []
         verified_servers = []
+        pending_servers = []
 
         for server_name in all_servers:
-            if server_name in self.mcp_servers:
-                server_info = self.mcp_servers[server_name]
-
-                # Check if already installed and working
-                if self._check_mcp_server_installed(server_name):
-                    self.logger.info(
-                        f"MCP server {server_name} already installed and working"
-                    )
-                    installed_count += 1
-                    verified_servers.append(server_name)
-                else:
-                    # Try to install
-                    if self._install_mcp_server(server_info, config):
-                        installed_count += 1
-                        verified_servers.append(server_name)
-                    else:
-                        failed_servers.append(server_name)
-
-                        # Check if this is a required server
-                        if server_info.get("required", False):
-                            self.logger.error(
-                                f"Required MCP server {server_name} failed to install"
-                            )
-                            return False
-            else:
+            if server_name not in self.mcp_servers:
                 self.logger.warning(
                     f"Unknown MCP server '{server_name}' cannot be managed by SuperClaude"
                 )
+            elif self._check_mcp_server_installed(server_name):
+                self.logger.info(
+                    f"MCP server {server_name} already installed and working"
+                )
+                verified_servers.append(server_name)
+            else:
+                pending_servers.append(server_name)
+
+        results, aborted_by = self._run_server_jobs(
+            pending_servers,
+            lambda name: self._install_mcp_server(self.mcp_servers[name], config),
+            config.get("mcp_jobs", MCP_INSTALL_JOBS),
+        )
+
+        for server_name, (success, _) in results.items():
+            if success:
+                verified_servers.append(server_name)
+            else:
+                failed_servers.append(server_name)
+
+        if aborted_by:
+            self.logger.error(f"Required MCP server {aborted_by} failed to install")
+            return False
+
+        installed_count = len(verified_servers)
 
         # Update the list of successfully managed servers
         self.installed_servers_in_session = verified_servers
@@ -1027,24 +1375,14 @@ class MCPComponent(Component):
         # Verify installation
         if not config.get("dry_run", False):
             self.logger.info("Verifying MCP server installation...")
-            try:
-                result = self._run_command_cross_platform(
-                    ["claude", "mcp", "list"],
-                    capture_output=True,
-                    text=True,
-                    timeout=60,
-                )
-
-                if result.returncode == 0:
-                    self.logger.debug("MCP servers list:")
-                    for line in result.stdout.strip().split("\n"):
-                        if line.strip():
-                            self.logger.debug(f"  {line.strip()}")
-                else:
-                    self.logger.warning("Could not verify MCP server installation")
+            snapshot = self._get_mcp_snapshot()
 
-            except Exception as e:
-                self.logger.warning(f"Could not verify MCP installation: {e}")
+            if snapshot.ok:
+                self.logger.debug("MCP servers list:")
+                for line in snapshot.servers.values():
+                    self.logger.debug(f"  {line}")
+            else:
+                self.logger.warning("Could not verify MCP server installation")
 
         if failed_servers:
             self.logger.warning(f"Some MCP servers failed to install: {failed_servers}")
@@ -1138,24 +1476,23 @@ class MCPComponent(Component):
             )
 
             # For MCP servers, update means reinstall to get latest versions
-            updated_count = 0
-            failed_servers = []
-
-            for server_name, server_info in self.mcp_servers.items():
-                try:
-                    # Uninstall old version
-                    if self._check_mcp_server_installed(server_name):
-                        self._uninstall_mcp_server(server_name)
-
-                    # Install new version
-                    if self._install_mcp_server(server_info, config):
-                        updated_count += 1
-                    else:
-                        failed_servers.append(server_name)
+            def reinstall(server_name: str) -> bool:
+                # Uninstall old version, then install new version
+                if self._check_mcp_server_installed(server_name):
+                    self._uninstall_mcp_server(server_name)
+                return self._install_mcp_server(self.mcp_servers[server_name], config)
+
+            results, _ = self._run_server_jobs(
+                list(self.mcp_servers.keys()),
+                reinstall,
+                config.get("mcp_jobs", MCP_INSTALL_JOBS),
+                stop_on_required_failure=False,
+            )
 
-                except Exception as e:
-                    self.logger.error(f"Error updating MCP server {server_name}: {e}")
-                    failed_servers.append(server_name)
+            updated_count = sum(1 for success, _ in results.values() if success)
+            failed_servers = [
+                name for name, (success, _) in results.items() if not success
+            ]
 
             # Update metadata
             try:
@@ -1206,24 +1543,20 @@ class MCPComponent(Component):
 
         # Check if Claude CLI is available and validate installed servers
         try:
-            result = self._run_command_cross_platform(
-                ["claude", "mcp", "list"], capture_output=True, text=True, timeout=60
-            )
+            snapshot = self._get_mcp_snapshot()
 
-            if result.returncode != 0:
+            if not snapshot.ok:
                 errors.append(
                     "Could not communicate with Claude CLI for MCP server verification"
                 )
             else:
-                claude_mcp_output = result.stdout.lower()
-
                 # Get the list of servers that should be installed from metadata
                 installed_servers = self.settings_manager.get_metadata_setting(
                     "mcp.servers", []
                 )
 
                 for server_name in installed_servers:
-                    if server_name.lower() not in claude_mcp_output:
+                    if not snapshot.has(server_name):
                         errors.append(
                             f"Installed MCP server '{server_name}' not found in 'claude mcp list' output."
                         )
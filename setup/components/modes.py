@@ -59,6 +59,7 @@ class ModesComponent(Component):
             if self.file_manager.copy_file(source, target):
                 success_count += 1
                 self.logger.debug(f"Successfully copied {source.name}")
+                self.emit_file_done(source)
             else:
                 self.logger.error(f"Failed to copy {source.name}")
 
@@ -72,6 +73,7 @@ class ModesComponent(Component):
             f"Modes component installed successfully ({success_count} mode files)"
         )
 
+        self.record_file_manifest(target for _, target in files_to_install)
         return self._post_install()
 
     def _post_install(self) -> bool:
@@ -112,22 +114,10 @@ class ModesComponent(Component):
         try:
             self.logger.info("Uninstalling SuperClaude modes component...")
 
-            # Remove mode files
-            removed_count = 0
-            for _, target in self.get_files_to_install():
-                if self.file_manager.remove_file(target):
-                    removed_count += 1
-                    self.logger.debug(f"Removed {target.name}")
-
-            # Remove modes directory if empty
-            try:
-                if self.install_component_subdir.exists():
-                    remaining_files = list(self.install_component_subdir.iterdir())
-                    if not remaining_files:
-                        self.install_component_subdir.rmdir()
-                        self.logger.debug("Removed empty modes directory")
-            except Exception as e:
-                self.logger.warning(f"Could not remove modes directory: {e}")
+            # Remove mode files (and the modes directory once empty)
+            removed_count, _ = self.remove_installed_files(
+                target for _, target in self.get_files_to_install()
+            )
 
             # Update settings.json
             try:
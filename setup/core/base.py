@@ -3,18 +3,55 @@ Abstract base class for installable components
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Tuple, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+import functools
+from typing import Iterable, List, Dict, Tuple, Optional, Any
 from pathlib import Path
 import json
 from ..services.files import FileService
 from ..services.settings import SettingsService
 from ..utils.logger import get_logger
+from ..utils.progress import FILE_DONE, ProgressCallback, ProgressEvent
 from ..utils.security import SecurityValidator
+from ..utils.trace import get_tracer, span
+
+
+REMOVE_JOBS = 8  # Threads hashing and deleting files during uninstall
+
+# Lifecycle methods recorded as trace spans, including subclass overrides
+TRACED_METHODS = (
+    "validate_prerequisites",
+    "install",
+    "_install",
+    "_post_install",
+    "uninstall",
+    "update",
+    "validate_installation",
+)
+
+
+def _trace_lifecycle(func):
+    """Wrap a lifecycle method so each call is a span when tracing is on"""
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if not get_tracer().enabled:
+            return func(self, *args, **kwargs)
+        with span(func.__qualname__, "component", component=type(self).__name__):
+            return func(self, *args, **kwargs)
+
+    return wrapper
 
 
 class Component(ABC):
     """Base class for all installable components"""
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name in TRACED_METHODS:
+            if name in cls.__dict__:
+                setattr(cls, name, _trace_lifecycle(cls.__dict__[name]))
+
     def __init__(
         self, install_dir: Optional[Path] = None, component_subdir: Path = Path("")
     ):
@@ -34,6 +71,8 @@ class Component(ABC):
         self.component_files = self._discover_component_files()
         self.file_manager = FileService()
         self.install_component_subdir = self.install_dir / component_subdir
+        # Set by the Installer (or a command) to receive progress events
+        self.progress_callback: Optional[ProgressCallback] = None
 
     @abstractmethod
     def get_metadata(self) -> Dict[str, str]:
@@ -181,6 +220,7 @@ class Component(ABC):
             if self.file_manager.copy_file(source, target):
                 success_count += 1
                 self.logger.debug(f"Successfully copied {source.name}")
+                self.emit_file_done(source)
             else:
                 self.logger.error(f"Failed to copy {source.name}")
 
@@ -194,6 +234,7 @@ class Component(ABC):
             f"{repr(self)} component installed successfully ({success_count} files)"
         )
 
+        self.record_file_manifest(target for _, target in files_to_install)
         return self._post_install()
 
     @abstractmethod
@@ -297,6 +338,152 @@ class Component(ABC):
 
         return len(errors) == 0, errors
 
+    def emit_progress(self, kind: str, **fields: Any) -> None:
+        """
+        Report a progress event to the registered callback, if any
+
+        Args:
+            kind: Event kind from setup.utils.progress
+            **fields: ProgressEvent fields (files, bytes, message, ...)
+        """
+        if self.progress_callback is not None:
+            self.progress_callback(
+                ProgressEvent(kind, self.get_metadata()["name"], **fields)
+            )
+
+    def emit_file_done(self, path: Path, size: Optional[int] = None) -> None:
+        """Report one file copied or removed"""
+        if self.progress_callback is None:
+            return
+        if size is None:
+            try:
+                size = path.stat().st_size
+            except OSError:
+                size = 0
+        self.emit_progress(FILE_DONE, files=1, nbytes=size, message=path.name)
+
+    def record_file_manifest(self, targets: Iterable[Path]) -> None:
+        """
+        Store the sha256 of each installed file for manifest-driven uninstall
+
+        Entries from an earlier install whose files are still present are
+        kept with their original hash, so files a previous version shipped
+        but this one dropped are still removed (if unmodified) on uninstall.
+
+        Args:
+            targets: Installed file paths inside the install directory
+        """
+        name = self.get_metadata()["name"]
+        try:
+            previous = self.settings_manager.get_file_manifest(name)
+        except ValueError:
+            previous = {}
+
+        manifest = {
+            rel_path: digest
+            for rel_path, digest in previous.items()
+            if (self.install_dir / rel_path).is_file()
+        }
+        for target in targets:
+            digest = self.file_manager.get_file_hash(target)
+            if digest:
+                manifest[target.relative_to(self.install_dir).as_posix()] = digest
+
+        try:
+            self.settings_manager.set_file_manifest(name, manifest)
+        except ValueError as e:
+            self.logger.warning(f"Could not record installed file manifest: {e}")
+
+    def remove_installed_files(
+        self, fallback_paths: Iterable[Path] = (), jobs: int = REMOVE_JOBS
+    ) -> Tuple[int, List[Path]]:
+        """
+        Remove this component's files, preserving ones the user modified
+
+        Files come from the install manifest and are only deleted while their
+        hash still matches what was installed. Installs that predate the
+        manifest fall back to fallback_paths, removed unconditionally as
+        before. Directories emptied by the removal are pruned bottom-up.
+
+        Args:
+            fallback_paths: Files to remove when no manifest was recorded
+            jobs: Number of threads hashing and deleting files
+
+        Returns:
+            Tuple of (files removed, modified files preserved)
+        """
+        name = self.get_metadata()["name"]
+        try:
+            manifest = self.settings_manager.get_file_manifest(name)
+        except ValueError:
+            manifest = {}
+
+        if manifest:
+            work = []
+            for rel_path, digest in manifest.items():
+                path = self.install_dir / rel_path
+                # Never follow a tampered entry (e.g. "../../.bashrc") out of install_dir
+                is_safe, message = SecurityValidator.validate_path(path, self.install_dir)
+                if not is_safe:
+                    self.logger.warning(f"Ignoring manifest entry {rel_path}: {message}")
+                    continue
+                work.append((path, digest))
+        else:
+            work = [(path, None) for path in fallback_paths]
+
+        def remove(item: Tuple[Path, Optional[str]]) -> str:
+            path, expected = item
+            if not path.is_file():
+                return "missing"
+            if expected and self.file_manager.get_file_hash(path) != expected:
+                return "modified"
+            size = path.stat().st_size
+            if not self.file_manager.remove_file(path):
+                return "failed"
+            self.emit_file_done(path, size)
+            return "removed"
+
+        removed = 0
+        preserved = []
+        parents = set()
+        with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+            for (path, _), status in zip(work, executor.map(remove, work)):
+                if status == "removed":
+                    removed += 1
+                    parents.add(path.parent)
+                elif status == "modified":
+                    preserved.append(path)
+                    self.logger.warning(
+                        f"Preserving modified file: {path.relative_to(self.install_dir)}"
+                    )
+                elif status == "failed":
+                    self.logger.warning(f"Could not remove {path.name}")
+
+        self._prune_empty_directories(parents)
+
+        if manifest:
+            try:
+                self.settings_manager.set_file_manifest(name, None)
+            except ValueError as e:
+                self.logger.warning(f"Could not update file manifest: {e}")
+
+        return removed, preserved
+
+    def _prune_empty_directories(self, directories: Iterable[Path]) -> None:
+        """Remove empty directories and their emptied ancestors, deepest first"""
+        candidates = set()
+        for directory in directories:
+            while directory != self.install_dir and self.install_dir in directory.parents:
+                candidates.add(directory)
+                directory = directory.parent
+
+        for directory in sorted(candidates, key=lambda d: len(d.parts), reverse=True):
+            try:
+                directory.rmdir()  # Only succeeds once empty
+                self.logger.debug(f"Removed empty directory: {directory}")
+            except OSError:
+                pass
+
     def get_size_estimate(self) -> int:
         """
         Estimate installed size in bytes
@@ -465,3 +652,8 @@ class Component(ABC):
             return resolved_path if resolved_path.exists() else None
         except ValueError:
             return None
+
+
+for _name in TRACED_METHODS:
+    setattr(Component, _name, _trace_lifecycle(Component.__dict__[_name]))
+del _name
@@ -9,18 +9,31 @@ import tempfile
 from datetime import datetime
 from .base import Component
 from ..utils.logger import get_logger
+from ..utils.progress import (
+    COMPONENT_FINISHED,
+    COMPONENT_STARTED,
+    ProgressCallback,
+    ProgressEvent,
+)
+from ..utils.trace import span, traced
 
 
 class Installer:
     """Main installer orchestrator"""
 
-    def __init__(self, install_dir: Optional[Path] = None, dry_run: bool = False):
+    def __init__(
+        self,
+        install_dir: Optional[Path] = None,
+        dry_run: bool = False,
+        progress: Optional[ProgressCallback] = None,
+    ):
         """
         Initialize installer
 
         Args:
             install_dir: Target installation directory
             dry_run: If True, only simulate installation
+            progress: Callback receiving component and file progress events
         """
         from .. import DEFAULT_INSTALL_DIR
 
@@ -37,6 +50,7 @@ class Installer:
 
         self.failed_components: Set[str] = set()
         self.skipped_components: Set[str] = set()
+        self.progress = progress
         self.logger = get_logger()
 
     def register_component(self, component: Component) -> None:
@@ -100,6 +114,7 @@ class Installer:
 
         return resolved
 
+    @traced(category="installer")
     def validate_system_requirements(self) -> Tuple[bool, List[str]]:
         """
         Validate system requirements for all registered components
@@ -133,7 +148,7 @@ class Installer:
 
     def install_component(self, component_name: str, config: Dict[str, Any]) -> bool:
         """
-        Install a single component
+        Install a single component, reporting start and finish as progress
 
         Args:
             component_name: Name of component to install
@@ -146,7 +161,31 @@ class Installer:
             raise ValueError(f"Unknown component: {component_name}")
 
         component = self.components[component_name]
-
+        with span("Installer.install_component", "installer", component=component_name):
+            if self.progress is None:
+                return self._install_component(component_name, component, config)
+
+            try:
+                total_files = len(component.get_files_to_install())
+            except Exception:
+                total_files = None
+            self.progress(
+                ProgressEvent(COMPONENT_STARTED, component_name, total_files=total_files)
+            )
+
+            component.progress_callback = self.progress
+            success = False
+            try:
+                success = self._install_component(component_name, component, config)
+                return success
+            finally:
+                component.progress_callback = None
+                self.progress(ProgressEvent(COMPONENT_FINISHED, component_name, ok=success))
+
+    def _install_component(
+        self, component_name: str, component: Component, config: Dict[str, Any]
+    ) -> bool:
+        """Install or update one registered component"""
         # Framework components are ALWAYS updated to latest version
         # These are SuperClaude implementation files, not user configurations
         framework_components = {'framework_docs', 'agents', 'commands', 'modes', 'core', 'mcp'}
@@ -204,6 +243,7 @@ class Installer:
             self.failed_components.add(component_name)
             return False
 
+    @traced(category="installer")
     def install_components(
         self, component_names: List[str], config: Optional[Dict[str, Any]] = None
     ) -> bool:
@@ -247,6 +287,7 @@ class Installer:
 
         return all_success
 
+    @traced(category="installer")
     def _run_post_install_validation(self) -> None:
         """Run post-installation validation for all installed components"""
         self.logger.info("Running post-installation validation...")
@@ -5,10 +5,20 @@ System validation for SuperClaude installation requirements
 import subprocess
 import sys
 import shutil
-from typing import Tuple, List, Dict, Any, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Callable, Tuple, List, Dict, Any, Optional
 from pathlib import Path
 import re
 from ..utils.paths import get_home_directory
+from ..utils.probe_cache import ProbeCache
+
+# Overall time budget (seconds) for all diagnose_system probes combined
+DIAGNOSE_DEADLINE = 15
+
+# Timeout (seconds) for a single tool version probe
+PROBE_TIMEOUT = 10
 
 # Handle packaging import - if not available, use a simple version comparison
 try:
@@ -55,9 +65,66 @@ except ImportError:
 class Validator:
     """System requirements validator"""
 
-    def __init__(self):
-        """Initialize validator"""
+    def __init__(
+        self, probe_cache: Optional[ProbeCache] = None, refresh: bool = False
+    ):
+        """
+        Initialize validator
+
+        Args:
+            probe_cache: Persistent tool-probe cache (defaults to ~/.claude cache)
+            refresh: Ignore persisted probe results and re-probe every tool
+        """
         self.validation_cache: Dict[str, Any] = {}
+        self.probe_cache = probe_cache or ProbeCache()
+        self.refresh = refresh
+        # Per-thread time.monotonic() deadline set for diagnose_system probes
+        self._probe_context = threading.local()
+
+    def _probe_timeout(self) -> float:
+        """Subprocess timeout for a probe, clamped to the diagnose deadline"""
+        deadline = getattr(self._probe_context, "deadline", None)
+        if deadline is None:
+            return PROBE_TIMEOUT
+        return max(0.1, min(PROBE_TIMEOUT, deadline - time.monotonic()))
+
+    def _run_with_deadline(self, probe: Callable[[], Any], deadline: float) -> Any:
+        """Run probe on a worker thread with subprocess timeouts bounded by deadline"""
+        self._probe_context.deadline = deadline
+        try:
+            return probe()
+        finally:
+            self._probe_context.deadline = None
+
+    def _cached_probe(
+        self, cache_key: str, executable: str, probe: Callable[[], Tuple[bool, str]]
+    ) -> Tuple[bool, str]:
+        """
+        Run a tool probe through the in-memory and on-disk caches
+
+        Persisted results are reused only while the resolved binary, its
+        mtime/size and PATH are unchanged. Only successful probes are
+        persisted so transient failures are always re-checked.
+
+        Args:
+            cache_key: Probe cache key
+            executable: Executable the probe spawns
+            probe: Callable performing the actual check
+
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
+        if cache_key in self.validation_cache:
+            return self.validation_cache[cache_key]
+
+        result = None if self.refresh else self.probe_cache.get(cache_key, executable)
+        if result is None:
+            result = probe()
+            if result[0]:
+                self.probe_cache.set(cache_key, executable, result)
+
+        self.validation_cache[cache_key] = result
+        return result
 
     def check_python(
         self, min_version: str = "3.8", max_version: Optional[str] = None
@@ -124,24 +191,33 @@ class Validator:
             Tuple of (success: bool, message: str)
         """
         cache_key = f"node_{min_version}_{max_version}"
-        if cache_key in self.validation_cache:
-            return self.validation_cache[cache_key]
+        return self._cached_probe(
+            cache_key, "node", lambda: self._probe_node(min_version, max_version)
+        )
 
+    def _probe_node(
+        self, min_version: str = "16.0", max_version: Optional[str] = None
+    ) -> Tuple[bool, str]:
+        """Run the check_node probe without caching"""
         try:
-            # Check if node is installed - use shell=True on Windows for better PATH resolution
+            # Resolve presence in-process; only spawn for the version check
+            node_path = shutil.which("node")
+            if node_path is None:
+                help_msg = self.get_installation_help("node")
+                return (False, f"Node.js not found in PATH{help_msg}")
+
+            # Use shell=True on Windows so .cmd shims resolve correctly
             result = subprocess.run(
-                ["node", "--version"],
+                [node_path, "--version"],
                 capture_output=True,
                 text=True,
-                timeout=10,
+                timeout=self._probe_timeout(),
                 shell=(sys.platform == "win32"),
             )
 
             if result.returncode != 0:
                 help_msg = self.get_installation_help("node")
-                result_tuple = (False, f"Node.js not found in PATH{help_msg}")
-                self.validation_cache[cache_key] = result_tuple
-                return result_tuple
+                return (False, f"Node.js not found in PATH{help_msg}")
 
             # Parse version (format: v18.17.0)
             version_output = result.stdout.strip()
@@ -153,41 +229,29 @@ class Validator:
             # Check minimum version
             if version.parse(current_version) < version.parse(min_version):
                 help_msg = self.get_installation_help("node")
-                result_tuple = (
+                return (
                     False,
                     f"Node.js {min_version}+ required, found {current_version}{help_msg}",
                 )
-                self.validation_cache[cache_key] = result_tuple
-                return result_tuple
 
             # Check maximum version if specified
             if max_version and version.parse(current_version) > version.parse(
                 max_version
             ):
-                result_tuple = (
+                return (
                     False,
                     f"Node.js version {current_version} exceeds maximum supported {max_version}",
                 )
-                self.validation_cache[cache_key] = result_tuple
-                return result_tuple
 
-            result_tuple = (True, f"Node.js {current_version} meets requirements")
-            self.validation_cache[cache_key] = result_tuple
-            return result_tuple
+            return (True, f"Node.js {current_version} meets requirements")
 
         except subprocess.TimeoutExpired:
-            result_tuple = (False, "Node.js version check timed out")
-            self.validation_cache[cache_key] = result_tuple
-            return result_tuple
+            return (False, "Node.js version check timed out")
         except FileNotFoundError:
             help_msg = self.get_installation_help("node")
-            result_tuple = (False, f"Node.js not found in PATH{help_msg}")
-            self.validation_cache[cache_key] = result_tuple
-            return result_tuple
+            return (False, f"Node.js not found in PATH{help_msg}")
         except Exception as e:
-            result_tuple = (False, f"Could not check Node.js version: {e}")
-            self.validation_cache[cache_key] = result_tuple
-            return result_tuple
+            return (False, f"Could not check Node.js version: {e}")
 
     def check_claude_cli(self, min_version: Optional[str] = None) -> Tuple[bool, str]:
         """
@@ -200,33 +264,38 @@ class Validator:
             Tuple of (success: bool, message: str)
         """
         cache_key = f"claude_cli_{min_version}"
-        if cache_key in self.validation_cache:
-            return self.validation_cache[cache_key]
+        return self._cached_probe(
+            cache_key, "claude", lambda: self._probe_claude_cli(min_version)
+        )
 
+    def _probe_claude_cli(self, min_version: Optional[str] = None) -> Tuple[bool, str]:
+        """Run the check_claude_cli probe without caching"""
         try:
-            # Check if claude is installed - use shell=True on Windows for better PATH resolution
+            # Resolve presence in-process; only spawn for the version check
+            claude_path = shutil.which("claude")
+            if claude_path is None:
+                help_msg = self.get_installation_help("claude_cli")
+                return (False, f"Claude CLI not found in PATH{help_msg}")
+
+            # Use shell=True on Windows so .cmd shims resolve correctly
             result = subprocess.run(
-                ["claude", "--version"],
+                [claude_path, "--version"],
                 capture_output=True,
                 text=True,
-                timeout=10,
+                timeout=self._probe_timeout(),
                 shell=(sys.platform == "win32"),
             )
 
             if result.returncode != 0:
                 help_msg = self.get_installation_help("claude_cli")
-                result_tuple = (False, f"Claude CLI not found in PATH{help_msg}")
-                self.validation_cache[cache_key] = result_tuple
-                return result_tuple
+                return (False, f"Claude CLI not found in PATH{help_msg}")
 
             # Parse version from output
             version_output = result.stdout.strip()
             version_match = re.search(r"(\d+\.\d+\.\d+)", version_output)
 
             if not version_match:
-                result_tuple = (True, "Claude CLI found (version format unknown)")
-                self.validation_cache[cache_key] = result_tuple
-                return result_tuple
+                return (True, "Claude CLI found (version format unknown)")
 
             current_version = version_match.group(1)
 
@@ -234,30 +303,20 @@ class Validator:
             if min_version and version.parse(current_version) < version.parse(
                 min_version
             ):
-                result_tuple = (
+                return (
                     False,
                     f"Claude CLI {min_version}+ required, found {current_version}",
                 )
-                self.validation_cache[cache_key] = result_tuple
-                return result_tuple
 
-            result_tuple = (True, f"Claude CLI {current_version} found")
-            self.validation_cache[cache_key] = result_tuple
-            return result_tuple
+            return (True, f"Claude CLI {current_version} found")
 
         except subprocess.TimeoutExpired:
-            result_tuple = (False, "Claude CLI version check timed out")
-            self.validation_cache[cache_key] = result_tuple
-            return result_tuple
+            return (False, "Claude CLI version check timed out")
         except FileNotFoundError:
             help_msg = self.get_installation_help("claude_cli")
-            result_tuple = (False, f"Claude CLI not found in PATH{help_msg}")
-            self.validation_cache[cache_key] = result_tuple
-            return result_tuple
+            return (False, f"Claude CLI not found in PATH{help_msg}")
         except Exception as e:
-            result_tuple = (False, f"Could not check Claude CLI: {e}")
-            self.validation_cache[cache_key] = result_tuple
-            return result_tuple
+            return (False, f"Could not check Claude CLI: {e}")
 
     def check_external_tool(
         self, tool_name: str, command: str, min_version: Optional[str] = None
@@ -273,26 +332,39 @@ class Validator:
         Returns:
             Tuple of (success: bool, message: str)
         """
+        cmd_parts = command.split() if isinstance(command, str) else []
+        if not cmd_parts:
+            return (False, f"No version command configured for {tool_name}")
+
         cache_key = f"tool_{tool_name}_{command}_{min_version}"
-        if cache_key in self.validation_cache:
-            return self.validation_cache[cache_key]
+        return self._cached_probe(
+            cache_key,
+            cmd_parts[0],
+            lambda: self._probe_external_tool(tool_name, command, min_version),
+        )
 
+    def _probe_external_tool(
+        self, tool_name: str, command: str, min_version: Optional[str] = None
+    ) -> Tuple[bool, str]:
+        """Run the check_external_tool probe without caching"""
         try:
             # Split command into parts
             cmd_parts = command.split()
 
+            # Resolve presence in-process; only spawn for the version check
+            if shutil.which(cmd_parts[0]) is None:
+                return (False, f"{tool_name} not found in PATH")
+
             result = subprocess.run(
                 cmd_parts,
                 capture_output=True,
                 text=True,
-                timeout=10,
+                timeout=self._probe_timeout(),
                 shell=(sys.platform == "win32"),
             )
 
             if result.returncode != 0:
-                result_tuple = (False, f"{tool_name} not found or command failed")
-                self.validation_cache[cache_key] = result_tuple
-                return result_tuple
+                return (False, f"{tool_name} not found or command failed")
 
             # Extract version if min_version specified
             if min_version:
@@ -303,37 +375,23 @@ class Validator:
                     current_version = version_match.group(1)
 
                     if version.parse(current_version) < version.parse(min_version):
-                        result_tuple = (
+                        return (
                             False,
                             f"{tool_name} {min_version}+ required, found {current_version}",
                         )
-                        self.validation_cache[cache_key] = result_tuple
-                        return result_tuple
 
-                    result_tuple = (True, f"{tool_name} {current_version} found")
-                    self.validation_cache[cache_key] = result_tuple
-                    return result_tuple
+                    return (True, f"{tool_name} {current_version} found")
                 else:
-                    result_tuple = (True, f"{tool_name} found (version unknown)")
-                    self.validation_cache[cache_key] = result_tuple
-                    return result_tuple
+                    return (True, f"{tool_name} found (version unknown)")
             else:
-                result_tuple = (True, f"{tool_name} found")
-                self.validation_cache[cache_key] = result_tuple
-                return result_tuple
+                return (True, f"{tool_name} found")
 
         except subprocess.TimeoutExpired:
-            result_tuple = (False, f"{tool_name} check timed out")
-            self.validation_cache[cache_key] = result_tuple
-            return result_tuple
+            return (False, f"{tool_name} check timed out")
         except FileNotFoundError:
-            result_tuple = (False, f"{tool_name} not found in PATH")
-            self.validation_cache[cache_key] = result_tuple
-            return result_tuple
+            return (False, f"{tool_name} not found in PATH")
         except Exception as e:
-            result_tuple = (False, f"Could not check {tool_name}: {e}")
-            self.validation_cache[cache_key] = result_tuple
-            return result_tuple
+            return (False, f"Could not check {tool_name}: {e}")
 
     def check_disk_space(self, path: Path, required_mb: int = 500) -> Tuple[bool, str]:
         """
@@ -611,10 +669,16 @@ class Validator:
 
         return f"No installation instructions available for {tool_name} on {platform}"
 
-    def diagnose_system(self) -> Dict[str, Any]:
+    def diagnose_system(self, deadline: float = DIAGNOSE_DEADLINE) -> Dict[str, Any]:
         """
         Perform comprehensive system diagnostics
 
+        All probes run concurrently; any probe still running when the
+        overall deadline expires is reported as timed out.
+
+        Args:
+            deadline: Overall time budget in seconds for all probes
+
         Returns:
             Diagnostic information dict
         """
@@ -625,8 +689,17 @@ class Validator:
             "recommendations": [],
         }
 
+        probes: Dict[str, Callable[[], Any]] = {
+            "python": self.check_python,
+            "node": self.check_node,
+            "claude_cli": self.check_claude_cli,
+            "disk_space": lambda: self.check_disk_space(get_home_directory()),
+            "path": self._find_missing_path_tools,
+        }
+        results = self._run_probes(probes, deadline)
+
         # Check Python
-        python_success, python_msg = self.check_python()
+        python_success, python_msg = results["python"]
         diagnostics["checks"]["python"] = {
             "status": "pass" if python_success else "fail",
             "message": python_msg,
@@ -636,7 +709,7 @@ class Validator:
             diagnostics["recommendations"].append(self.get_installation_help("python"))
 
         # Check Node.js
-        node_success, node_msg = self.check_node()
+        node_success, node_msg = results["node"]
         diagnostics["checks"]["node"] = {
             "status": "pass" if node_success else "fail",
             "message": node_msg,
@@ -646,7 +719,7 @@ class Validator:
             diagnostics["recommendations"].append(self.get_installation_help("node"))
 
         # Check Claude CLI
-        claude_success, claude_msg = self.check_claude_cli()
+        claude_success, claude_msg = results["claude_cli"]
         diagnostics["checks"]["claude_cli"] = {
             "status": "pass" if claude_success else "fail",
             "message": claude_msg,
@@ -658,7 +731,7 @@ class Validator:
             )
 
         # Check disk space
-        disk_success, disk_msg = self.check_disk_space(get_home_directory())
+        disk_success, disk_msg = results["disk_space"]
         diagnostics["checks"]["disk_space"] = {
             "status": "pass" if disk_success else "fail",
             "message": disk_msg,
@@ -667,12 +740,63 @@ class Validator:
             diagnostics["issues"].append("Insufficient disk space")
 
         # Check common PATH issues
-        self._diagnose_path_issues(diagnostics)
+        path_success, path_issues = results["path"]
+        if not path_success:
+            path_issues = [f"PATH check failed: {path_issues}"]
+        self._add_path_diagnostics(diagnostics, path_issues)
 
         return diagnostics
 
-    def _diagnose_path_issues(self, diagnostics: Dict[str, Any]) -> None:
-        """Add PATH-related diagnostics"""
+    def _run_probes(
+        self, probes: Dict[str, Callable[[], Any]], deadline: float
+    ) -> Dict[str, Any]:
+        """
+        Run diagnostic probes concurrently with an overall deadline
+
+        Args:
+            probes: Mapping of probe name to zero-argument callable
+            deadline: Overall time budget in seconds
+
+        Returns:
+            Mapping of probe name to its result; probes that raised or did not
+            finish before the deadline map to (False, reason)
+        """
+        results: Dict[str, Any] = {}
+        # Probe subprocesses time out at the deadline, so leftover workers
+        # exit shortly after it instead of holding up interpreter shutdown
+        deadline_at = time.monotonic() + deadline
+        executor = ThreadPoolExecutor(
+            max_workers=len(probes), thread_name_prefix="superclaude-diagnose"
+        )
+        try:
+            futures = {
+                executor.submit(self._run_with_deadline, probe, deadline_at): name
+                for name, probe in probes.items()
+            }
+            done, _ = wait(futures, timeout=deadline)
+
+            for future, name in futures.items():
+                if future not in done:
+                    future.cancel()
+                    results[name] = (False, f"Check timed out after {deadline:g}s")
+                    continue
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    results[name] = (False, f"Check failed: {e}")
+        finally:
+            # Don't block on hung probes; their clamped subprocess timeouts reap them
+            executor.shutdown(wait=False)
+
+        return results
+
+    def _find_missing_path_tools(self) -> Tuple[bool, List[str]]:
+        """
+        Find common tools missing from PATH using in-process lookups
+
+        Returns:
+            Tuple of (success: bool, path_issues: List[str])
+        """
         path_issues = []
 
         # Check if tools are in PATH, with alternatives for some tools
@@ -685,21 +809,7 @@ class Validator:
         ]
 
         for tool_alternatives, display_name in tool_checks:
-            tool_found = False
-            for tool in tool_alternatives:
-                try:
-                    result = subprocess.run(
-                        ["which" if sys.platform != "win32" else "where", tool],
-                        capture_output=True,
-                        text=True,
-                        timeout=5,
-                        shell=(sys.platform == "win32"),
-                    )
-                    if result.returncode == 0:
-                        tool_found = True
-                        break
-                except Exception:
-                    continue
+            tool_found = any(shutil.which(tool) for tool in tool_alternatives)
 
             if not tool_found:
                 # Only report as missing if none of the alternatives were found
@@ -708,6 +818,12 @@ class Validator:
                 else:
                     path_issues.append(f"{tool_alternatives[0]} not found in PATH")
 
+        return True, path_issues
+
+    def _add_path_diagnostics(
+        self, diagnostics: Dict[str, Any], path_issues: List[str]
+    ) -> None:
+        """Record PATH issues and the matching recommendation"""
         if path_issues:
             diagnostics["issues"].extend(path_issues)
             diagnostics["recommendations"].append(
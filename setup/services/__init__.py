@@ -3,9 +3,20 @@ SuperClaude Services Module
 Business logic services for the SuperClaude installation system
 """
 
+from .backup_catalog import BackupCatalog
+from .backup_store import BackupStore
 from .claude_md import CLAUDEMdService
 from .config import ConfigService
 from .files import FileService
+from .mcp_config import MCPConfigService
 from .settings import SettingsService
 
-__all__ = ["CLAUDEMdService", "ConfigService", "FileService", "SettingsService"]
+__all__ = [
+    "BackupCatalog",
+    "BackupStore",
+    "CLAUDEMdService",
+    "ConfigService",
+    "FileService",
+    "MCPConfigService",
+    "SettingsService",
+]
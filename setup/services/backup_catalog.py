@@ -0,0 +1,133 @@
+"""
+Catalog of SuperClaude backups
+Caches per-backup summaries so listing and cleanup never open the archives
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+CATALOG_NAME = "backup_catalog.json"
+
+
+class BackupCatalog:
+    """Index file in a backup directory keyed by backup file name
+
+    An entry is only trusted while the backup's size and mtime still match
+    what was recorded; anything else is treated as missing so callers fall
+    back to reading the backup itself.
+    """
+
+    FORMAT = "superclaude-backup-catalog"
+    FORMAT_VERSION = 1
+
+    def __init__(self, backup_dir: Path):
+        """
+        Initialize backup catalog
+
+        Args:
+            backup_dir: Backup directory holding the catalog file
+        """
+        self.backup_dir = backup_dir
+        self.catalog_file = backup_dir / CATALOG_NAME
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Load catalog entries
+
+        Returns:
+            Dict of backup file name -> entry; empty if the catalog is missing,
+            unreadable or written by a newer version
+        """
+        try:
+            with open(self.catalog_file, "r", encoding="utf-8") as f:
+                catalog = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        if (
+            not isinstance(catalog, dict)
+            or catalog.get("format") != self.FORMAT
+            or catalog.get("version", 0) > self.FORMAT_VERSION
+            or not isinstance(catalog.get("backups"), dict)
+        ):
+            return {}
+        return catalog["backups"]
+
+    def save(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        """Atomically replace the catalog with entries"""
+        catalog = {
+            "format": self.FORMAT,
+            "version": self.FORMAT_VERSION,
+            "backups": entries,
+        }
+        self.backup_dir.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=str(self.backup_dir), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(catalog, f, indent=2)
+            os.replace(temp_path, self.catalog_file)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+
+    @staticmethod
+    def make_entry(
+        backup_path: Path,
+        files: Optional[int],
+        metadata: Dict[str, Any],
+        sha256: Optional[str],
+        logical_size: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Build a catalog entry for a backup file
+
+        Args:
+            backup_path: Backup archive or snapshot manifest
+            files: Number of files in the backup
+            metadata: Backup metadata (the component_files map is not kept)
+            sha256: Checksum of the backup file
+            logical_size: Size to report instead of the file size (snapshots)
+
+        Returns:
+            Catalog entry dict
+        """
+        stats = backup_path.stat()
+        return {
+            "size": stats.st_size,
+            "mtime_ns": stats.st_mtime_ns,
+            "logical_size": logical_size,
+            "files": files,
+            "sha256": sha256,
+            "metadata": {
+                key: value
+                for key, value in metadata.items()
+                if key != "component_files"
+            },
+        }
+
+    @staticmethod
+    def is_current(entry: Dict[str, Any], stats: os.stat_result) -> bool:
+        """Check an entry still describes the file with the given stat"""
+        return (
+            entry.get("size") == stats.st_size
+            and entry.get("mtime_ns") == stats.st_mtime_ns
+        )
+
+    def record(self, backup_path: Path, entry: Dict[str, Any]) -> None:
+        """Add or replace the entry for one backup"""
+        entries = self.load()
+        entries[backup_path.name] = entry
+        self.save(entries)
+
+    def remove(self, names: Iterable[str]) -> None:
+        """Drop entries for deleted backups"""
+        entries = self.load()
+        removed = [entries.pop(name) for name in names if name in entries]
+        if removed:
+            self.save(entries)
@@ -0,0 +1,391 @@
+"""
+Content-addressed store for incremental SuperClaude backups
+Each unique file content is stored once as a blob; a backup is a snapshot
+manifest that references blobs by sha256
+"""
+
+import hashlib
+import json
+import os
+import stat
+import tempfile
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+SNAPSHOT_SUFFIX = ".snapshot.json"
+
+
+class BackupStore:
+    """Blob store plus snapshot manifests inside a backup directory"""
+
+    FORMAT = "superclaude-snapshot"
+    FORMAT_VERSION = 1
+    CHUNK_SIZE = 1024 * 1024
+    GC_GRACE_PERIOD = 3600  # Seconds a fresh blob is protected from GC
+
+    def __init__(self, backup_dir: Path):
+        """
+        Initialize backup store
+
+        Args:
+            backup_dir: Backup directory holding snapshots and the objects/ store
+        """
+        self.backup_dir = backup_dir
+        self.objects_dir = backup_dir / "objects"
+
+    def blob_path(self, digest: str) -> Path:
+        """Get the path of a blob by its sha256 digest"""
+        return self.objects_dir / digest[:2] / digest[2:]
+
+    def list_snapshots(self) -> List[Path]:
+        """List snapshot manifests in the backup directory"""
+        if not self.backup_dir.exists():
+            return []
+        return sorted(self.backup_dir.glob(f"*{SNAPSHOT_SUFFIX}"))
+
+    def load_snapshot(self, snapshot_file: Path) -> Dict[str, Any]:
+        """
+        Load a snapshot manifest
+
+        Args:
+            snapshot_file: Snapshot manifest path
+
+        Returns:
+            Manifest dict with metadata and files
+
+        Raises:
+            ValueError: If the file is not a snapshot manifest
+        """
+        with open(snapshot_file, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+
+        if not isinstance(manifest, dict) or manifest.get("format") != self.FORMAT:
+            raise ValueError(f"Not a SuperClaude snapshot: {snapshot_file}")
+        if manifest.get("version", 0) > self.FORMAT_VERSION:
+            raise ValueError(
+                f"Snapshot format v{manifest.get('version')} is newer than supported"
+            )
+        return manifest
+
+    def create_snapshot(
+        self,
+        source_dir: Path,
+        files: Iterable[Path],
+        snapshot_file: Path,
+        metadata: Dict[str, Any],
+    ) -> Dict[str, int]:
+        """
+        Store files and write a snapshot manifest referencing them
+
+        Files whose size and mtime match the most recent snapshot reuse its
+        digest without being read again; new content is written once.
+
+        Args:
+            source_dir: Directory the files are relative to
+            files: Files to include
+            snapshot_file: Manifest path to write
+            metadata: Backup metadata stored in the manifest
+
+        Returns:
+            Dict with files, reused, new_blobs, bytes_total and bytes_written
+        """
+        previous = self._latest_file_entries(exclude=snapshot_file)
+        stats = {
+            "files": 0,
+            "reused": 0,
+            "new_blobs": 0,
+            "bytes_total": 0,
+            "bytes_written": 0,
+        }
+        entries: Dict[str, Dict[str, Any]] = {}
+
+        for path in files:
+            rel_path = path.relative_to(source_dir).as_posix()
+            file_stat = path.stat()
+            prev = previous.get(rel_path)
+
+            if (
+                prev
+                and prev["size"] == file_stat.st_size
+                and prev["mtime_ns"] == file_stat.st_mtime_ns
+                and self._freshen(prev["sha256"])
+            ):
+                digest = prev["sha256"]
+                stats["reused"] += 1
+            else:
+                digest, written = self._store_file(path)
+                if written:
+                    stats["new_blobs"] += 1
+                    stats["bytes_written"] += written
+
+            entries[rel_path] = {
+                "sha256": digest,
+                "size": file_stat.st_size,
+                "mtime_ns": file_stat.st_mtime_ns,
+                "mode": stat.S_IMODE(file_stat.st_mode),
+            }
+            stats["files"] += 1
+            stats["bytes_total"] += file_stat.st_size
+
+        manifest = {
+            "format": self.FORMAT,
+            "version": self.FORMAT_VERSION,
+            "compression": "zlib",
+            "metadata": metadata,
+            "files": entries,
+        }
+        self._write_json(snapshot_file, manifest)
+        return stats
+
+    def restore_snapshot(
+        self,
+        snapshot_file: Path,
+        target_dir: Path,
+        overwrite: bool = False,
+        select: Optional[Callable[[str], bool]] = None,
+        jobs: int = 1,
+    ) -> Tuple[int, int, List[str]]:
+        """
+        Reassemble a snapshot into a directory
+
+        Args:
+            snapshot_file: Snapshot manifest to restore
+            target_dir: Directory to restore into
+            overwrite: Replace files that already exist
+            select: Optional predicate on the relative path
+            jobs: Number of threads writing files
+
+        Returns:
+            Tuple of (files restored, files skipped, error messages)
+        """
+        manifest = self.load_snapshot(snapshot_file)
+        root = target_dir.resolve()
+        restored, skipped, errors = 0, 0, []
+        pending = {}
+
+        with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+            for rel_path, entry in manifest["files"].items():
+                if select and not select(rel_path):
+                    continue
+
+                target = (root / rel_path).resolve()
+                if root not in target.parents:
+                    errors.append(f"{rel_path}: path escapes restore directory")
+                    continue
+
+                if target.exists() and not overwrite:
+                    skipped += 1
+                    continue
+
+                pending[executor.submit(self._restore_blob, entry, target)] = rel_path
+
+            for future, rel_path in pending.items():
+                try:
+                    future.result()
+                    restored += 1
+                except (OSError, ValueError, zlib.error) as e:
+                    errors.append(f"{rel_path}: {e}")
+
+        return restored, skipped, errors
+
+    def verify_snapshot(
+        self, snapshot_file: Path, jobs: int = 1
+    ) -> Tuple[int, List[str]]:
+        """
+        Check every blob a snapshot references decompresses to its digest
+
+        Blobs shared by several files are only read once.
+
+        Args:
+            snapshot_file: Snapshot manifest to verify
+            jobs: Number of threads reading blobs
+
+        Returns:
+            Tuple of (files checked, error messages)
+        """
+        manifest = self.load_snapshot(snapshot_file)
+        paths_by_digest: Dict[str, List[str]] = {}
+        for rel_path, entry in manifest["files"].items():
+            paths_by_digest.setdefault(entry["sha256"], []).append(rel_path)
+
+        errors = []
+        with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+            results = executor.map(self._check_blob, paths_by_digest)
+            for digest, error in zip(paths_by_digest, results):
+                if error:
+                    for rel_path in paths_by_digest[digest]:
+                        errors.append(f"{rel_path}: {error}")
+
+        return len(manifest["files"]), sorted(errors)
+
+    def gc(self, grace_period: Optional[float] = None) -> Tuple[int, int]:
+        """
+        Delete blobs not referenced by any snapshot manifest
+
+        Blobs modified within the grace period are kept so a backup being
+        created concurrently cannot lose content it has not referenced yet.
+
+        Args:
+            grace_period: Minimum blob age in seconds before it can be removed
+
+        Returns:
+            Tuple of (blobs removed, bytes freed)
+        """
+        if not self.objects_dir.exists():
+            return 0, 0
+
+        grace = self.GC_GRACE_PERIOD if grace_period is None else grace_period
+        referenced = set()
+        for snapshot_file in self.list_snapshots():
+            try:
+                manifest = self.load_snapshot(snapshot_file)
+            except (OSError, ValueError):
+                # An unreadable manifest might still reference blobs; be safe
+                return 0, 0
+            referenced.update(entry["sha256"] for entry in manifest["files"].values())
+
+        removed, freed = 0, 0
+        cutoff = time.time() - grace
+        for fan_out in self.objects_dir.iterdir():
+            if not fan_out.is_dir():
+                continue
+            for blob in fan_out.iterdir():
+                if fan_out.name + blob.name in referenced:
+                    continue
+                try:
+                    blob_stat = blob.stat()
+                    if blob_stat.st_mtime > cutoff:
+                        continue
+                    blob.unlink()
+                    removed += 1
+                    freed += blob_stat.st_size
+                except OSError:
+                    continue
+            try:
+                fan_out.rmdir()  # Only succeeds once empty
+            except OSError:
+                pass
+
+        return removed, freed
+
+    def _latest_file_entries(self, exclude: Path) -> Dict[str, Dict[str, Any]]:
+        """File entries of the most recently written snapshot"""
+        snapshots = [path for path in self.list_snapshots() if path != exclude]
+        for snapshot_file in sorted(
+            snapshots, key=lambda path: path.stat().st_mtime, reverse=True
+        ):
+            try:
+                return self.load_snapshot(snapshot_file)["files"]
+            except (OSError, ValueError):
+                continue
+        return {}
+
+    def _freshen(self, digest: str) -> bool:
+        """Mark an existing blob as in use; False if it is missing"""
+        try:
+            os.utime(self.blob_path(digest))
+            return True
+        except OSError:
+            return False
+
+    def _store_file(self, path: Path) -> Tuple[str, int]:
+        """
+        Hash and store a file's content
+
+        Returns:
+            Tuple of (sha256 digest, bytes written; 0 if the blob existed)
+        """
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=str(self.objects_dir), suffix=".tmp")
+        hasher = hashlib.sha256()
+        compressor = zlib.compressobj()
+
+        try:
+            with os.fdopen(fd, "wb") as out, open(path, "rb") as source:
+                for chunk in iter(lambda: source.read(self.CHUNK_SIZE), b""):
+                    hasher.update(chunk)
+                    out.write(compressor.compress(chunk))
+                out.write(compressor.flush())
+
+            digest = hasher.hexdigest()
+            if self._freshen(digest):
+                os.unlink(temp_path)
+                return digest, 0
+
+            blob = self.blob_path(digest)
+            blob.parent.mkdir(exist_ok=True)
+            written = os.path.getsize(temp_path)
+            os.replace(temp_path, blob)
+            return digest, written
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+
+    def _iter_blob(self, digest: str):
+        """Yield the decompressed content of a blob in chunks"""
+        decompressor = zlib.decompressobj()
+        with open(self.blob_path(digest), "rb") as blob:
+            for chunk in iter(lambda: blob.read(self.CHUNK_SIZE), b""):
+                yield decompressor.decompress(chunk)
+        yield decompressor.flush()
+
+    def _check_blob(self, digest: str) -> Optional[str]:
+        """Return an error message if a blob is missing or corrupted"""
+        hasher = hashlib.sha256()
+        try:
+            for data in self._iter_blob(digest):
+                hasher.update(data)
+        except FileNotFoundError:
+            return "blob missing"
+        except (OSError, zlib.error) as e:
+            return f"unreadable blob ({e})"
+
+        if hasher.hexdigest() != digest:
+            return "checksum mismatch (corrupted blob)"
+        return None
+
+    def _restore_blob(self, entry: Dict[str, Any], target: Path) -> None:
+        """Decompress a blob to target, verifying its digest before replacing"""
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=str(target.parent), suffix=".restore")
+        hasher = hashlib.sha256()
+
+        try:
+            with os.fdopen(fd, "wb") as out:
+                for data in self._iter_blob(entry["sha256"]):
+                    hasher.update(data)
+                    out.write(data)
+
+            if hasher.hexdigest() != entry["sha256"]:
+                raise ValueError("checksum mismatch (corrupted blob)")
+
+            os.chmod(temp_path, entry.get("mode", 0o644))
+            os.utime(temp_path, ns=(entry["mtime_ns"], entry["mtime_ns"]))
+            os.replace(temp_path, target)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+
+    def _write_json(self, path: Path, data: Dict[str, Any]) -> None:
+        """Atomically write a JSON document"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+            os.replace(temp_path, path)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
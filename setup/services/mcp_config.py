@@ -0,0 +1,293 @@
+"""
+Direct access to MCP server registrations in Claude's config file
+Reads every scope's `mcpServers` entries and writes user-scope ones without
+spawning the Claude CLI
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from ..utils.json_stream import read_json_keys
+from ..utils.paths import get_home_directory
+
+# Attempts at an edit when the Claude CLI rewrites the config concurrently
+WRITE_ATTEMPTS = 5
+
+
+class _ConfigChanged(Exception):
+    """The config file changed between reading it and replacing it"""
+
+
+class MCPConfigService:
+    """Reads MCP server entries and manages user-scope ones in ~/.claude.json"""
+
+    # Serializes writers within this process; the lock file covers other processes
+    _thread_lock = threading.Lock()
+
+    def __init__(self, config_file: Optional[Path] = None):
+        """
+        Initialize MCP config service
+
+        Args:
+            config_file: Claude config file (defaults to ~/.claude.json)
+        """
+        self.config_file = config_file or (get_home_directory() / ".claude.json")
+        # Kept with the other SuperClaude state in ~/.claude and left in place:
+        # deleting a lock file other processes may be waiting on would let
+        # two writers hold "the" lock at once
+        self.lock_file = self.config_file.parent / ".claude" / (
+            self.config_file.name + ".lock"
+        )
+
+    def read_servers(
+        self, project_dir: Optional[Path] = None
+    ) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Read the MCP server entries visible from a project directory
+
+        Merges user scope (top-level `mcpServers`), project scope
+        (`<project>/.mcp.json`) and local scope (`projects[<project>].mcpServers`),
+        with the narrower scope winning on name clashes like the Claude CLI.
+
+        Args:
+            project_dir: Directory Claude would run in (defaults to the cwd)
+
+        Returns:
+            Dict of server name -> server config, or None if the config file is
+            missing or its format is not recognized (callers should fall back
+            to the Claude CLI)
+        """
+        project_key = str(project_dir or Path.cwd())
+        try:
+            config = read_json_keys(
+                self.config_file,
+                ["mcpServers", ("projects", project_key, "mcpServers")],
+            )
+        except (OSError, ValueError):
+            return None
+
+        local = config.get("projects", {}).get(project_key, {})
+        if not self._is_recognized(config) or not self._is_recognized(local):
+            return None
+
+        project = self._read_project_servers(Path(project_key) / ".mcp.json")
+        if project is None:
+            return None
+
+        servers = dict(config.get("mcpServers", {}))
+        servers.update(project)
+        servers.update(local.get("mcpServers", {}))
+        return servers
+
+    def _read_project_servers(
+        self, mcp_file: Path
+    ) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Read project-scope entries from .mcp.json ({} if there is none)"""
+        try:
+            with open(mcp_file, "r", encoding="utf-8") as f:
+                config = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError):
+            return None
+
+        if not self._is_recognized(config):
+            return None
+        return dict(config.get("mcpServers", {}))
+
+    def add_server(
+        self,
+        name: str,
+        command: str,
+        args: Optional[List[str]] = None,
+        env: Optional[Dict[str, str]] = None,
+    ) -> bool:
+        """
+        Register a stdio MCP server in user scope
+
+        Args:
+            name: Server name
+            command: Executable to launch
+            args: Command arguments
+            env: Extra environment variables for the server
+
+        Returns:
+            True if written, False if the config format is not recognized
+        """
+        entry = {
+            "type": "stdio",
+            "command": command,
+            "args": list(args or []),
+            "env": dict(env or {}),
+        }
+
+        def register(config: Dict[str, Any]) -> bool:
+            config.setdefault("mcpServers", {})[name] = entry
+            return True
+
+        return self._update(register)
+
+    def remove_server(self, name: str) -> bool:
+        """
+        Remove a user-scope MCP server
+
+        Args:
+            name: Server name
+
+        Returns:
+            True if removed, False if it is not a user-scope entry or the
+            config format is not recognized
+        """
+
+        def unregister(config: Dict[str, Any]) -> bool:
+            if name not in config.get("mcpServers", {}):
+                return False
+            del config["mcpServers"][name]
+            return True
+
+        return self._update(unregister)
+
+    def _update(self, mutate: Callable[[Dict[str, Any]], bool]) -> bool:
+        """
+        Read-modify-write the config file, retrying if it changes underneath
+
+        The lock file only excludes other SuperClaude processes; the Claude CLI
+        rewrites ~/.claude.json without it. The file is therefore compared
+        with the state it was read in just before the replace, and the edit
+        is redone against the new contents when it changed. A CLI write
+        landing between that check and the replace can still be lost.
+
+        Args:
+            mutate: Edits the loaded config in place; returns False to abort
+
+        Returns:
+            True if the edited config was written
+        """
+        try:
+            with self._locked():
+                for _ in range(WRITE_ATTEMPTS):
+                    stamp = self._stamp()
+                    config = self._load_config()
+                    if config is None or not mutate(config):
+                        return False
+                    try:
+                        return self._write_config(config, stamp)
+                    except _ConfigChanged:
+                        continue
+        except OSError:
+            pass
+        return False
+
+    def _stamp(self) -> Optional[Tuple[int, int, int]]:
+        """Identity of the config file's current contents"""
+        try:
+            stat = self.config_file.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def _load_config(self) -> Optional[Dict[str, Any]]:
+        """Load the config file, returning None if missing or unrecognized"""
+        try:
+            with open(self.config_file, "r", encoding="utf-8") as f:
+                config = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not self._is_recognized(config):
+            return None
+        return config
+
+    @staticmethod
+    def _is_recognized(config: Any) -> bool:
+        """Check that the config has the mcpServers layout we know how to edit"""
+        if not isinstance(config, dict):
+            return False
+
+        servers = config.get("mcpServers", {})
+        if not isinstance(servers, dict):
+            return False
+
+        return all(isinstance(entry, dict) for entry in servers.values())
+
+    def _write_config(
+        self, config: Dict[str, Any], expected: Optional[Tuple[int, int, int]]
+    ) -> bool:
+        """
+        Atomically replace the config file, preserving its permissions
+
+        Args:
+            config: Config to write
+            expected: _stamp() of the file when config was read
+
+        Raises:
+            _ConfigChanged: If the file changed since it was read
+        """
+        try:
+            mode = self.config_file.stat().st_mode & 0o777
+        except OSError:
+            mode = 0o600
+
+        try:
+            fd, temp_path = tempfile.mkstemp(
+                dir=str(self.config_file.parent),
+                prefix=f".{self.config_file.name}.",
+                suffix=".tmp",
+            )
+        except OSError:
+            return False
+
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(config, f, indent=2, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.chmod(temp_path, mode)
+            if self._stamp() == expected:
+                os.replace(temp_path, self.config_file)
+                return True
+        except OSError:
+            self._discard(temp_path)
+            return False
+
+        self._discard(temp_path)
+        raise _ConfigChanged()
+
+    @staticmethod
+    def _discard(temp_path: str) -> None:
+        """Remove an unused temporary file"""
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold an exclusive lock for a read-modify-write cycle"""
+        with self._thread_lock:
+            self.lock_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.lock_file, "a+") as lock_handle:
+                if sys.platform == "win32":
+                    import msvcrt
+
+                    lock_handle.seek(0)
+                    msvcrt.locking(lock_handle.fileno(), msvcrt.LK_LOCK, 1)
+                    try:
+                        yield
+                    finally:
+                        lock_handle.seek(0)
+                        msvcrt.locking(lock_handle.fileno(), msvcrt.LK_UNLCK, 1)
+                else:
+                    import fcntl
+
+                    fcntl.flock(lock_handle.fileno(), fcntl.LOCK_EX)
+                    try:
+                        yield
+                    finally:
+                        fcntl.flock(lock_handle.fileno(), fcntl.LOCK_UN)
@@ -11,6 +11,9 @@ from pathlib import Path
 from datetime import datetime
 import copy
 
+from ..utils.json_stream import read_json_keys
+from ..utils.trace import traced
+
 
 class SettingsService:
     """Manages settings.json file operations"""
@@ -27,6 +30,7 @@ class SettingsService:
         self.metadata_file = install_dir / ".superclaude-metadata.json"
         self.backup_dir = install_dir / "backups" / "settings"
 
+    @traced(category="io")
     def load_settings(self) -> Dict[str, Any]:
         """
         Load settings from settings.json
@@ -43,6 +47,7 @@ class SettingsService:
         except (json.JSONDecodeError, IOError) as e:
             raise ValueError(f"Could not load settings from {self.settings_file}: {e}")
 
+    @traced(category="io")
     def save_settings(
         self, settings: Dict[str, Any], create_backup: bool = True
     ) -> None:
@@ -67,6 +72,7 @@ class SettingsService:
         except IOError as e:
             raise ValueError(f"Could not save settings to {self.settings_file}: {e}")
 
+    @traced(category="io")
     def load_metadata(self) -> Dict[str, Any]:
         """
         Load SuperClaude metadata from .superclaude-metadata.json
@@ -83,6 +89,7 @@ class SettingsService:
         except (json.JSONDecodeError, IOError) as e:
             raise ValueError(f"Could not load metadata from {self.metadata_file}: {e}")
 
+    @traced(category="io")
     def save_metadata(self, metadata: Dict[str, Any]) -> None:
         """
         Save SuperClaude metadata to .superclaude-metadata.json
@@ -131,10 +138,19 @@ class SettingsService:
         Returns:
             True if migration occurred, False if no data to migrate
         """
-        settings = self.load_settings()
-
         # SuperClaude-specific fields to migrate
         superclaude_fields = ["components", "framework", "superclaude", "mcp"]
+
+        # Cheap pre-check: settings.json is rewritten only if it has any of them
+        if not self.settings_file.exists():
+            return False
+        try:
+            if not read_json_keys(self.settings_file, superclaude_fields):
+                return False
+        except (json.JSONDecodeError, IOError) as e:
+            raise ValueError(f"Could not load settings from {self.settings_file}: {e}")
+
+        settings = self.load_settings()
         data_to_migrate = {}
         fields_found = False
 
@@ -304,6 +320,40 @@ class SettingsService:
             return True
         return False
 
+    def set_file_manifest(
+        self, component_name: str, manifest: Optional[Dict[str, str]]
+    ) -> None:
+        """
+        Record the files a component installed and their sha256
+
+        Kept outside the component registration, which components rewrite
+        wholesale when they sync.
+
+        Args:
+            component_name: Name of component
+            manifest: Install-relative POSIX path -> sha256, or None to remove
+        """
+        metadata = self.load_metadata()
+        manifests = metadata.setdefault("file_manifest", {})
+        if manifest is None:
+            if manifests.pop(component_name, None) is None:
+                return
+        else:
+            manifests[component_name] = manifest
+        self.save_metadata(metadata)
+
+    def get_file_manifest(self, component_name: str) -> Dict[str, str]:
+        """
+        Get the recorded install manifest of a component
+
+        Args:
+            component_name: Name of component
+
+        Returns:
+            Install-relative POSIX path -> sha256 (empty if none recorded)
+        """
+        return self.load_metadata().get("file_manifest", {}).get(component_name, {})
+
     def get_installed_components(self) -> Dict[str, Dict[str, Any]]:
         """
         Get all installed components from registry
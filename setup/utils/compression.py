@@ -0,0 +1,140 @@
+"""
+Block-parallel compression for SuperClaude backup archives
+Produces multi-member gzip / multi-stream bzip2 files. gzip.open, bz2.open
+and the gzip/bzip2 tools read every member, but tarfile's "r|*" stream mode
+stops after the first one, so archives are read through open_tar_stream
+"""
+
+import bz2
+import gzip
+import tarfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from pathlib import Path
+from typing import BinaryIO, Callable, Deque, Iterator
+
+COMPRESSION_LEVEL = 6
+BLOCK_SIZE = 4 * 1024 * 1024
+
+_BLOCK_COMPRESSORS = {
+    "gzip": partial(gzip.compress, compresslevel=COMPRESSION_LEVEL, mtime=0),
+    "bzip2": partial(bz2.compress, compresslevel=COMPRESSION_LEVEL),
+}
+
+
+class ParallelCompressWriter:
+    """Write-only file object that compresses fixed-size blocks on a thread pool
+
+    zlib and bz2 release the GIL while compressing, so blocks are compressed
+    concurrently and written to the underlying file in order. Each block
+    becomes its own gzip member / bzip2 stream.
+    """
+
+    def __init__(
+        self,
+        fileobj: BinaryIO,
+        method: str = "gzip",
+        threads: int = 4,
+        block_size: int = BLOCK_SIZE,
+    ):
+        """
+        Initialize parallel compressor
+
+        Args:
+            fileobj: Binary file object receiving compressed output
+            method: "gzip" or "bzip2"
+            threads: Number of compression threads
+            block_size: Uncompressed bytes per independently compressed block
+        """
+        if method not in _BLOCK_COMPRESSORS:
+            raise ValueError(f"Unsupported parallel compression method: {method}")
+
+        self._fileobj = fileobj
+        self._compress: Callable[[bytes], bytes] = _BLOCK_COMPRESSORS[method]
+        self._executor = ThreadPoolExecutor(max_workers=max(1, threads))
+        self._max_pending = 2 * max(1, threads)  # Bounds buffered memory
+        self._pending: Deque = deque()
+        self._buffer = bytearray()
+        self._block_size = block_size
+        self._closed = False
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    def write(self, data: bytes) -> int:
+        """Buffer data, handing full blocks to the compression threads"""
+        self._buffer += data
+        self.bytes_in += len(data)
+
+        while len(self._buffer) >= self._block_size:
+            block = bytes(self._buffer[: self._block_size])
+            del self._buffer[: self._block_size]
+            self._submit(block)
+
+        return len(data)
+
+    def flush(self) -> None:
+        """Blocks are only written once complete; nothing to flush early"""
+
+    def close(self) -> None:
+        """Compress the final partial block and write all pending output"""
+        if self._closed:
+            return
+        self._closed = True
+
+        try:
+            if self._buffer:
+                self._submit(bytes(self._buffer))
+                self._buffer.clear()
+            while self._pending:
+                self._write_next()
+        finally:
+            self._executor.shutdown(wait=True)
+
+    def _submit(self, block: bytes) -> None:
+        self._pending.append(self._executor.submit(self._compress, block))
+        while len(self._pending) > self._max_pending:
+            self._write_next()
+
+    def _write_next(self) -> None:
+        compressed = self._pending.popleft().result()
+        self._fileobj.write(compressed)
+        self.bytes_out += len(compressed)
+
+    def __enter__(self) -> "ParallelCompressWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+def open_decompressed(path: Path) -> BinaryIO:
+    """
+    Open a gzip, bzip2 or uncompressed file for sequential reading
+
+    The format is taken from the file's magic bytes. gzip.open and bz2.open
+    read all members of multi-member output such as ParallelCompressWriter's.
+
+    Args:
+        path: File to open
+
+    Returns:
+        Binary file object yielding the decompressed data
+    """
+    with open(path, "rb") as f:
+        magic = f.read(3)
+
+    if magic[:2] == b"\x1f\x8b":
+        return gzip.open(path, "rb")
+    if magic == b"BZh":
+        return bz2.open(path, "rb")
+    return open(path, "rb")
+
+
+@contextmanager
+def open_tar_stream(path: Path) -> Iterator[tarfile.TarFile]:
+    """Open a possibly compressed tar archive for one pass over its members"""
+    with open_decompressed(path) as stream:
+        with tarfile.open(fileobj=stream, mode="r|") as tar:
+            yield tar
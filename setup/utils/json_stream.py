@@ -0,0 +1,214 @@
+"""
+Incremental JSON reader for large config files
+Extracts selected keys of a JSON object without parsing the rest
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, TextIO, Tuple, Union
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_STRING = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+# Run of text containing whole strings but no brackets outside of strings
+_NON_STRUCTURAL = re.compile(r'[^"{}\[\]]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^"{}\[\]]*)*')
+_SCALAR = re.compile(r"[^,:{}\[\]\s\"]+")
+
+
+def read_json_keys(
+    path: Path,
+    keys: Iterable[Union[str, Tuple[str, ...]]],
+    chunk_size: int = 64 * 1024,
+) -> Dict[str, Any]:
+    """
+    Read selected keys from a JSON object file
+
+    Values of other keys are skipped without being decoded, and reading stops
+    as soon as every requested key has been found, so the cost is bounded by
+    the position of the requested keys rather than the size of the file.
+
+    A key may be a tuple naming a path through nested objects, e.g.
+    ("projects", "/home/user/app", "mcpServers"); only the value at the end
+    of the path is decoded and it is returned nested the same way.
+
+    Args:
+        path: JSON file whose top-level value is an object
+        keys: Top-level keys or key paths to extract
+        chunk_size: Number of characters read from disk at a time
+
+    Returns:
+        Dict of the requested keys that are present (missing keys are omitted)
+
+    Raises:
+        json.JSONDecodeError: If the file is not a JSON object or is malformed
+            before the last requested key
+        OSError: If the file cannot be read
+    """
+    selection: Dict[str, Any] = {}
+    for key in keys:
+        key_path = (key,) if isinstance(key, str) else tuple(key)
+        node = selection
+        for part in key_path[:-1]:
+            child = node.setdefault(part, {})
+            if child is None:
+                break  # A parent value is already read whole
+            node = child
+        else:
+            node[key_path[-1]] = None
+
+    with open(path, "r", encoding="utf-8") as f:
+        return _KeyReader(f, chunk_size).read(selection)
+
+
+class _KeyReader:
+    """Scanner over a text stream that keeps only unconsumed input buffered"""
+
+    def __init__(self, stream: TextIO, chunk_size: int):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.mark: Optional[int] = None  # Start of a value being captured
+
+    def read(self, selection: Dict[str, Any]) -> Dict[str, Any]:
+        """Scan the top-level object and decode the selected values"""
+        if self._peek() != "{":
+            self._fail("Top-level JSON value is not an object")
+        return self._read_object(selection, top_level=True)
+
+    def _read_object(self, selection: Dict[str, Any], top_level: bool) -> Dict[str, Any]:
+        """
+        Read an object whose opening brace is next, decoding selected members
+
+        Args:
+            selection: Key -> None (decode the value) or a nested selection
+            top_level: Stop as soon as every selected key is found instead of
+                consuming the rest of the object
+
+        Returns:
+            Dict of the selected members that are present
+        """
+        found: Dict[str, Any] = {}
+        wanted = set(selection)
+        self.pos += 1
+
+        if self._peek() == "}":
+            self.pos += 1
+            return found
+
+        while wanted or not top_level:
+            if self._peek() != '"':
+                self._fail("Expecting property name enclosed in double quotes")
+            key = json.loads(self._consume_string())
+
+            if self._peek() != ":":
+                self._fail("Expecting ':' delimiter")
+            self.pos += 1
+
+            if key in wanted:
+                wanted.discard(key)
+                nested = selection[key]
+                if nested is None:
+                    found[key] = self._read_value()
+                elif self._peek() == "{":
+                    value = self._read_object(nested, top_level=False)
+                    if value:
+                        found[key] = value
+                else:
+                    self._skip_value()
+            else:
+                self._skip_value()
+
+            delimiter = self._peek()
+            if delimiter == "}":
+                self.pos += 1
+                break
+            if delimiter != ",":
+                self._fail("Expecting ',' delimiter")
+            self.pos += 1
+
+        return found
+
+    def _fill(self) -> bool:
+        """Read more input, dropping consumed text; returns False at EOF"""
+        keep_from = self.pos if self.mark is None else self.mark
+        if keep_from:
+            self.buf = self.buf[keep_from:]
+            self.pos -= keep_from
+            if self.mark is not None:
+                self.mark = 0
+
+        # Grow reads with the buffer so long tokens are rescanned O(log n) times
+        chunk = self.stream.read(max(self.chunk_size, len(self.buf)))
+        if not chunk:
+            return False
+        self.buf += chunk
+        return True
+
+    def _peek(self) -> str:
+        """Skip whitespace and return the next character"""
+        while True:
+            self.pos = _WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                self._fail("Unexpected end of JSON input")
+
+    def _consume_string(self) -> str:
+        """Consume a complete string token and return its raw text"""
+        while True:
+            match = _STRING.match(self.buf, self.pos)
+            if match:
+                self.pos = match.end()
+                return match.group()
+            if not self._fill():
+                self._fail("Unterminated string")
+
+    def _skip_value(self) -> None:
+        """Advance past one JSON value without decoding it"""
+        first = self._peek()
+
+        if first == '"':
+            self._consume_string()
+            return
+
+        if first not in "{[":
+            while True:
+                match = _SCALAR.match(self.buf, self.pos)
+                if not match:
+                    self._fail("Expecting value")
+                if match.end() < len(self.buf) or not self._fill():
+                    self.pos = match.end()
+                    return
+
+        depth = 0
+        while True:
+            self.pos = _NON_STRUCTURAL.match(self.buf, self.pos).end()
+            if self.pos >= len(self.buf):
+                if not self._fill():
+                    self._fail("Unexpected end of JSON input")
+                continue
+
+            char = self.buf[self.pos]
+            if char == '"':
+                # String continues past the end of the buffer
+                self._consume_string()
+                continue
+
+            self.pos += 1
+            depth += 1 if char in "{[" else -1
+            if depth == 0:
+                return
+
+    def _read_value(self) -> Any:
+        """Decode one JSON value"""
+        self._peek()
+        self.mark = self.pos
+        try:
+            self._skip_value()
+            return json.loads(self.buf[self.mark : self.pos])
+        finally:
+            self.mark = None
+
+    def _fail(self, message: str) -> None:
+        raise json.JSONDecodeError(message, self.buf, self.pos)
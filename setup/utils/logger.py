@@ -2,11 +2,17 @@
 Logging system for SuperClaude installation suite
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
+import threading
+import time
+import weakref
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from enum import Enum
 
 from rich.console import Console
@@ -16,6 +22,10 @@ from .paths import get_home_directory
 # Rich console for colored output
 console = Console()
 
+# Old log files are pruned at most once per interval, tracked by a marker
+LOG_CLEANUP_INTERVAL = 24 * 60 * 60
+LOG_CLEANUP_MARKER = ".{name}-last-cleanup"
+
 
 class LogLevel(Enum):
     """Log levels"""
@@ -27,8 +37,163 @@ class LogLevel(Enum):
     CRITICAL = logging.CRITICAL
 
 
+class _RecordQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler for an in-process listener
+
+    Only the message is merged in the calling thread; the record keeps its
+    exc_info so the console can still render rich tracebacks. The first
+    record starts the listener.
+    """
+
+    def __init__(self, record_queue: "queue.Queue", on_first_record):
+        super().__init__(record_queue)
+        self._on_first_record = on_first_record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self._on_first_record is not None:
+            self._on_first_record()
+            self._on_first_record = None
+        super().enqueue(record)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """File handler that leaves flushing to the listener's batch boundary"""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+
+# Marks listener threads, whose console writes must never wait on the queue
+_listener_thread = threading.local()
+
+
+class _OrderedStream:
+    """Standard stream wrapper that lets queued log records print first
+
+    Installed over sys.stdout and sys.stderr when a listener starts, so a
+    direct print() or stream write from anywhere waits for the records
+    logged before it instead of overtaking them.
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def write(self, text: str) -> int:
+        if not getattr(_listener_thread, "active", False):
+            wait_for_pending_logs()
+        return self._stream.write(text)
+
+    def writelines(self, lines) -> None:
+        if not getattr(_listener_thread, "active", False):
+            wait_for_pending_logs()
+        self._stream.writelines(lines)
+
+    def __getattr__(self, name: str):
+        return getattr(self._stream, name)
+
+
+def _install_ordered_streams() -> None:
+    """Wrap sys.stdout and sys.stderr in _OrderedStream (once)"""
+    for name in ("stdout", "stderr"):
+        stream = getattr(sys, name)
+        if stream is not None and not isinstance(stream, _OrderedStream):
+            setattr(sys, name, _OrderedStream(stream))
+
+
+class _BatchingListener:
+    """Background thread that drains queued records in batches
+
+    Each record is passed to handle(), and the handlers are flushed once per
+    batch rather than once per record.
+    """
+
+    BATCH_SIZE = 256
+    _STOP = object()
+
+    def __init__(
+        self,
+        record_queue: "queue.Queue",
+        handle,
+        handlers: List[logging.Handler],
+    ):
+        self.queue = record_queue
+        self.handle = handle
+        self.handlers = handlers
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(
+            target=self._run, name="superclaude-log-listener", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Process every queued record, then end the thread"""
+        if self._thread is None:
+            return
+        self.queue.put(self._STOP)
+        self._thread.join()
+        self._thread = None
+
+    def _run(self) -> None:
+        _listener_thread.active = True
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < self.BATCH_SIZE:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stopping = False
+            for record in batch:
+                if record is self._STOP:
+                    stopping = True
+                else:
+                    try:
+                        self.handle(record)
+                    except Exception:
+                        pass
+            for handler in self.handlers:
+                try:
+                    handler.flush()
+                except Exception:
+                    pass
+            for _ in batch:
+                self.queue.task_done()
+
+            if stopping:
+                return
+
+
+# Loggers whose listeners still need draining at interpreter exit
+_active_loggers: "weakref.WeakSet[Logger]" = weakref.WeakSet()
+
+
 class Logger:
-    """Enhanced logger with console and file output"""
+    """Enhanced logger with console and file output
+
+    Records are handed to a background listener through a queue, so callers
+    never wait on terminal rendering or file writes. flush() waits for the
+    queue to drain; close() and interpreter exit drain it as well. Direct
+    writes to stdout/stderr also wait for it (see _OrderedStream), so they
+    never overtake earlier records.
+
+    Nothing is set up until a record is emitted: the listener starts with
+    the first record, and the console and file handlers (including the log
+    directory and retention cleanup) are created by the first record at or
+    above their level.
+    """
 
     def __init__(
         self,
@@ -51,17 +216,26 @@ class Logger:
         self.console_level = console_level
         self.file_level = file_level
         self.session_start = datetime.now()
+        self.log_file: Optional[Path] = None
+        self._console_handler: Optional[logging.Handler] = None
+        self._file_handler: Optional[logging.Handler] = None
+        self._file_setup_failed = False
+        self._handlers: List[logging.Handler] = []
+        self._start_lock = threading.Lock()
 
         # Create logger
         self.logger = logging.getLogger(name)
-        self.logger.setLevel(logging.DEBUG)  # Accept all levels, handlers will filter
 
         # Remove existing handlers to avoid duplicates
         self.logger.handlers.clear()
+        self._update_logger_level()
 
-        # Setup handlers
-        self._setup_console_handler()
-        self._setup_file_handler()
+        # Handlers are created on the listener thread when first needed
+        self._queue: "queue.Queue" = queue.Queue()
+        self._listener = _BatchingListener(
+            self._queue, self._handle_record, self._handlers
+        )
+        self.logger.addHandler(_RecordQueueHandler(self._queue, self._start_listener))
 
         self.log_counts: Dict[str, int] = {
             "debug": 0,
@@ -71,6 +245,29 @@ class Logger:
             "critical": 0,
         }
 
+    def _start_listener(self) -> None:
+        """Start the listener thread on the first emitted record"""
+        with self._start_lock:
+            if self._listener._thread is None:
+                _install_ordered_streams()
+                self._listener.start()
+                _active_loggers.add(self)
+
+    def _handle_record(self, record: logging.LogRecord) -> None:
+        """Emit a record, creating the handlers that accept it on first use"""
+        if self._console_handler is None and record.levelno >= self.console_level.value:
+            self._setup_console_handler()
+        if (
+            self._file_handler is None
+            and not self._file_setup_failed
+            and record.levelno >= self.file_level.value
+        ):
+            self._setup_file_handler()
+
+        for handler in self._handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
     def _setup_console_handler(self) -> None:
         """Setup colorized console handler using rich"""
         from rich.logging import RichHandler
@@ -89,7 +286,8 @@ class Logger:
         formatter = logging.Formatter("%(message)s")
         handler.setFormatter(formatter)
 
-        self.logger.addHandler(handler)
+        self._console_handler = handler
+        self._handlers.append(handler)
 
     def _setup_file_handler(self) -> None:
         """Setup file handler with rotation"""
@@ -101,7 +299,7 @@ class Logger:
             timestamp = self.session_start.strftime("%Y%m%d_%H%M%S")
             log_file = self.log_dir / f"{self.name}_{timestamp}.log"
 
-            handler = logging.FileHandler(log_file, encoding="utf-8")
+            handler = _BufferedFileHandler(log_file, encoding="utf-8")
             handler.setLevel(self.file_level.value)
 
             # Detailed formatter for files
@@ -111,16 +309,37 @@ class Logger:
             )
             handler.setFormatter(formatter)
 
-            self.logger.addHandler(handler)
+            self._file_handler = handler
+            self._handlers.append(handler)
             self.log_file = log_file
 
             # Clean up old log files (keep last 10)
-            self._cleanup_old_logs()
+            self._maybe_cleanup_old_logs()
 
         except Exception as e:
             # If file logging fails, continue with console only
             console.print(f"[yellow][!] Could not setup file logging: {e}[/yellow]")
             self.log_file = None
+            self._file_setup_failed = True
+
+    def _update_logger_level(self) -> None:
+        """Drop records no handler would emit before they are formatted"""
+        self.logger.setLevel(min(self.console_level.value, self.file_level.value))
+
+    def _maybe_cleanup_old_logs(self) -> None:
+        """Run retention cleanup unless it already ran within the interval"""
+        marker = self.log_dir / LOG_CLEANUP_MARKER.format(name=self.name)
+        try:
+            if time.time() - marker.stat().st_mtime < LOG_CLEANUP_INTERVAL:
+                return
+        except OSError:
+            pass  # No marker yet
+
+        self._cleanup_old_logs()
+        try:
+            marker.touch()
+        except OSError:
+            pass
 
     def _cleanup_old_logs(self, keep_count: int = 10) -> None:
         """Clean up old log files"""
@@ -168,10 +387,12 @@ class Logger:
 
     def success(self, message: str, **kwargs) -> None:
         """Log success message (info level with special formatting)"""
+        self.log_counts["info"] += 1
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         # Use rich markup for success messages
         success_msg = f"[green]{symbols.checkmark} {message}[/green]"
         self.logger.info(success_msg, **kwargs)
-        self.log_counts["info"] += 1
 
     def step(self, step: int, total: int, message: str, **kwargs) -> None:
         """Log step progress"""
@@ -242,23 +463,39 @@ class Logger:
     def set_console_level(self, level: LogLevel) -> None:
         """Change console logging level"""
         self.console_level = level
-        if self.logger.handlers:
-            self.logger.handlers[0].setLevel(level.value)
+        if self._console_handler is not None:
+            self._console_handler.setLevel(level.value)
+        self._update_logger_level()
 
     def set_file_level(self, level: LogLevel) -> None:
         """Change file logging level"""
         self.file_level = level
-        if len(self.logger.handlers) > 1:
-            self.logger.handlers[1].setLevel(level.value)
+        if self._file_handler is not None:
+            self._file_handler.setLevel(level.value)
+        self._update_logger_level()
 
     def flush(self) -> None:
-        """Flush all handlers"""
-        for handler in self.logger.handlers:
-            if hasattr(handler, "flush"):
-                handler.flush()
+        """Wait until every queued record has been written"""
+        if self._listener._thread is not None:
+            self._queue.join()
+
+    def stop(self) -> None:
+        """Drain the queue and close handlers without logging a summary"""
+        for handler in self.logger.handlers[:]:
+            if isinstance(handler, _RecordQueueHandler):
+                self.logger.removeHandler(handler)
+        self._listener.stop()
+        for handler in self._handlers:
+            handler.close()
+        _active_loggers.discard(self)
 
     def close(self) -> None:
         """Close logger and handlers"""
+        if self._listener._thread is None:
+            # Nothing was logged; don't create a log file just for a summary
+            self.stop()
+            return
+
         self.section("Installation Session Complete")
         stats = self.get_statistics()
 
@@ -272,10 +509,7 @@ class Logger:
         if stats["log_file"]:
             self.info(f"Full log saved to: {stats['log_file']}")
 
-        # Close all handlers
-        for handler in self.logger.handlers[:]:
-            handler.close()
-            self.logger.removeHandler(handler)
+        self.stop()
 
 
 # Global logger instance
@@ -287,6 +521,8 @@ def get_logger(name: str = "superclaude") -> Logger:
     global _global_logger
 
     if _global_logger is None or _global_logger.name != name:
+        if _global_logger is not None:
+            _global_logger.stop()
         _global_logger = Logger(name)
 
     return _global_logger
@@ -300,10 +536,24 @@ def setup_logging(
 ) -> Logger:
     """Setup logging with specified configuration"""
     global _global_logger
+    if _global_logger is not None:
+        _global_logger.stop()
     _global_logger = Logger(name, log_dir, console_level, file_level)
     return _global_logger
 
 
+def wait_for_pending_logs() -> None:
+    """Wait until every running logger has written its queued records"""
+    for logger in list(_active_loggers):
+        logger.flush()
+
+
+@atexit.register
+def _drain_loggers_at_exit() -> None:
+    for logger in list(_active_loggers):
+        logger.stop()
+
+
 # Convenience functions using global logger
 def debug(message: str, **kwargs) -> None:
     """Log debug message using global logger"""
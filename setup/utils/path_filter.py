@@ -0,0 +1,103 @@
+"""
+gitignore-style path filtering for SuperClaude backups
+"""
+
+import re
+from typing import Iterable, List, Pattern, Tuple
+
+
+class PathFilter:
+    """Ordered exclude rules with gitignore pattern semantics
+
+    - A trailing "/" only matches directories
+    - A pattern containing "/" is anchored to the root, otherwise it matches
+      a name at any depth
+    - "*" and "?" stay within one path segment, "**" spans segments
+    - A leading "!" re-includes paths excluded by earlier rules; the last
+      matching rule wins
+
+    As with git, a path inside an excluded directory cannot be re-included,
+    so tree walks should prune excluded directories instead of testing their
+    contents.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        """
+        Initialize path filter
+
+        Args:
+            patterns: Rules in priority order (later rules override earlier)
+        """
+        self.patterns = [
+            pattern.strip()
+            for pattern in patterns
+            if pattern.strip() and not pattern.lstrip().startswith("#")
+        ]
+        self._rules: List[Tuple[Pattern, bool, bool]] = [
+            self._compile(pattern) for pattern in self.patterns
+        ]
+
+    def is_excluded(self, rel_path: str, is_dir: bool = False) -> bool:
+        """
+        Check whether a path is excluded
+
+        Args:
+            rel_path: POSIX path relative to the filtered root
+            is_dir: Whether the path is a directory
+
+        Returns:
+            True if the last matching rule excludes the path
+        """
+        excluded = False
+        for regex, negate, dir_only in self._rules:
+            if dir_only and not is_dir:
+                continue
+            if regex.match(rel_path):
+                excluded = not negate
+        return excluded
+
+    @staticmethod
+    def _compile(pattern: str) -> Tuple[Pattern, bool, bool]:
+        negate = pattern.startswith("!")
+        if negate:
+            pattern = pattern[1:]
+
+        dir_only = pattern.endswith("/")
+        pattern = pattern.rstrip("/")
+        anchored = "/" in pattern
+        pattern = pattern.lstrip("/")
+
+        body = _translate(pattern)
+        prefix = "" if anchored else "(?:.*/)?"
+        return re.compile(f"^{prefix}{body}$", re.DOTALL), negate, dir_only
+
+
+def _translate(pattern: str) -> str:
+    """Translate a glob with gitignore wildcards into a regex body"""
+    parts = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if pattern.startswith("**/", i):
+            parts.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            parts.append(".*")
+            i += 2
+        elif char == "*":
+            parts.append("[^/]*")
+            i += 1
+        elif char == "?":
+            parts.append("[^/]")
+            i += 1
+        elif char == "[" and "]" in pattern[i + 1 :]:
+            end = pattern.index("]", i + 1)
+            body = pattern[i + 1 : end].replace("\\", "\\\\")
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            parts.append(f"[{body}]")
+            i = end + 1
+        else:
+            parts.append(re.escape(char))
+            i += 1
+    return "".join(parts)
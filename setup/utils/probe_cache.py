@@ -0,0 +1,152 @@
+"""
+Persistent tool-probe cache for SuperClaude validation
+Stores tool version probe results across CLI invocations
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from .paths import get_home_directory
+
+
+class ProbeCache:
+    """On-disk cache of tool probe results keyed on the resolved toolchain"""
+
+    CACHE_FILE = get_home_directory() / ".claude" / ".probe_cache.json"
+    TTL = 7 * 86400  # 7 days in seconds
+    FORMAT_VERSION = 1
+
+    def __init__(self, cache_file: Optional[Path] = None, ttl: Optional[float] = None):
+        """
+        Initialize probe cache
+
+        Args:
+            cache_file: Cache file location (defaults to ~/.claude/.probe_cache.json)
+            ttl: Maximum age of a cached result in seconds
+        """
+        self.cache_file = cache_file or self.CACHE_FILE
+        self.ttl = self.TTL if ttl is None else ttl
+        self._entries: Optional[Dict[str, Any]] = None
+        self._lock = threading.Lock()
+
+    def fingerprint(self, executable: str) -> Optional[Dict[str, Any]]:
+        """
+        Fingerprint an executable without spawning it
+
+        Args:
+            executable: Command name or path to resolve
+
+        Returns:
+            Dict of resolved path, mtime, size and PATH, or None if not found
+        """
+        resolved = shutil.which(executable)
+        if resolved is None:
+            return None
+
+        try:
+            stat_result = Path(resolved).resolve().stat()
+        except OSError:
+            return None
+
+        return {
+            "path": resolved,
+            "mtime": stat_result.st_mtime,
+            "size": stat_result.st_size,
+            "env_path": os.environ.get("PATH", ""),
+        }
+
+    def get(self, key: str, executable: str) -> Optional[Tuple[bool, str]]:
+        """
+        Get a cached probe result if the toolchain is unchanged
+
+        Args:
+            key: Probe cache key
+            executable: Executable the probe runs
+
+        Returns:
+            Cached (success, message) tuple, or None on miss
+        """
+        entry = self._load().get(key)
+        if not entry:
+            return None
+
+        if time.time() - entry.get("timestamp", 0) > self.ttl:
+            return None
+
+        if entry.get("fingerprint") != self.fingerprint(executable):
+            return None
+
+        success, message = entry["result"]
+        return bool(success), message
+
+    def set(self, key: str, executable: str, result: Tuple[bool, str]) -> None:
+        """
+        Store a probe result for the current toolchain
+
+        Args:
+            key: Probe cache key
+            executable: Executable the probe ran
+            result: (success, message) tuple to cache
+        """
+        fingerprint = self.fingerprint(executable)
+        if fingerprint is None:
+            return  # Nothing stable to key on
+
+        # Probes may finish concurrently (see Validator.diagnose_system)
+        with self._lock:
+            entries = self._load()
+            entries[key] = {
+                "fingerprint": fingerprint,
+                "result": list(result),
+                "timestamp": time.time(),
+            }
+            self._save(entries)
+
+    def clear(self) -> None:
+        """Remove all cached probe results"""
+        with self._lock:
+            self._entries = {}
+            try:
+                self.cache_file.unlink()
+            except OSError:
+                pass
+
+    def _load(self) -> Dict[str, Any]:
+        """Load cache entries from disk once per instance"""
+        if self._entries is None:
+            self._entries = {}
+            try:
+                with open(self.cache_file, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get("version") == self.FORMAT_VERSION:
+                    self._entries = data.get("entries", {})
+            except (OSError, ValueError, AttributeError):
+                pass  # Missing or corrupt cache is just a miss
+
+        return self._entries
+
+    def _save(self, entries: Dict[str, Any]) -> None:
+        """Atomically write cache entries to disk"""
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(
+                dir=str(self.cache_file.parent), prefix=".probe_cache", suffix=".tmp"
+            )
+        except OSError:
+            return  # Caching is best-effort
+
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"version": self.FORMAT_VERSION, "entries": entries}, f)
+            os.replace(temp_path, self.cache_file)
+        except OSError:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
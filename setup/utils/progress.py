@@ -0,0 +1,204 @@
+"""
+Progress events for install, update and uninstall operations
+Emitters (Installer, components) report what happened; renderers decide how
+and how often to draw it
+"""
+
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, Optional, TextIO
+
+from .ui import format_size
+
+COMPONENT_STARTED = "component_started"
+COMPONENT_FINISHED = "component_finished"
+FILE_DONE = "file_done"
+
+# Environment variables set by common CI systems
+CI_ENVIRONMENT_VARIABLES = ("CI", "GITHUB_ACTIONS", "BUILDKITE", "GITLAB_CI", "TF_BUILD")
+
+
+class ProgressEvent:
+    """A single progress report"""
+
+    __slots__ = ("kind", "component", "ok", "files", "nbytes", "total_files", "message")
+
+    def __init__(
+        self,
+        kind: str,
+        component: str,
+        ok: Optional[bool] = None,
+        files: int = 0,
+        nbytes: int = 0,
+        total_files: Optional[int] = None,
+        message: str = "",
+    ):
+        """
+        Initialize progress event
+
+        Args:
+            kind: COMPONENT_STARTED, COMPONENT_FINISHED or FILE_DONE
+            component: Component the event belongs to
+            ok: Outcome for COMPONENT_FINISHED
+            files: Files completed by this event
+            nbytes: Bytes copied or removed by this event
+            total_files: Files the component expects to process (when started)
+            message: Optional detail such as a file name
+        """
+        self.kind = kind
+        self.component = component
+        self.ok = ok
+        self.files = files
+        self.nbytes = nbytes
+        self.total_files = total_files
+        self.message = message
+
+    def __repr__(self) -> str:
+        return f"ProgressEvent({self.kind!r}, {self.component!r})"
+
+
+ProgressCallback = Callable[[ProgressEvent], None]
+
+
+class LineProgressRenderer:
+    """Compact one-line-per-component output for pipes, logs and CI"""
+
+    def __init__(self, action: str, total: int, stream: Optional[TextIO] = None):
+        """
+        Initialize line renderer
+
+        Args:
+            action: Verb shown in each line (e.g. "Installing")
+            total: Number of components in the operation
+            stream: Output stream (defaults to stdout)
+        """
+        self.action = action
+        self.total = total
+        self.stream = stream or sys.stdout
+        self.done = 0
+        self._stats: Dict[str, Dict[str, Any]] = {}
+
+    def __call__(self, event: ProgressEvent) -> None:
+        stats = self._stats.setdefault(
+            event.component, {"files": 0, "bytes": 0, "start": time.monotonic()}
+        )
+
+        if event.kind == COMPONENT_STARTED:
+            stats["start"] = time.monotonic()
+        elif event.kind == FILE_DONE:
+            stats["files"] += event.files
+            stats["bytes"] += event.nbytes
+        elif event.kind == COMPONENT_FINISHED:
+            self.done += 1
+            elapsed = time.monotonic() - stats["start"]
+            status = "ok" if event.ok else "failed"
+            detail = ""
+            if stats["files"]:
+                detail = f"{stats['files']} files, {format_size(stats['bytes'])}, "
+            self.stream.write(
+                f"[{self.done}/{self.total}] {self.action} {event.component}: "
+                f"{status} ({detail}{elapsed:.1f}s)\n"
+            )
+            self.stream.flush()
+
+    def __enter__(self) -> "LineProgressRenderer":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        pass
+
+
+class RichProgressRenderer:
+    """Live progress bars for interactive terminals
+
+    Events only update counters; rich redraws on its own timer, so frequent
+    per-file events never cost a terminal write each.
+    """
+
+    REFRESH_PER_SECOND = 10
+
+    def __init__(self, action: str, total: int, console=None):
+        """
+        Initialize rich renderer
+
+        Args:
+            action: Verb shown in the overall bar (e.g. "Installing")
+            total: Number of components in the operation
+            console: Rich console to draw on (defaults to the logger's)
+        """
+        from rich.progress import (
+            BarColumn,
+            MofNCompleteColumn,
+            Progress,
+            SpinnerColumn,
+            TextColumn,
+            TimeElapsedColumn,
+        )
+
+        if console is None:
+            from .logger import console
+
+        self.action = action
+        self.progress = Progress(
+            SpinnerColumn(),
+            TextColumn("{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            TimeElapsedColumn(),
+            console=console,
+            refresh_per_second=self.REFRESH_PER_SECOND,
+            transient=True,
+        )
+        self.overall = self.progress.add_task(f"{action} components", total=total)
+        self._component_tasks: Dict[str, Any] = {}
+
+    def __call__(self, event: ProgressEvent) -> None:
+        task = self._component_tasks.get(event.component)
+
+        if event.kind == COMPONENT_STARTED:
+            self._component_tasks[event.component] = self.progress.add_task(
+                f"  {event.component}", total=event.total_files or None
+            )
+        elif event.kind == FILE_DONE and task is not None:
+            self.progress.advance(task, event.files)
+        elif event.kind == COMPONENT_FINISHED:
+            if task is not None:
+                self.progress.remove_task(task)
+                del self._component_tasks[event.component]
+            self.progress.advance(self.overall)
+
+    def __enter__(self) -> "RichProgressRenderer":
+        self.progress.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.progress.stop()
+
+
+def is_interactive(stream: Optional[TextIO] = None) -> bool:
+    """Check whether live progress can be drawn on stream"""
+    stream = stream or sys.stdout
+    if any(os.environ.get(name) for name in CI_ENVIRONMENT_VARIABLES):
+        return False
+    try:
+        return stream.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+
+def create_progress_renderer(action: str, total: int, stream: Optional[TextIO] = None):
+    """
+    Pick a progress renderer for the current output
+
+    Args:
+        action: Verb describing the operation (e.g. "Installing")
+        total: Number of components in the operation
+        stream: Output stream checked for a terminal (defaults to stdout)
+
+    Returns:
+        Context manager that is also a ProgressCallback
+    """
+    if is_interactive(stream):
+        return RichProgressRenderer(action, total)
+    return LineProgressRenderer(action, total, stream)
@@ -0,0 +1,206 @@
+"""
+Span tracing for SuperClaude operations
+
+Set SUPERCLAUDE_TRACE to a file path to record how long install, update,
+uninstall and PM init steps take. Spans are written as Chrome Trace Event
+"complete" events, loadable in chrome://tracing or Perfetto:
+
+- a path ending in ".jsonl" gets one event per line, appended, so many runs
+  (or machines) can share a file
+- any other path gets a {"traceEvents": [...]} JSON document, replaced on
+  each run
+
+"{pid}" in the path is replaced by the process id. Events are buffered in
+memory and written at interpreter exit or on flush(). With the variable
+unset, span() and traced() cost one attribute check.
+"""
+
+import atexit
+import functools
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+TRACE_ENV = "SUPERCLAUDE_TRACE"
+
+
+class Tracer:
+    """Collects completed spans and exports them as trace events"""
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialize tracer
+
+        Args:
+            path: Output file; tracing is disabled when empty
+        """
+        self.path = Path(path.replace("{pid}", str(os.getpid()))) if path else None
+        self.enabled = self.path is not None
+        self.pid = os.getpid()
+        self.events: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        # Anchor the monotonic clock to the epoch so traces from several
+        # processes line up when merged
+        self._epoch_offset_ns = time.time_ns() - time.perf_counter_ns()
+
+    def now_us(self) -> float:
+        """Current time in trace microseconds"""
+        return (time.perf_counter_ns() + self._epoch_offset_ns) / 1000
+
+    def add_span(
+        self, name: str, category: str, start_us: float, args: Dict[str, Any]
+    ) -> None:
+        """Record a finished span that started at start_us"""
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": start_us,
+            "dur": self.now_us() - start_us,
+            "pid": self.pid,
+            "tid": threading.get_ident(),
+        }
+        if args:
+            event["args"] = args
+        with self._lock:
+            self.events.append(event)
+
+    def flush(self) -> None:
+        """Write buffered events to the trace file"""
+        if not self.enabled:
+            return
+        with self._lock:
+            events, self.events = self.events, []
+        if not events:
+            return
+
+        events.insert(0, self._process_name_event())
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            if self.path.suffix == ".jsonl":
+                lines = "".join(json.dumps(event, default=str) + "\n" for event in events)
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(lines)
+            else:
+                self._write_document(events)
+        except OSError as e:
+            sys.stderr.write(f"Could not write trace to {self.path}: {e}\n")
+
+    def _write_document(self, events: List[Dict[str, Any]]) -> None:
+        """Replace the trace file with a JSON trace document"""
+        fd, temp_path = tempfile.mkstemp(
+            dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"traceEvents": events, "displayTimeUnit": "ms"}, f, default=str
+                )
+            os.replace(temp_path, self.path)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+
+    def _process_name_event(self) -> Dict[str, Any]:
+        return {
+            "name": "process_name",
+            "ph": "M",
+            "pid": self.pid,
+            "tid": 0,
+            "args": {"name": " ".join(["superclaude"] + sys.argv[1:3])},
+        }
+
+
+_tracer = Tracer(os.environ.get(TRACE_ENV))
+
+
+def get_tracer() -> Tracer:
+    """Get the process-wide tracer"""
+    return _tracer
+
+
+def configure(path: Optional[str]) -> Tracer:
+    """
+    Replace the process-wide tracer, flushing the current one
+
+    Args:
+        path: Output file, or None to disable tracing
+
+    Returns:
+        The new tracer
+    """
+    global _tracer
+    _tracer.flush()
+    _tracer = Tracer(path)
+    return _tracer
+
+
+@contextmanager
+def span(name: str, category: str = "superclaude", **args: Any) -> Iterator[Dict[str, Any]]:
+    """
+    Time a block as a trace span
+
+    Args:
+        name: Span name
+        category: Trace category used for filtering in viewers
+        **args: Details attached to the span
+
+    Yields:
+        The span's args dict; entries added inside the block are recorded
+    """
+    tracer = _tracer
+    if not tracer.enabled:
+        yield args
+        return
+
+    start = tracer.now_us()
+    try:
+        yield args
+    except BaseException as e:
+        args["error"] = type(e).__name__
+        raise
+    finally:
+        tracer.add_span(name, category, start, args)
+
+
+def traced(
+    name: Optional[str] = None, category: str = "superclaude"
+) -> Callable[[Callable], Callable]:
+    """
+    Decorator recording each call of a function as a span
+
+    Args:
+        name: Span name (defaults to the function's qualified name)
+        category: Trace category
+
+    Returns:
+        Decorator
+    """
+
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _tracer.enabled:
+                return func(*args, **kwargs)
+            with span(span_name, category):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+@atexit.register
+def _flush_at_exit() -> None:
+    _tracer.flush()
@@ -1,15 +1,20 @@
 """
 Auto-update checker for SuperClaude Framework
 Checks PyPI for newer versions and offers automatic updates
+
+The PyPI query and installation-method detection run in a detached process
+(`python -m setup.utils.updater --refresh`) that writes its verdict to the
+cache file; commands only read that cache, so they never wait on the network.
 """
 
 import os
 import sys
 import json
+import tempfile
 import time
 import subprocess
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from packaging import version
 import urllib.request
 import urllib.error
@@ -26,18 +31,62 @@ class UpdateChecker:
     PYPI_URL = "https://pypi.org/pypi/superclaude/json"
     CACHE_FILE = get_home_directory() / ".claude" / ".update_check"
     CHECK_INTERVAL = 86400  # 24 hours in seconds
+    RETRY_INTERVAL = 3600  # Wait before re-spawning a refresh that didn't finish
     TIMEOUT = 2  # seconds
 
-    def __init__(self, current_version: str):
+    def __init__(
+        self,
+        current_version: str,
+        cache_file: Optional[Path] = None,
+        pypi_url: Optional[str] = None,
+    ):
         """
         Initialize update checker
 
         Args:
             current_version: Current installed version
+            cache_file: Verdict cache (defaults to ~/.claude/.update_check)
+            pypi_url: PyPI JSON endpoint (overridable for testing)
         """
         self.current_version = current_version
+        self.cache_file = Path(cache_file) if cache_file else self.CACHE_FILE
+        self.pypi_url = pypi_url or self.PYPI_URL
         self.logger = get_logger()
 
+    def read_cache(self) -> Dict[str, Any]:
+        """
+        Read the cached verdict written by the last refresh
+
+        Returns:
+            Cache dict (empty if missing or unreadable)
+        """
+        try:
+            with open(self.cache_file, "r") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def write_cache(self, updates: Dict[str, Any]) -> None:
+        """Merge updates into the cache file atomically"""
+        data = self.read_cache()
+        data.update(updates)
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+
+        fd, temp_path = tempfile.mkstemp(
+            dir=self.cache_file.parent, prefix=".update_check.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f)
+            os.replace(temp_path, self.cache_file)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+
     def should_check_update(self, force: bool = False) -> bool:
         """
         Determine if we should check for updates based on last check time
@@ -51,39 +100,97 @@ class UpdateChecker:
         if force:
             return True
 
-        if not self.CACHE_FILE.exists():
-            return True
+        data = self.read_cache()
+        now = time.time()
+        if now - data.get("last_check", 0) <= self.CHECK_INTERVAL:
+            return False
+        # A refresh may already be running (or have failed offline)
+        return now - data.get("last_attempt", 0) > self.RETRY_INTERVAL
 
-        try:
-            with open(self.CACHE_FILE, "r") as f:
-                data = json.load(f)
-                last_check = data.get("last_check", 0)
+    def save_check_timestamp(self):
+        """Save the current timestamp as last check time"""
+        self.write_cache({"last_check": time.time()})
 
-            # Check if 24 hours have passed
-            if time.time() - last_check > self.CHECK_INTERVAL:
-                return True
+    def refresh_cache(self) -> bool:
+        """
+        Query PyPI and detect the installation method, caching the verdict
 
-        except (json.JSONDecodeError, KeyError):
-            return True
+        This is the slow part of the check; it normally runs in the detached
+        process started by start_background_refresh().
 
-        return False
+        Returns:
+            True if the latest version was retrieved
+        """
+        self.write_cache({"last_attempt": time.time()})
+        latest = self.get_latest_version()
+        if not latest:
+            return False
 
-    def save_check_timestamp(self):
-        """Save the current timestamp as last check time"""
-        self.CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        self.write_cache(
+            {
+                "last_check": time.time(),
+                "latest_version": latest,
+                "install_method": self.detect_installation_method(),
+            }
+        )
+        return True
 
-        data = {}
-        if self.CACHE_FILE.exists():
-            try:
-                with open(self.CACHE_FILE, "r") as f:
-                    data = json.load(f)
-            except:
-                pass
+    def start_background_refresh(self) -> bool:
+        """
+        Start refresh_cache() in a detached process and return immediately
+
+        Returns:
+            True if the process was started
+        """
+        # Record the attempt first so concurrent commands don't spawn twice
+        self.write_cache({"last_attempt": time.time()})
+
+        command = [
+            sys.executable,
+            "-m",
+            "setup.utils.updater",
+            "--refresh",
+            "--current-version",
+            self.current_version,
+            "--cache-file",
+            str(self.cache_file),
+            "--url",
+            self.pypi_url,
+        ]
+        if os.name == "nt":
+            detach = {
+                "creationflags": subprocess.DETACHED_PROCESS
+                | subprocess.CREATE_NEW_PROCESS_GROUP
+            }
+        else:
+            detach = {"start_new_session": True}
 
-        data["last_check"] = time.time()
+        try:
+            subprocess.Popen(
+                command,
+                # The directory containing the setup package, so -m finds it
+                cwd=Path(__file__).resolve().parents[2],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                **detach,
+            )
+            return True
+        except OSError as e:
+            self.logger.debug(f"Could not start background update check: {e}")
+            return False
 
-        with open(self.CACHE_FILE, "w") as f:
-            json.dump(data, f)
+    def cached_update(self) -> Optional[str]:
+        """
+        Newer version recorded by the last refresh, if any
+
+        Returns:
+            Latest version string if it is newer than the current version
+        """
+        latest = self.read_cache().get("latest_version")
+        if latest and self.compare_versions(latest):
+            return latest
+        return None
 
     def get_latest_version(self) -> Optional[str]:
         """
@@ -95,7 +202,7 @@ class UpdateChecker:
         try:
             # Create request with timeout
             req = urllib.request.Request(
-                self.PYPI_URL, headers={"User-Agent": "superclaude-Updater"}
+                self.pypi_url, headers={"User-Agent": "superclaude-Updater"}
             )
 
             # Set timeout for the request
@@ -177,10 +284,16 @@ class UpdateChecker:
         """
         Get the appropriate update command based on installation method
 
+        Uses the method cached by the last refresh and only probes pip/pipx
+        when none was recorded.
+
         Returns:
             Update command string
         """
-        method = self.detect_installation_method()
+        method = (
+            self.read_cache().get("install_method")
+            or self.detect_installation_method()
+        )
 
         commands = {
             "pipx": "pipx upgrade SuperClaude",
@@ -272,8 +385,12 @@ class UpdateChecker:
         """
         Main method to check for updates and notify user
 
+        Only the cached verdict is read; when it is older than CHECK_INTERVAL
+        a background refresh is started for the next run. force refreshes
+        synchronously instead. The banner is throttled by should_notify.
+
         Args:
-            force: Force check regardless of last check time
+            force: Query PyPI now rather than relying on the cache
             auto_update: Automatically update if available
 
         Returns:
@@ -287,21 +404,17 @@ class UpdateChecker:
         if os.getenv("SUPERCLAUDE_AUTO_UPDATE", "").lower() in ["true", "1", "yes"]:
             auto_update = True
 
-        # Check if enough time has passed
-        if not self.should_check_update(force):
-            return False
+        if force:
+            self.refresh_cache()
+        elif self.should_check_update():
+            self.start_background_refresh()
 
-        # Get latest version
-        latest = self.get_latest_version()
-        if not latest:
+        # Compare versions using the cached verdict
+        latest = self.cached_update()
+        if not latest or not (force or self.should_notify(latest)):
             return False
 
-        # Save timestamp
-        self.save_check_timestamp()
-
-        # Compare versions
-        if not self.compare_versions(latest):
-            return False
+        self.write_cache({"last_notified": time.time(), "notified_version": latest})
 
         # Show banner and potentially update
         if self.show_update_banner(latest, auto_update):
@@ -309,6 +422,24 @@ class UpdateChecker:
 
         return False
 
+    def should_notify(self, latest: str) -> bool:
+        """
+        Check whether the banner for latest is due
+
+        The banner is shown at most once per CHECK_INTERVAL, or sooner when
+        an even newer version has been published since it was last shown.
+
+        Args:
+            latest: Newer version from the cached verdict
+
+        Returns:
+            True if the banner should be shown
+        """
+        data = self.read_cache()
+        if data.get("notified_version") != latest:
+            return True
+        return time.time() - data.get("last_notified", 0) > self.CHECK_INTERVAL
+
 
 def check_for_updates(current_version: str = None, **kwargs) -> bool:
     """
@@ -327,3 +458,22 @@ def check_for_updates(current_version: str = None, **kwargs) -> bool:
         current_version = __version__
     checker = UpdateChecker(current_version)
     return checker.check_and_notify(**kwargs)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point for the detached refresh process"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Refresh the update-check cache")
+    parser.add_argument("--refresh", action="store_true", required=True)
+    parser.add_argument("--current-version", required=True)
+    parser.add_argument("--cache-file", type=Path)
+    parser.add_argument("--url")
+    args = parser.parse_args(argv)
+
+    checker = UpdateChecker(args.current_version, args.cache_file, args.url)
+    return 0 if checker.refresh_cache() else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
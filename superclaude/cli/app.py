@@ -5,12 +5,56 @@ Modern, type-safe command-line interface with rich formatting
 
 import sys
 import typer
+from typer.core import TyperCommand, TyperGroup
 from typing import Optional
-from superclaude.cli._console import console
-from superclaude.cli.commands import install, doctor, config
+
+# Command groups, imported only when invoked: name -> (module, help)
+LAZY_COMMANDS = {
+    "install": ("superclaude.cli.commands.install", "Install SuperClaude components"),
+    "doctor": ("superclaude.cli.commands.doctor", "Diagnose system environment"),
+    "config": ("superclaude.cli.commands.config", "Manage configuration"),
+    "mcp": ("superclaude.cli.commands.mcp", "Inspect registered MCP servers"),
+    "serve": ("superclaude.cli.commands.serve", "Run the SuperClaude daemon"),
+}
+
+
+class LazyCommandGroup(TyperGroup):
+    """Root group whose command modules are imported on first use
+
+    Until a command runs it is a placeholder carrying only its help text, so
+    --help and --version never import rich widgets, setup or the command
+    implementations.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._lazy = set()
+        for name, (_, help_text) in LAZY_COMMANDS.items():
+            if name not in self.commands:
+                self.commands[name] = TyperCommand(name=name, help=help_text)
+                self._lazy.add(name)
+
+    def resolve_command(self, ctx, args):
+        if args and args[0] in self._lazy:
+            self._load_command(args[0])
+        return super().resolve_command(ctx, args)
+
+    def _load_command(self, name: str) -> None:
+        """Replace a placeholder with the real command group"""
+        module_name, help_text = LAZY_COMMANDS[name]
+        # __import__ rather than importlib so -X importtime reports it
+        module = __import__(module_name, fromlist=["app"])
+
+        # Build the group exactly as add_typer on the root app would
+        wrapper = typer.Typer()
+        wrapper.add_typer(module.app, name=name, help=help_text)
+        self.commands[name] = typer.main.get_command(wrapper).commands[name]
+        self._lazy.discard(name)
+
 
 # Create root typer app
 app = typer.Typer(
+    cls=LazyCommandGroup,
     name="superclaude",
     help="SuperClaude Framework CLI - AI-enhanced development framework for Claude Code",
     add_completion=False,  # Disable shell completion for now
@@ -18,16 +62,13 @@ app = typer.Typer(
     pretty_exceptions_enable=True,  # Rich exception formatting
 )
 
-# Register command groups
-app.add_typer(install.app, name="install", help="Install SuperClaude components")
-app.add_typer(doctor.app, name="doctor", help="Diagnose system environment")
-app.add_typer(config.app, name="config", help="Manage configuration")
-
 
 def version_callback(value: bool):
     """Show version and exit"""
     if value:
         from superclaude import __version__
+        from superclaude.cli._console import console
+
         console.print(f"[bold cyan]SuperClaude[/bold cyan] version [green]{__version__}[/green]")
         raise typer.Exit()
 
@@ -57,9 +98,13 @@ def cli_main():
     try:
         app()
     except KeyboardInterrupt:
+        from superclaude.cli._console import console
+
         console.print("\n[yellow]Operation cancelled by user[/yellow]")
         sys.exit(130)
     except Exception as e:
+        from superclaude.cli._console import console
+
         console.print(f"[bold red]Unhandled error:[/bold red] {e}")
         if "--debug" in sys.argv or "--verbose" in sys.argv:
             console.print_exception()
@@ -0,0 +1,123 @@
+"""
+Thin client for the SuperClaude daemon (`superclaude serve`)
+
+Uses only the standard library so hooks can query a warm daemon without
+importing typer, rich or the installer:
+
+    python -m superclaude.cli.client status
+    python -m superclaude.cli.client doctor --refresh
+    python -m superclaude.cli.client pm_init --cwd /path/to/repo
+    python -m superclaude.cli.client install_check --install-dir ~/.claude/superclaude
+
+Exit codes: 0 success, 1 the daemon reported an error, 2 no daemon running.
+"""
+
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+SOCKET_ENV = "SUPERCLAUDE_SOCKET"
+DAEMON_OPERATIONS = ("doctor", "pm_init", "status", "install_check", "shutdown")
+REQUEST_TIMEOUT = 60  # Seconds; pm_init may scan a large repository
+
+
+def default_socket_path() -> Path:
+    """Socket path from SUPERCLAUDE_SOCKET, else ~/.claude/superclaude.sock"""
+    override = os.environ.get(SOCKET_ENV)
+    if override:
+        return Path(override).expanduser()
+    return Path.home() / ".claude" / "superclaude.sock"
+
+
+def request(
+    op: str,
+    params: Optional[Dict[str, Any]] = None,
+    socket_path: Optional[Path] = None,
+    timeout: float = REQUEST_TIMEOUT,
+) -> Dict[str, Any]:
+    """
+    Send one request to the daemon
+
+    Args:
+        op: Operation name (see DAEMON_OPERATIONS)
+        params: Operation parameters
+        socket_path: Daemon socket (defaults to default_socket_path())
+        timeout: Seconds to wait for the response
+
+    Returns:
+        Response dict: {"ok": True, "result": ...} or {"ok": False, "error": ...}
+
+    Raises:
+        OSError: If no daemon is listening on the socket
+    """
+    path = str(socket_path or default_socket_path())
+    payload = json.dumps({"op": op, "params": params or {}}) + "\n"
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(path)
+        sock.sendall(payload.encode("utf-8"))
+        with sock.makefile("rb") as reader:
+            line = reader.readline()
+
+    if not line:
+        raise ConnectionError(f"Daemon at {path} closed the connection")
+    return json.loads(line)
+
+
+def is_running(socket_path: Optional[Path] = None) -> bool:
+    """Check whether a daemon answers on the socket"""
+    try:
+        return request("status", socket_path=socket_path, timeout=2)["ok"]
+    except (OSError, ValueError):
+        return False
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point"""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="python -m superclaude.cli.client",
+        description="Query a running `superclaude serve` daemon",
+    )
+    parser.add_argument("op", choices=DAEMON_OPERATIONS)
+    parser.add_argument("--socket", type=Path, help="Daemon socket path")
+    parser.add_argument("--cwd", help="Working directory for pm_init")
+    parser.add_argument("--install-dir", help="Installation directory for install_check")
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Re-probe tools for doctor instead of using cached results",
+    )
+    args = parser.parse_args(argv)
+
+    params = {}
+    if args.op == "pm_init":
+        params["cwd"] = args.cwd or os.getcwd()
+    if args.op == "doctor" and args.refresh:
+        params["refresh"] = True
+    if args.install_dir:
+        params["install_dir"] = args.install_dir
+
+    try:
+        response = request(args.op, params, args.socket)
+    except OSError as e:
+        sys.stderr.write(
+            f"SuperClaude daemon is not running ({e}); "
+            "start it with `superclaude serve --detach`\n"
+        )
+        return 2
+
+    if not response.get("ok"):
+        sys.stderr.write(f"Error: {response.get('error')}\n")
+        return 1
+    sys.stdout.write(json.dumps(response.get("result"), indent=2, default=str) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
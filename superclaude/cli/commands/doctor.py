@@ -109,6 +109,27 @@ def run_diagnostics() -> dict:
     return results
 
 
+def check_tools(validator) -> dict:
+    """
+    Probe the Node.js and Claude CLI installations
+
+    Args:
+        validator: setup Validator; its on-disk probe cache is reused unless it
+            was created with refresh=True
+
+    Returns:
+        Dict in the same format as run_diagnostics()
+    """
+    results = {}
+    for label, check in (
+        ("Node.js", validator.check_node),
+        ("Claude CLI", validator.check_claude_cli),
+    ):
+        ok, message = check()
+        results[label] = {"status": ok, "message": message}
+    return results
+
+
 @app.callback(invoke_without_command=True)
 def run(
     ctx: typer.Context,
@@ -117,7 +138,12 @@ def run(
         "--verbose",
         "-v",
         help="Show detailed diagnostic information",
-    )
+    ),
+    refresh: bool = typer.Option(
+        False,
+        "--refresh",
+        help="Ignore cached tool probe results and re-check installed tools",
+    ),
 ):
     """
     Run system diagnostics and check environment
@@ -127,7 +153,7 @@ def run(
     - Python version compatibility
     - File system permissions
     - Available disk space
-    - Required tools (git, uv)
+    - Required tools (git, uv, Node.js, Claude CLI)
     - Installed SuperClaude components
     """
     if ctx.invoked_subcommand is not None:
@@ -141,7 +167,10 @@ def run(
     )
 
     # Run diagnostics
+    from setup.core.validator import Validator
+
     results = run_diagnostics()
+    results.update(check_tools(Validator(refresh=refresh)))
 
     # Create rich table
     table = Table(title="\nDiagnostic Results", show_header=True, header_style="bold cyan")
@@ -201,6 +230,12 @@ def run(
         if not results.get("UV package manager (recommended)", {}).get("status"):
             console.print("  • Install UV: https://docs.astral.sh/uv/")
 
+        if not results["Node.js"]["status"]:
+            console.print("  • Install Node.js: https://nodejs.org/")
+
+        if not results["Claude CLI"]["status"]:
+            console.print("  • Install Claude CLI: npm install -g @anthropic-ai/claude-code")
+
         console.print("\n[dim]After addressing issues, run [bold]superclaude doctor[/bold] again[/dim]")
 
         raise typer.Exit(1)
@@ -3,7 +3,7 @@ SuperClaude install command - Modern interactive installation with rich UI
 """
 
 import typer
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 from pathlib import Path
 from rich.panel import Panel
 from rich.prompt import Confirm
@@ -54,6 +54,11 @@ def install_callback(
         "-v",
         help="Verbose output with detailed logging",
     ),
+    check: bool = typer.Option(
+        False,
+        "--check",
+        help="Report whether installed components are up to date and exit",
+    ),
 ):
     """
     Install SuperClaude with all recommended components (default behavior)
@@ -65,6 +70,10 @@ def install_callback(
     if ctx.invoked_subcommand is not None:
         return
 
+    if check:
+        _show_installation_check(check_installation(install_dir))
+        return
+
     # Otherwise, run the full installation
     _run_installation(non_interactive, profile, install_dir, force, dry_run, verbose)
 
@@ -117,6 +126,83 @@ def install_all(
     _run_installation(non_interactive, profile, install_dir, force, dry_run, verbose)
 
 
+def check_installation(
+    install_dir: Path,
+    registry=None,
+    installed: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> Dict[str, Any]:
+    """
+    Compare installed component versions with the ones this package ships
+
+    Args:
+        install_dir: Installation directory to inspect
+        registry: Discovered ComponentRegistry (created if not given)
+        installed: Installed components from metadata (read if not given)
+
+    Returns:
+        Dict with per-component status and an overall up_to_date flag
+    """
+    from setup import PROJECT_ROOT
+    from setup.core.registry import ComponentRegistry
+    from setup.services.settings import SettingsService
+
+    if registry is None:
+        registry = ComponentRegistry(PROJECT_ROOT / "setup" / "components")
+        registry.discover_components()
+    if installed is None:
+        installed = SettingsService(install_dir).get_installed_components()
+
+    components = {}
+    for name in registry.list_components():
+        available = (registry.get_component_metadata(name) or {}).get("version")
+        info = installed.get(name)
+        installed_version = info.get("version") if info else None
+        components[name] = {
+            "installed": info is not None,
+            "installed_version": installed_version,
+            "available_version": available,
+            "up_to_date": info is not None and installed_version == available,
+        }
+
+    installed_components = [c for c in components.values() if c["installed"]]
+    return {
+        "install_dir": str(install_dir),
+        "components": components,
+        "up_to_date": bool(installed_components)
+        and all(c["up_to_date"] for c in installed_components),
+    }
+
+
+def _show_installation_check(report: Dict[str, Any]) -> None:
+    """Print an installation check report, exiting 1 if anything is stale"""
+    from rich.table import Table
+
+    table = Table(title=f"Installation check: {report['install_dir']}")
+    table.add_column("Component", style="cyan")
+    table.add_column("Installed")
+    table.add_column("Available")
+    table.add_column("Status")
+
+    for name, status in sorted(report["components"].items()):
+        if not status["installed"]:
+            state = "[dim]not installed[/dim]"
+        elif status["up_to_date"]:
+            state = "[green]up to date[/green]"
+        else:
+            state = "[yellow]outdated[/yellow]"
+        table.add_row(
+            name,
+            status["installed_version"] or "-",
+            status["available_version"] or "-",
+            state,
+        )
+    console.print(table)
+
+    if not report["up_to_date"]:
+        console.print("[yellow]Run [bold]superclaude install[/bold] to update[/yellow]")
+        raise typer.Exit(1)
+
+
 def _run_installation(
     non_interactive: bool,
     profile: Optional[str],
@@ -0,0 +1,310 @@
+"""
+SuperClaude mcp command - Inspect registered MCP servers
+"""
+
+import json
+import os
+import queue
+import statistics
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import typer
+from rich.table import Table
+from superclaude.cli._console import console
+
+app = typer.Typer(name="mcp", help="Inspect registered MCP servers")
+
+MCP_PROTOCOL_VERSION = "2024-11-05"
+
+
+def _initialize_request() -> bytes:
+    """Build the JSON-RPC initialize request sent to each server"""
+    from superclaude import __version__
+
+    request = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "initialize",
+        "params": {
+            "protocolVersion": MCP_PROTOCOL_VERSION,
+            "capabilities": {},
+            "clientInfo": {"name": "superclaude-probe", "version": __version__},
+        },
+    }
+    return (json.dumps(request) + "\n").encode("utf-8")
+
+
+def _stop(process: subprocess.Popen) -> None:
+    """Close stdin and terminate a probed server"""
+    try:
+        process.stdin.close()
+    except OSError:
+        pass
+
+    process.terminate()
+    try:
+        process.wait(timeout=2)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+def probe_server(entry: Dict[str, Any], timeout: float = 10.0) -> Dict[str, Any]:
+    """
+    Start a stdio MCP server once and perform the initialize handshake
+
+    Args:
+        entry: Server config entry with command, args and env
+        timeout: Deadline for the whole probe in seconds
+
+    Returns:
+        Dict with ok, startup_ms (spawn to the first line the server writes,
+        which may be the initialize response; None if it wrote nothing),
+        handshake_ms (initialize request to response), server (serverInfo)
+        and error
+    """
+    result: Dict[str, Any] = {
+        "ok": False,
+        "startup_ms": None,
+        "handshake_ms": None,
+        "server": None,
+        "error": None,
+    }
+    deadline = time.monotonic() + timeout
+
+    env = dict(os.environ)
+    env.update({str(k): str(v) for k, v in entry.get("env", {}).items()})
+
+    start = time.monotonic()
+    try:
+        process = subprocess.Popen(
+            [entry["command"]] + [str(arg) for arg in entry.get("args", [])],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env=env,
+        )
+    except OSError as e:
+        result["error"] = f"Failed to start: {e}"
+        return result
+
+    # Read stdout on a thread so the deadline also covers a silent server
+    lines: "queue.Queue[bytes]" = queue.Queue()
+    first_output: List[float] = []
+
+    def read_stdout() -> None:
+        try:
+            for line in iter(process.stdout.readline, b""):
+                if not first_output:
+                    first_output.append(time.monotonic())
+                lines.put(line)
+        finally:
+            process.stdout.close()
+            lines.put(b"")  # EOF
+
+    reader = threading.Thread(target=read_stdout, daemon=True)
+    reader.start()
+
+    try:
+        sent = time.monotonic()
+        process.stdin.write(_initialize_request())
+        process.stdin.flush()
+
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise queue.Empty
+            line = lines.get(timeout=remaining)
+            if not line:
+                result["error"] = f"Exited with code {process.wait()} before responding"
+                return result
+
+            try:
+                message = json.loads(line)
+            except ValueError:
+                continue  # Servers sometimes log to stdout; ignore non-JSON lines
+
+            if not isinstance(message, dict) or message.get("id") != 1:
+                continue  # Notifications or unrelated traffic
+
+            result["handshake_ms"] = (time.monotonic() - sent) * 1000
+            if "error" in message:
+                error = message["error"]
+                if isinstance(error, dict):
+                    error = error.get("message")
+                result["error"] = str(error or "initialize failed")
+            else:
+                result["ok"] = True
+                response = message.get("result")
+                if isinstance(response, dict):
+                    result["server"] = response.get("serverInfo")
+            return result
+
+    except queue.Empty:
+        result["error"] = f"No initialize response within {timeout:g}s"
+        return result
+    except OSError as e:
+        result["error"] = f"Could not send initialize: {e}"
+        return result
+    finally:
+        _stop(process)
+        # The reader closes stdout once the pipe reaches EOF
+        reader.join(timeout=1)
+        if first_output:
+            result["startup_ms"] = (first_output[0] - start) * 1000
+
+
+def probe_servers(
+    servers: Dict[str, Dict[str, Any]],
+    runs: int = 1,
+    timeout: float = 10.0,
+    jobs: int = 8,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Probe servers concurrently, running each one `runs` times in sequence
+
+    Args:
+        servers: Server name -> config entry
+        runs: Number of probes per server
+        timeout: Deadline per probe in seconds
+        jobs: Maximum number of servers probed at once
+
+    Returns:
+        Dict of server name -> summary with ok, runs, failures, startup and
+        handshake {p50, max} in ms, server info and errors
+    """
+
+    def probe_repeatedly(entry: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return [probe_server(entry, timeout) for _ in range(runs)]
+
+    with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(servers) or 1))) as executor:
+        futures = {
+            name: executor.submit(probe_repeatedly, entry)
+            for name, entry in servers.items()
+        }
+        samples = {name: future.result() for name, future in futures.items()}
+
+    return {name: _summarize(results) for name, results in samples.items()}
+
+
+def _summarize(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Aggregate probe results into p50/max latencies and failure counts"""
+
+    def stats(key: str) -> Optional[Dict[str, float]]:
+        values = [r[key] for r in results if r["ok"] and r[key] is not None]
+        if not values:
+            return None
+        return {"p50": statistics.median(values), "max": max(values)}
+
+    failures = [r for r in results if not r["ok"]]
+    servers = [r["server"] for r in results if r["server"]]
+    return {
+        "ok": not failures,
+        "runs": len(results),
+        "failures": len(failures),
+        "startup": stats("startup_ms"),
+        "handshake": stats("handshake_ms"),
+        "server": servers[0] if servers else None,
+        "errors": sorted({r["error"] for r in failures}),
+    }
+
+
+def load_stdio_servers(config_file: Optional[Path] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Load stdio MCP server entries from Claude's config
+
+    Args:
+        config_file: Config file to read (defaults to ~/.claude.json)
+
+    Returns:
+        Server name -> config entry for servers launched via a command
+    """
+    from setup.services.mcp_config import MCPConfigService
+
+    servers = MCPConfigService(config_file).read_servers() or {}
+    return {
+        name: entry
+        for name, entry in servers.items()
+        if entry.get("command") and entry.get("type", "stdio") == "stdio"
+    }
+
+
+def _format_latency(values: Optional[Dict[str, float]]) -> str:
+    if values is None:
+        return "-"
+    return f"{values['p50']:.0f} / {values['max']:.0f}"
+
+
+@app.command("probe")
+def probe(
+    servers: Optional[List[str]] = typer.Argument(
+        None, help="Server names to probe (default: all stdio servers)"
+    ),
+    runs: int = typer.Option(1, "--runs", "-n", min=1, help="Probes per server"),
+    timeout: float = typer.Option(
+        10.0, "--timeout", help="Deadline per probe in seconds"
+    ),
+    jobs: int = typer.Option(8, "--jobs", "-j", min=1, help="Servers probed at once"),
+    config_file: Optional[Path] = typer.Option(
+        None, "--config", help="Claude config file (default: ~/.claude.json)"
+    ),
+):
+    """
+    Start each registered stdio MCP server and check it answers `initialize`
+
+    Reports startup (spawn to first output) and handshake latency (p50 / max
+    over the runs)
+    and any servers that fail to start or respond before the deadline.
+    """
+    configured = load_stdio_servers(config_file)
+    if servers:
+        unknown = [name for name in servers if name not in configured]
+        if unknown:
+            console.print(
+                f"[red]Unknown or non-stdio MCP servers:[/red] {', '.join(unknown)}"
+            )
+            raise typer.Exit(1)
+        configured = {name: configured[name] for name in servers}
+
+    if not configured:
+        console.print("[yellow]No stdio MCP servers registered[/yellow]")
+        raise typer.Exit(0)
+
+    console.print(
+        f"[cyan]Probing {len(configured)} MCP server(s), {runs} run(s) each...[/cyan]"
+    )
+    summaries = probe_servers(configured, runs=runs, timeout=timeout, jobs=jobs)
+
+    table = Table(title="\nMCP Server Probe", show_header=True, header_style="bold cyan")
+    table.add_column("Server", style="cyan")
+    table.add_column("Status", width=10)
+    table.add_column("Startup ms (p50 / max)", justify="right")
+    table.add_column("Handshake ms (p50 / max)", justify="right")
+    table.add_column("Details", style="dim")
+
+    for name, summary in summaries.items():
+        if summary["ok"]:
+            status = "[green]✓ OK[/green]"
+            info = summary["server"] or {}
+            details = f"{info.get('name', '')} {info.get('version', '')}".strip()
+        else:
+            status = f"[red]✗ {summary['failures']}/{summary['runs']}[/red]"
+            details = "; ".join(summary["errors"])
+
+        table.add_row(
+            name,
+            status,
+            _format_latency(summary["startup"]),
+            _format_latency(summary["handshake"]),
+            details,
+        )
+
+    console.print(table)
+
+    if not all(summary["ok"] for summary in summaries.values()):
+        raise typer.Exit(1)
@@ -0,0 +1,115 @@
+"""
+SuperClaude serve command - Run the background daemon for editor hooks
+"""
+
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+import typer
+from superclaude.cli._console import console
+from superclaude.cli.client import default_socket_path, is_running, request
+
+app = typer.Typer(name="serve", help="Run the SuperClaude daemon on a Unix socket")
+
+DETACH_WAIT = 10.0  # Seconds to wait for a detached daemon to answer
+
+
+@app.callback(invoke_without_command=True)
+def serve(
+    ctx: typer.Context,
+    socket_path: Optional[Path] = typer.Option(
+        None,
+        "--socket",
+        help="Socket path (default: $SUPERCLAUDE_SOCKET or ~/.claude/superclaude.sock)",
+    ),
+    idle_timeout: float = typer.Option(
+        15 * 60,
+        "--idle-timeout",
+        help="Exit after this many seconds without requests",
+    ),
+    detach: bool = typer.Option(
+        False,
+        "--detach",
+        help="Start the daemon in the background and return once it answers",
+    ),
+    status: bool = typer.Option(False, "--status", help="Show daemon status and exit"),
+    stop: bool = typer.Option(False, "--stop", help="Stop a running daemon"),
+):
+    """
+    Keep the registry, settings, validator and PM state warm between calls
+
+    Clients (see `python -m superclaude.cli.client`) send doctor, pm_init,
+    status and install_check requests over the socket. The daemon exits on
+    its own after --idle-timeout seconds without requests.
+    """
+    if ctx.invoked_subcommand is not None:
+        return
+    if not hasattr(socket, "AF_UNIX"):
+        console.print("[red]Unix domain sockets are not available on this platform[/red]")
+        raise typer.Exit(1)
+
+    socket_path = socket_path or default_socket_path()
+
+    if status or stop:
+        try:
+            response = request("shutdown" if stop else "status", socket_path=socket_path)
+        except OSError:
+            console.print(f"[yellow]No daemon running on {socket_path}[/yellow]")
+            raise typer.Exit(1)
+        if stop:
+            console.print("[green]Daemon stopped[/green]")
+        else:
+            for key, value in response.get("result", {}).items():
+                console.print(f"[cyan]{key}:[/cyan] {value}")
+        return
+
+    if detach:
+        _start_detached(socket_path, idle_timeout)
+        return
+
+    from superclaude.cli.daemon import serve as run_daemon
+
+    try:
+        console.print(f"[cyan]Serving on {socket_path}[/cyan] (idle timeout {idle_timeout:g}s)")
+        run_daemon(socket_path, idle_timeout=idle_timeout)
+    except RuntimeError as e:
+        console.print(f"[yellow]{e}[/yellow]")
+        raise typer.Exit(1)
+
+
+def _start_detached(socket_path: Path, idle_timeout: float) -> None:
+    """Launch the daemon in a new session and wait until it answers"""
+    if is_running(socket_path):
+        console.print(f"[green]Daemon already running on {socket_path}[/green]")
+        return
+
+    subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "superclaude",
+            "serve",
+            "--socket",
+            str(socket_path),
+            "--idle-timeout",
+            str(idle_timeout),
+        ],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+    deadline = time.monotonic() + DETACH_WAIT
+    while time.monotonic() < deadline:
+        if is_running(socket_path):
+            console.print(f"[green]Daemon started on {socket_path}[/green]")
+            return
+        time.sleep(0.05)
+
+    console.print(f"[red]Daemon did not start on {socket_path}[/red]")
+    raise typer.Exit(1)
@@ -0,0 +1,358 @@
+"""
+SuperClaude daemon - answers doctor, PM init, status and install checks over
+a Unix domain socket with warm caches
+
+Each connection carries one newline-terminated JSON request,
+{"op": ..., "params": {...}}, and gets one JSON response line back (see
+superclaude.cli.client). The daemon exits after it has been idle for
+idle_timeout seconds.
+"""
+
+import json
+import os
+import socket
+import socketserver
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+IDLE_TIMEOUT = 15 * 60  # Seconds without requests before the daemon exits
+CACHE_TTL = 60  # Seconds before validator results and PM state are refreshed
+MAX_REQUEST_BYTES = 64 * 1024
+
+
+class DaemonState:
+    """Registry, settings, validator and PM state kept warm between requests"""
+
+    def __init__(self, cache_ttl: float = CACHE_TTL):
+        """
+        Initialize daemon state
+
+        Args:
+            cache_ttl: Seconds before validator and PM results are recomputed
+        """
+        self.cache_ttl = cache_ttl
+        self.started = time.time()
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._registry = None
+        self._validator = None
+        self._validator_created = 0.0
+        # install_dir -> (metadata mtime_ns, installed components)
+        self._installed: Dict[str, Tuple[Optional[int], Dict[str, Any]]] = {}
+        # cwd -> (computed at, file stamps, initialization result)
+        self._pm_state: Dict[str, Tuple[float, Tuple, Dict[str, Any]]] = {}
+        self._handlers: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+            "doctor": self.doctor,
+            "pm_init": self.pm_init,
+            "status": self.status,
+            "install_check": self.install_check,
+        }
+
+    def handle(self, op: str, params: Dict[str, Any]) -> Any:
+        """
+        Run one operation
+
+        Args:
+            op: Operation name
+            params: Operation parameters
+
+        Returns:
+            JSON-serializable result
+
+        Raises:
+            ValueError: If the operation is unknown
+        """
+        handler = self._handlers.get(op)
+        if handler is None:
+            raise ValueError(f"Unknown operation: {op}")
+        with self._lock:
+            self.requests += 1
+        return handler(params)
+
+    def registry(self):
+        """Discovered component registry, built on first use"""
+        with self._lock:
+            if self._registry is None:
+                from setup import PROJECT_ROOT
+                from setup.core.registry import ComponentRegistry
+
+                registry = ComponentRegistry(PROJECT_ROOT / "setup" / "components")
+                registry.discover_components()
+                self._registry = registry
+            return self._registry
+
+    def validator(self, refresh: bool = False):
+        """
+        Shared Validator whose in-memory results expire after cache_ttl
+
+        Args:
+            refresh: Drop the shared results and return a Validator that
+                re-probes every tool, bypassing the on-disk probe cache
+        """
+        from setup.core.validator import Validator
+
+        with self._lock:
+            now = time.time()
+            if self._validator is None:
+                self._validator = Validator()
+                self._validator_created = now
+            elif refresh or now - self._validator_created > self.cache_ttl:
+                self._validator.validation_cache.clear()
+                self._validator_created = now
+            if refresh:
+                # Its fresh probes are persisted for the shared validator
+                return Validator(refresh=True)
+            return self._validator
+
+    def installed_components(self, install_dir: Path) -> Dict[str, Any]:
+        """Installed components, re-read only when the metadata file changes"""
+        from setup.services.settings import SettingsService
+
+        settings = SettingsService(install_dir)
+        try:
+            stamp = settings.metadata_file.stat().st_mtime_ns
+        except OSError:
+            stamp = None
+
+        key = str(install_dir)
+        with self._lock:
+            cached = self._installed.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        installed = settings.get_installed_components() if stamp is not None else {}
+        with self._lock:
+            self._installed[key] = (stamp, installed)
+        return installed
+
+    def doctor(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """`superclaude doctor` checks plus cached tool probes ("refresh" re-probes)"""
+        from superclaude.cli.commands.doctor import check_tools, run_diagnostics
+
+        results = run_diagnostics()
+        validator = self.validator(refresh=bool(params.get("refresh")))
+        results.update(check_tools(validator))
+
+        install_dir = Path(params.get("install_dir") or _default_install_dir())
+        installed = self.installed_components(install_dir)
+        results["SuperClaude Components"] = {
+            "status": bool(installed),
+            "message": ", ".join(sorted(installed)) or "None installed",
+        }
+        return results
+
+    def pm_init(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """PM Mode initialization, reused while the project files are unchanged"""
+        from superclaude.core.pm_init import initialize_pm_mode
+
+        cwd = str(Path(params.get("cwd") or os.getcwd()).resolve())
+        now = time.time()
+        with self._lock:
+            cached = self._pm_state.get(cwd)
+        if cached is not None:
+            computed_at, stamps, result = cached
+            if now - computed_at < self.cache_ttl and stamps == _pm_stamps(result):
+                return result
+
+        result = initialize_pm_mode(Path(cwd))
+        with self._lock:
+            self._pm_state[cwd] = (now, _pm_stamps(result), result)
+        return result
+
+    def status(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Daemon process and cache summary"""
+        from superclaude import __version__
+
+        with self._lock:
+            return {
+                "pid": os.getpid(),
+                "version": __version__,
+                "uptime_seconds": round(time.time() - self.started, 1),
+                "requests": self.requests,
+                "registry_loaded": self._registry is not None,
+                "cached_install_dirs": sorted(self._installed),
+                "cached_pm_projects": sorted(self._pm_state),
+            }
+
+    def install_check(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """`superclaude install --check` using the warm registry and metadata"""
+        from superclaude.cli.commands.install import check_installation
+
+        install_dir = Path(params.get("install_dir") or _default_install_dir())
+        return check_installation(
+            install_dir,
+            registry=self.registry(),
+            installed=self.installed_components(install_dir),
+        )
+
+
+def _default_install_dir() -> Path:
+    from setup import DEFAULT_INSTALL_DIR
+
+    return DEFAULT_INSTALL_DIR
+
+
+def _pm_stamps(result: Dict[str, Any]) -> Tuple:
+    """mtimes of the files a PM initialization result was built from"""
+    git_root = result.get("git_root")
+    if not git_root:
+        return ()
+    memory_dir = Path(git_root) / "docs" / "memory"
+    stamps = []
+    for path in (
+        memory_dir / "context-contract.yaml",
+        memory_dir / "reflexion.jsonl",
+        Path(git_root) / "pyproject.toml",
+        Path(git_root) / "package.json",
+    ):
+        try:
+            stamps.append(path.stat().st_mtime_ns)
+        except OSError:
+            stamps.append(None)
+    return tuple(stamps)
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Reads one JSON request line and writes one JSON response line"""
+
+    def handle(self) -> None:
+        server: DaemonServer = self.server
+        server.request_started()
+        try:
+            line = self.rfile.readline(MAX_REQUEST_BYTES)
+            if not line:
+                return  # Liveness probe
+            try:
+                message = json.loads(line)
+                op = message.get("op")
+                if op == "shutdown":
+                    threading.Thread(target=server.shutdown, daemon=True).start()
+                    response = {"ok": True, "result": "shutting down"}
+                else:
+                    result = server.state.handle(op, message.get("params") or {})
+                    response = {"ok": True, "result": result}
+            except Exception as e:
+                response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+            try:
+                self.wfile.write(
+                    (json.dumps(response, default=str) + "\n").encode("utf-8")
+                )
+            except OSError:
+                pass  # Client went away
+        finally:
+            server.request_finished()
+
+
+class DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Threaded Unix socket server that shuts itself down when idle"""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        socket_path: Path,
+        state: Optional[DaemonState] = None,
+        idle_timeout: float = IDLE_TIMEOUT,
+    ):
+        """
+        Initialize and bind the server
+
+        Args:
+            socket_path: Unix socket to listen on (created with mode 0600)
+            state: Shared daemon state (created if not given)
+            idle_timeout: Seconds without requests before shutting down
+
+        Raises:
+            RuntimeError: If another daemon already answers on socket_path
+        """
+        self.socket_path = Path(socket_path)
+        self.state = state or DaemonState()
+        self.idle_timeout = idle_timeout
+        self._activity_lock = threading.Lock()
+        self._active = 0
+        self._last_activity = time.monotonic()
+
+        _claim_socket_path(self.socket_path)
+        old_umask = os.umask(0o177)
+        try:
+            super().__init__(str(self.socket_path), _RequestHandler)
+        finally:
+            os.umask(old_umask)
+        self._inode = os.stat(self.socket_path).st_ino
+
+    def request_started(self) -> None:
+        with self._activity_lock:
+            self._active += 1
+            self._last_activity = time.monotonic()
+
+    def request_finished(self) -> None:
+        with self._activity_lock:
+            self._active -= 1
+            self._last_activity = time.monotonic()
+
+    def idle_for(self) -> float:
+        """Seconds since the last request ended (0 while one is running)"""
+        with self._activity_lock:
+            if self._active:
+                return 0.0
+            return time.monotonic() - self._last_activity
+
+    def serve_until_idle(self) -> None:
+        """Serve requests until idle_timeout passes without any"""
+        stop = threading.Event()
+
+        def watch_idle() -> None:
+            interval = max(0.05, min(self.idle_timeout / 4, 5.0))
+            while not stop.wait(interval):
+                if self.idle_for() >= self.idle_timeout:
+                    self.shutdown()
+                    return
+
+        watcher = threading.Thread(target=watch_idle, daemon=True)
+        watcher.start()
+        try:
+            self.serve_forever(poll_interval=0.2)
+        finally:
+            stop.set()
+            self.server_close()
+
+    def server_close(self) -> None:
+        super().server_close()
+        # Only remove the socket if it is still ours
+        try:
+            if os.stat(self.socket_path).st_ino == self._inode:
+                self.socket_path.unlink()
+        except OSError:
+            pass
+
+
+def _claim_socket_path(socket_path: Path) -> None:
+    """Remove a stale socket file, refusing if a daemon still answers on it"""
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    if not socket_path.exists():
+        return
+
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(str(socket_path))
+    except OSError:
+        socket_path.unlink()
+        return
+    finally:
+        probe.close()
+    raise RuntimeError(f"A SuperClaude daemon is already running on {socket_path}")
+
+
+def serve(socket_path: Path, idle_timeout: float = IDLE_TIMEOUT) -> None:
+    """
+    Run the daemon in the foreground until it has been idle for idle_timeout
+
+    Args:
+        socket_path: Unix socket to listen on
+        idle_timeout: Seconds without requests before exiting
+    """
+    server = DaemonServer(socket_path, idle_timeout=idle_timeout)
+    server.serve_until_idle()
+
@@ -9,6 +9,7 @@ Runs automatically at session start to:
 
 import os
 import subprocess
+import threading
 from pathlib import Path
 from typing import Optional, Dict, Any
 import yaml
@@ -16,6 +17,119 @@ import yaml
 from .context_contract import ContextContract
 from .reflexion_memory import ReflexionMemory
 
+# Environment variables that change how git locates the repository; when any
+# is set, defer to git itself instead of walking the filesystem
+GIT_LOCATION_ENV = ("GIT_DIR", "GIT_WORK_TREE", "GIT_CEILING_DIRECTORIES")
+
+# Resolved cwd -> git root, so repeated session starts and daemon requests
+# skip the walk. Misses are not cached: a directory can become a repository
+# at any time, and the walk that finds nothing is cheap
+_git_root_cache: Dict[Path, Path] = {}
+_git_root_lock = threading.Lock()
+
+_UNDETERMINED = object()
+
+
+def find_git_root(cwd: Path) -> Optional[Path]:
+    """
+    Find the working tree root containing cwd, like `git rev-parse --show-toplevel`
+
+    Walks parent directories in-process and only runs git when the layout
+    can't be interpreted directly. Roots are cached per directory and
+    dropped once their `.git` disappears.
+
+    Args:
+        cwd: Directory to start from
+
+    Returns:
+        Repository root, or None outside a Git working tree
+    """
+    try:
+        key = Path(cwd).resolve()
+    except OSError:
+        key = Path(cwd).absolute()
+
+    with _git_root_lock:
+        cached = _git_root_cache.get(key)
+    if cached is not None and (cached / ".git").exists():
+        return cached
+
+    root = _walk_for_git_root(key)
+    if root is _UNDETERMINED:
+        root = _git_root_from_subprocess(key)
+
+    with _git_root_lock:
+        if root is None:
+            _git_root_cache.pop(key, None)
+        else:
+            _git_root_cache[key] = root
+    return root
+
+
+def clear_git_root_cache() -> None:
+    """Forget cached git roots (e.g. after `git init` in a watched directory)"""
+    with _git_root_lock:
+        _git_root_cache.clear()
+
+
+def _walk_for_git_root(start: Path):
+    """
+    Look for `.git` in start and its parents
+
+    A `.git` directory marks a regular repository; a `.git` file holding
+    `gitdir: <path>` marks a linked worktree or a submodule, whose working
+    tree is the directory containing that file.
+
+    Returns:
+        Repository root, None if there is none, or _UNDETERMINED when git
+        itself has to decide
+    """
+    if any(os.environ.get(name) for name in GIT_LOCATION_ENV):
+        return _UNDETERMINED
+    if ".git" in start.parts:
+        return _UNDETERMINED  # Inside a git directory, not a working tree
+
+    for directory in (start, *start.parents):
+        dot_git = directory / ".git"
+        try:
+            if dot_git.is_dir():
+                return directory if (dot_git / "HEAD").is_file() else _UNDETERMINED
+            if dot_git.is_file():
+                return directory if _read_gitdir(dot_git) else _UNDETERMINED
+        except OSError:
+            return _UNDETERMINED
+    return None
+
+
+def _read_gitdir(dot_git: Path) -> Optional[Path]:
+    """Resolve the `gitdir:` pointer of a worktree or submodule `.git` file"""
+    try:
+        content = dot_git.read_text(encoding="utf-8").strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+    if not content.startswith("gitdir:"):
+        return None
+    # Relative paths (used by submodules) are relative to the .git file
+    gitdir = dot_git.parent / content[len("gitdir:"):].strip()
+    return gitdir if (gitdir / "HEAD").is_file() else None
+
+
+def _git_root_from_subprocess(cwd: Path) -> Optional[Path]:
+    """Ask git for the working tree root"""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--show-toplevel"],
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+            check=False
+        )
+        if result.returncode == 0 and result.stdout.strip():
+            return Path(result.stdout.strip())
+    except Exception:
+        pass
+    return None
+
 
 class PMInitializer:
     """Initializes PM Mode with project context"""
@@ -27,19 +141,7 @@ class PMInitializer:
 
     def detect_git_root(self) -> Optional[Path]:
         """Detect Git repository root"""
-        try:
-            result = subprocess.run(
-                ["git", "rev-parse", "--show-toplevel"],
-                cwd=self.cwd,
-                capture_output=True,
-                text=True,
-                check=False
-            )
-            if result.returncode == 0:
-                return Path(result.stdout.strip())
-        except Exception:
-            pass
-        return None
+        return find_git_root(self.cwd)
 
     def scan_project_structure(self) -> Dict[str, Any]:
         """Lightweight scan of project structure (paths only, no content)"""
@@ -88,6 +190,18 @@ class PMInitializer:
 
     def initialize(self) -> Dict[str, Any]:
         """Main initialization routine"""
+        # Only pay for the tracing import when SUPERCLAUDE_TRACE is set
+        if os.environ.get("SUPERCLAUDE_TRACE"):
+            from setup.utils.trace import span
+
+            with span("PMInitializer.initialize", "pm_init", cwd=str(self.cwd)) as args:
+                result = self._initialize()
+                args["status"] = result["status"]
+                return result
+        return self._initialize()
+
+    def _initialize(self) -> Dict[str, Any]:
+        """Detect the repository and load its context"""
         # Step 1: Detect Git root
         self.git_root = self.detect_git_root()
         if not self.git_root:
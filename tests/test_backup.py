@@ -0,0 +1,549 @@
+import argparse
+import bz2
+import gzip
+import hashlib
+import io
+import json
+import os
+import tarfile
+import zlib
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+from setup.cli.commands.backup import (
+    cleanup_old_backups,
+    create_backup,
+    list_backups,
+    map_component_files,
+    parse_size,
+    rebuild_catalog,
+    restore_backup,
+    verify_backup,
+    verify_backups,
+)
+from setup.services.backup_catalog import CATALOG_NAME, BackupCatalog
+from setup.services.backup_store import SNAPSHOT_SUFFIX, BackupStore
+from setup.utils.compression import BLOCK_SIZE, ParallelCompressWriter, open_tar_stream
+
+
+def make_args(install_dir, **overrides):
+    values = {
+        "install_dir": install_dir,
+        "backup_dir": None,
+        "name": None,
+        "compress": "gzip",
+        "incremental": False,
+        "compress_threads": 1,
+        "component": None,
+        "path": None,
+        "restore_jobs": 4,
+        "overwrite": False,
+        "dry_run": False,
+        "keep": 5,
+        "older_than": None,
+        "profile": "full",
+        "exclude": None,
+        "max_file_size": None,
+    }
+    values.update(overrides)
+    return argparse.Namespace(**values)
+
+
+@pytest.fixture
+def install_dir(tmp_path):
+    root = tmp_path / ".claude"
+    (root / "modes").mkdir(parents=True)
+    (root / ".superclaude-metadata.json").write_text(
+        json.dumps(
+            {
+                "components": {
+                    "core": {"files": ["CLAUDE.md"]},
+                    "modes": {"files": ["MODE_Brainstorming.md", "MODE_Copy.md"]},
+                }
+            }
+        )
+    )
+    (root / "CLAUDE.md").write_text("# framework\n" * 100)
+    (root / "modes" / "MODE_Brainstorming.md").write_text("brainstorm")
+    (root / "modes" / "MODE_Copy.md").write_text("brainstorm")  # duplicate content
+    (root / "backups").mkdir()
+    return root
+
+
+def blob_count(backup_dir):
+    objects = backup_dir / "objects"
+    return sum(1 for path in objects.rglob("*") if path.is_file())
+
+
+class TestIncrementalBackup:
+    def test_unchanged_files_are_not_stored_again(self, install_dir):
+        backup_dir = install_dir / "backups"
+
+        assert create_backup(make_args(install_dir, name="first", incremental=True))
+        assert blob_count(backup_dir) == 3  # Duplicate content stored once
+
+        assert create_backup(make_args(install_dir, name="second", incremental=True))
+        assert blob_count(backup_dir) == 3
+
+        (install_dir / "CLAUDE.md").write_text("# changed\n")
+        assert create_backup(make_args(install_dir, name="third", incremental=True))
+        assert blob_count(backup_dir) == 4
+
+        backups = list_backups(backup_dir)
+        assert len(backups) == 3
+        assert all(backup["files"] == 4 for backup in backups)
+
+    def test_restore_reassembles_any_snapshot(self, install_dir, tmp_path):
+        backup_dir = install_dir / "backups"
+        assert create_backup(make_args(install_dir, name="before", incremental=True))
+        original = (install_dir / "CLAUDE.md").read_text()
+        (install_dir / "CLAUDE.md").write_text("# changed\n")
+        assert create_backup(make_args(install_dir, name="after", incremental=True))
+
+        snapshot = next(backup_dir.glob(f"before_*{SNAPSHOT_SUFFIX}"))
+        target = tmp_path / "restored"
+        assert restore_backup(snapshot, make_args(target))
+
+        assert (target / "CLAUDE.md").read_text() == original
+        assert (target / "modes" / "MODE_Copy.md").read_text() == "brainstorm"
+        assert not (target / "backups").exists()
+
+    def test_cleanup_collects_unreferenced_blobs(self, install_dir):
+        backup_dir = install_dir / "backups"
+        assert create_backup(make_args(install_dir, name="old", incremental=True))
+        (install_dir / "CLAUDE.md").write_text("# changed\n")
+        assert create_backup(make_args(install_dir, name="new", incremental=True))
+        assert blob_count(backup_dir) == 4
+
+        # Age the blobs past the GC grace period
+        for blob in (backup_dir / "objects").rglob("*"):
+            os.utime(blob, (1, 1))
+
+        old = next(backup_dir.glob(f"old_*{SNAPSHOT_SUFFIX}"))
+        os.utime(old, (1, 1))
+        assert cleanup_old_backups(backup_dir, make_args(install_dir, keep=1))
+
+        assert not old.exists()
+        assert blob_count(backup_dir) == 3
+
+    def test_corrupted_blob_is_not_restored(self, install_dir, tmp_path):
+        backup_dir = install_dir / "backups"
+        assert create_backup(make_args(install_dir, name="snap", incremental=True))
+        snapshot = next(backup_dir.glob(f"*{SNAPSHOT_SUFFIX}"))
+
+        store = BackupStore(backup_dir)
+        digest = store.load_snapshot(snapshot)["files"]["CLAUDE.md"]["sha256"]
+        store.blob_path(digest).write_bytes(zlib.compress(b"tampered"))
+
+        target = tmp_path / "restored"
+        assert restore_backup(snapshot, make_args(target)) is False
+        assert not (target / "CLAUDE.md").exists()
+
+
+@pytest.fixture
+def large_install_dir(install_dir):
+    """Installation spanning several compression blocks"""
+    for index in range(6):
+        (install_dir / f"f{index}.bin").write_bytes(os.urandom(BLOCK_SIZE // 2))
+    return install_dir
+
+
+class TestTarBackup:
+    @pytest.mark.parametrize(
+        "compress,threads,suffix",
+        [("gzip", 1, ".tar.gz"), ("gzip", 4, ".tar.gz"), ("bzip2", 2, ".tar.bz2"),
+         ("none", 1, ".tar")],
+    )
+    def test_archive_round_trip(self, install_dir, tmp_path, compress, threads, suffix):
+        args = make_args(install_dir, compress=compress, compress_threads=threads)
+        assert create_backup(args)
+
+        backup = next((install_dir / "backups").glob(f"*{suffix}"))
+        with tarfile.open(backup) as tar:
+            names = tar.getnames()
+        assert names[0] == "backup_metadata.json"
+        assert names[-1] == "backup_checksums.json"
+        assert sorted(names[1:-1]) == [
+            ".superclaude-metadata.json",
+            "CLAUDE.md",
+            "modes/MODE_Brainstorming.md",
+            "modes/MODE_Copy.md",
+        ]
+
+        target = tmp_path / "restored"
+        assert restore_backup(backup, make_args(target))
+        assert (target / "CLAUDE.md").read_text() == (install_dir / "CLAUDE.md").read_text()
+
+    @pytest.mark.parametrize("method,module", [("gzip", gzip), ("bzip2", bz2)])
+    def test_parallel_writer_output_is_standard(self, method, module):
+        data = os.urandom(50_000) + b"superclaude" * 20_000
+        raw = io.BytesIO()
+
+        with ParallelCompressWriter(raw, method, threads=4, block_size=8192) as writer:
+            for offset in range(0, len(data), 3000):
+                writer.write(data[offset : offset + 3000])
+
+        assert writer.bytes_in == len(data)
+        assert writer.bytes_out == len(raw.getvalue())
+        assert module.decompress(raw.getvalue()) == data
+
+    @pytest.mark.parametrize("compress", ["gzip", "bzip2"])
+    def test_multi_block_archive_round_trip(self, large_install_dir, tmp_path, compress):
+        args = make_args(large_install_dir, compress=compress, compress_threads=4)
+        assert create_backup(args)
+        backup = list_backups(large_install_dir / "backups")[0]["path"]
+
+        with open_tar_stream(backup) as tar:
+            assert len([member for member in tar if member.isfile()]) == 12
+        assert verify_backup(backup) == (10, [])
+
+        target = tmp_path / "restored"
+        assert restore_backup(backup, make_args(target))
+        for index in range(6):
+            name = f"f{index}.bin"
+            assert (target / name).read_bytes() == (large_install_dir / name).read_bytes()
+
+
+    def test_unreadable_archive_aborts_restore(self, large_install_dir, tmp_path):
+        assert create_backup(make_args(large_install_dir, compress_threads=4))
+        backup = list_backups(large_install_dir / "backups")[0]["path"]
+        truncated = tmp_path / "truncated.tar.gz"
+        truncated.write_bytes(backup.read_bytes()[: backup.stat().st_size // 2])
+
+        target = tmp_path / "restored"
+        with patch("setup.cli.commands.backup.get_logger") as get_logger:
+            assert restore_backup(truncated, make_args(target)) is False
+
+        written = sorted(
+            p.relative_to(target).as_posix() for p in target.rglob("*") if p.is_file()
+        )
+        reported = [
+            call.args[0].strip()
+            for call in get_logger.return_value.warning.call_args_list
+            if call.args[0].startswith("  ")
+        ]
+        assert 0 < len(written) < 10
+        assert reported == written
+        for name in written:
+            assert (target / name).read_bytes() == (large_install_dir / name).read_bytes()
+
+
+class TestSelectiveRestore:
+    @pytest.mark.parametrize("incremental", [False, True])
+    def test_restore_single_component(self, install_dir, tmp_path, incremental):
+        assert create_backup(make_args(install_dir, incremental=incremental))
+        backup = list_backups(install_dir / "backups")[0]["path"]
+
+        target = tmp_path / "restored"
+        assert restore_backup(backup, make_args(target, component=["modes"]))
+
+        restored = sorted(
+            p.relative_to(target).as_posix() for p in target.rglob("*") if p.is_file()
+        )
+        assert restored == ["modes/MODE_Brainstorming.md", "modes/MODE_Copy.md"]
+
+    def test_restore_by_path_prefix_and_glob(self, install_dir, tmp_path):
+        assert create_backup(make_args(install_dir))
+        backup = next((install_dir / "backups").glob("*.tar.gz"))
+
+        target = tmp_path / "restored"
+        assert restore_backup(
+            backup, make_args(target, path=["modes/", "*.md"], restore_jobs=2)
+        )
+
+        assert (target / "CLAUDE.md").exists()
+        assert (target / "modes" / "MODE_Copy.md").exists()
+        assert not (target / ".superclaude-metadata.json").exists()
+
+    def test_same_file_names_mapped_by_install_path(self, tmp_path):
+        install_dir = tmp_path / ".claude"
+        install_dir.mkdir()
+        (install_dir / ".superclaude-metadata.json").write_text(
+            json.dumps(
+                {
+                    "components": {
+                        "agents": {"files": ["README.md"]},
+                        "commands": {
+                            "files": ["README.md"],
+                            "install_directory": str(install_dir / "commands" / "sc"),
+                        },
+                        "modes": {"files": ["README.md"]},
+                    },
+                    "file_manifest": {"agents": {"agents/README.md": "0" * 64}},
+                }
+            )
+        )
+        archived = ["agents/README.md", "commands/sc/README.md", "README.md"]
+
+        mapping = map_component_files(install_dir, archived)
+
+        assert mapping["agents"] == ["agents/README.md"]
+        assert mapping["commands"] == ["commands/sc/README.md"]
+        # No manifest or install directory and the name is ambiguous
+        assert mapping["modes"] == []
+
+    def test_unknown_component_fails_before_writing(self, install_dir, tmp_path):
+        assert create_backup(make_args(install_dir))
+        backup = next((install_dir / "backups").glob("*.tar.gz"))
+
+        target = tmp_path / "restored"
+        assert restore_backup(backup, make_args(target, component=["nope"])) is False
+        assert not target.exists()
+
+    def test_checksum_mismatch_is_not_restored(self, install_dir, tmp_path):
+        backup = tmp_path / "tampered.tar"
+        with tarfile.open(backup, "w") as tar:
+            for name, data, digest in [
+                ("good.md", b"good", hashlib.sha256(b"good").hexdigest()),
+                ("bad.md", b"tampered", hashlib.sha256(b"original").hexdigest()),
+            ]:
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                info.pax_headers = {"SUPERCLAUDE.sha256": digest}
+                tar.addfile(info, io.BytesIO(data))
+
+        target = tmp_path / "restored"
+        assert restore_backup(backup, make_args(target)) is False
+        assert (target / "good.md").read_bytes() == b"good"
+        assert not (target / "bad.md").exists()
+
+
+class TestBackupCatalog:
+    def test_list_reads_catalog_without_opening_archives(self, install_dir):
+        backup_dir = install_dir / "backups"
+        assert create_backup(make_args(install_dir))
+        assert create_backup(make_args(install_dir, incremental=True))
+
+        entries = BackupCatalog(backup_dir).load()
+        archive = next(backup_dir.glob("*.tar.gz"))
+        assert entries[archive.name]["files"] == 4
+        assert entries[archive.name]["sha256"] == hashlib.sha256(
+            archive.read_bytes()
+        ).hexdigest()
+        assert "component_files" not in entries[archive.name]["metadata"]
+
+        with patch("tarfile.open", side_effect=AssertionError("archive opened")):
+            with patch.object(BackupStore, "load_snapshot", side_effect=AssertionError):
+                backups = list_backups(backup_dir)
+
+        assert sorted(b["files"] for b in backups) == [4, 4]
+
+    def test_changed_or_unknown_backups_are_reread(self, install_dir):
+        backup_dir = install_dir / "backups"
+        assert create_backup(make_args(install_dir))
+        archive = next(backup_dir.glob("*.tar.gz"))
+
+        # Replace the archive behind the catalog's back with a smaller one
+        with tarfile.open(archive, "w:gz") as tar:
+            tar.add(install_dir / "CLAUDE.md", arcname="CLAUDE.md")
+        (backup_dir / CATALOG_NAME).unlink()
+        assert create_backup(make_args(install_dir, name="other"))
+
+        backups = {b["path"].name: b for b in list_backups(backup_dir)}
+
+        assert backups[archive.name]["files"] == 1
+        assert BackupCatalog(backup_dir).load()[archive.name]["files"] == 1
+
+    def test_cleanup_prunes_catalog(self, install_dir):
+        backup_dir = install_dir / "backups"
+        for name in ("one", "two"):
+            assert create_backup(make_args(install_dir, name=name))
+
+        assert cleanup_old_backups(backup_dir, make_args(install_dir, keep=1))
+
+        remaining = [path.name for path in backup_dir.glob("*.tar.gz")]
+        assert list(BackupCatalog(backup_dir).load()) == remaining
+
+    def test_rebuild_catalog_from_archives(self, install_dir):
+        backup_dir = install_dir / "backups"
+        assert create_backup(make_args(install_dir))
+        (backup_dir / CATALOG_NAME).write_text("not json")
+
+        assert BackupCatalog(backup_dir).load() == {}
+        assert rebuild_catalog(backup_dir)
+        assert [entry["files"] for entry in BackupCatalog(backup_dir).load().values()] == [4]
+
+
+def archived_names(backup_dir):
+    archive = next(backup_dir.glob("*.tar.gz"))
+    with tarfile.open(archive) as tar:
+        bookkeeping = {"backup_metadata.json", "backup_checksums.json"}
+        return sorted(name for name in tar.getnames() if name not in bookkeeping)
+
+
+class TestBackupProfiles:
+    @pytest.fixture
+    def claude_home(self, install_dir):
+        (install_dir / "settings.json").write_text("{}")
+        (install_dir / "commands" / "sc").mkdir(parents=True)
+        (install_dir / "commands" / "sc" / "analyze.md").write_text("analyze")
+        (install_dir / "projects" / "-home-me").mkdir(parents=True)
+        (install_dir / "projects" / "-home-me" / "session.jsonl").write_text("x" * 4096)
+        (install_dir / "todos").mkdir()
+        (install_dir / "todos" / "todo.json").write_text("[]")
+        (install_dir / "debug.log").write_text("log")
+        return install_dir
+
+    def test_full_profile_keeps_everything(self, claude_home):
+        assert create_backup(make_args(claude_home))
+
+        assert archived_names(claude_home / "backups") == [
+            ".superclaude-metadata.json",
+            "CLAUDE.md",
+            "commands/sc/analyze.md",
+            "debug.log",
+            "modes/MODE_Brainstorming.md",
+            "modes/MODE_Copy.md",
+            "projects/-home-me/session.jsonl",
+            "settings.json",
+            "todos/todo.json",
+        ]
+
+    def test_standard_profile_skips_session_data(self, claude_home):
+        assert create_backup(make_args(claude_home, profile="standard"))
+
+        assert archived_names(claude_home / "backups") == [
+            ".superclaude-metadata.json",
+            "CLAUDE.md",
+            "commands/sc/analyze.md",
+            "modes/MODE_Brainstorming.md",
+            "modes/MODE_Copy.md",
+            "settings.json",
+        ]
+
+    @pytest.mark.parametrize(
+        "profile,expected",
+        [
+            (
+                "framework",
+                [".superclaude-metadata.json", "CLAUDE.md", "commands/sc/analyze.md"],
+            ),
+            ("config", [".superclaude-metadata.json", "CLAUDE.md", "settings.json"]),
+        ],
+    )
+    def test_narrow_profiles(self, claude_home, profile, expected):
+        assert create_backup(make_args(claude_home, profile=profile))
+
+        assert archived_names(claude_home / "backups") == expected
+
+    def test_excludes_size_limit_and_reinclude(self, claude_home):
+        args = make_args(
+            claude_home,
+            profile="standard",
+            exclude=["modes/", "!/projects/"],
+            max_file_size=parse_size("2K"),
+        )
+        assert create_backup(args)
+
+        # projects/ is re-included but its only file is over the size limit
+        assert archived_names(claude_home / "backups") == [
+            ".superclaude-metadata.json",
+            "CLAUDE.md",
+            "commands/sc/analyze.md",
+            "settings.json",
+        ]
+
+    def test_dry_run_writes_nothing(self, claude_home, tmp_path, capsys):
+        backup_dir = tmp_path / "new-backups"
+        args = make_args(
+            claude_home, backup_dir=backup_dir, dry_run=True, profile="standard"
+        )
+
+        assert create_backup(args)
+
+        assert not backup_dir.exists()
+        output = capsys.readouterr().out
+        assert "Files: 6" in output
+        assert "commands/" in output
+        assert "Excluded: /projects/, /todos/" in output
+
+    def test_parse_size(self):
+        assert parse_size("512") == 512
+        assert parse_size("1.5K") == 1536
+        assert parse_size("20MB") == 20 * 1024 * 1024
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_size("lots")
+
+
+def rewrite_archive(source, target, edit):
+    """Copy a tar archive, passing each (info, data) through edit"""
+    with tarfile.open(source) as src, tarfile.open(target, "w") as dst:
+        for member in src.getmembers():
+            data = src.extractfile(member).read()
+            result = edit(member, data)
+            if result is not None:
+                info, data = result
+                info.size = len(data)
+                dst.addfile(info, io.BytesIO(data))
+
+
+class TestVerifyBackup:
+    def test_clean_backups_verify(self, install_dir):
+        backup_dir = install_dir / "backups"
+        assert create_backup(make_args(install_dir))
+        assert create_backup(make_args(install_dir, incremental=True))
+
+        paths = sorted(backup_dir.glob("superclaude_backup_*"))
+        assert [verify_backup(path) for path in paths] == [(4, []), (4, [])]
+        assert verify_backups(paths, jobs=2)
+
+    def test_modified_and_missing_members_detected(self, install_dir, tmp_path):
+        assert create_backup(make_args(install_dir))
+        archive = next((install_dir / "backups").glob("*.tar.gz"))
+
+        def tamper(info, data):
+            if info.name == "CLAUDE.md":
+                info.pax_headers = {}  # Only the checksum list can catch this
+                return info, b"tampered"
+            if info.name == "modes/MODE_Copy.md":
+                return None
+            return info, data
+
+        tampered = tmp_path / "tampered.tar"
+        rewrite_archive(archive, tampered, tamper)
+
+        files_checked, problems = verify_backup(tampered)
+        assert files_checked == 3
+        assert problems == [
+            "modes/MODE_Copy.md: missing from archive",
+            "CLAUDE.md: checksum mismatch",
+        ]
+        assert not verify_backups([tampered, tmp_path / "absent.tar"])
+
+    def test_truncated_archive_reported(self, install_dir, tmp_path):
+        assert create_backup(make_args(install_dir))
+        archive = next((install_dir / "backups").glob("*.tar.gz"))
+        truncated = tmp_path / "truncated.tar.gz"
+        truncated.write_bytes(archive.read_bytes()[:-40])
+
+        _, problems = verify_backup(truncated)
+        assert len(problems) == 1
+        assert problems[0].startswith("archive unreadable")
+
+    def test_parallel_compressed_backup_verifies(self, large_install_dir, tmp_path):
+        assert create_backup(make_args(large_install_dir, compress_threads=4))
+        archive = next((large_install_dir / "backups").glob("*.tar.gz"))
+        truncated = tmp_path / "truncated.tar.gz"
+        truncated.write_bytes(archive.read_bytes()[:-40])
+
+        assert verify_backup(archive) == (10, [])
+        files_checked, problems = verify_backup(truncated)
+        # Read past the first 4 MiB block, up to the damaged last one
+        assert files_checked > 2
+        assert len(problems) == 1
+        assert problems[0].startswith("archive unreadable")
+        assert not verify_backups([archive, truncated], jobs=2)
+
+    def test_corrupted_snapshot_blob_detected(self, install_dir):
+        backup_dir = install_dir / "backups"
+        assert create_backup(make_args(install_dir, incremental=True))
+        snapshot = next(backup_dir.glob(f"*{SNAPSHOT_SUFFIX}"))
+        store = BackupStore(backup_dir)
+        digest = store.load_snapshot(snapshot)["files"]["modes/MODE_Copy.md"]["sha256"]
+        store.blob_path(digest).write_bytes(zlib.compress(b"other"))
+
+        _, problems = verify_backup(snapshot)
+        assert problems == [
+            "modes/MODE_Brainstorming.md: checksum mismatch (corrupted blob)",
+            "modes/MODE_Copy.md: checksum mismatch (corrupted blob)",
+        ]
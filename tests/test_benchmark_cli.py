@@ -0,0 +1,64 @@
+"""
+Tests for the CLI benchmark harness in scripts/benchmark_cli.py
+"""
+
+import importlib.util
+import json
+import pytest
+from pathlib import Path
+
+SCRIPT = Path(__file__).parent.parent / "scripts" / "benchmark_cli.py"
+spec = importlib.util.spec_from_file_location("benchmark_cli", SCRIPT)
+benchmark_cli = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(benchmark_cli)
+
+
+class TestBenchmarkHarness:
+    def test_percentile(self):
+        values = list(range(1, 101))
+        assert benchmark_cli.percentile(values, 0.5) == 50
+        assert benchmark_cli.percentile(values, 0.95) == 95
+        assert benchmark_cli.percentile([7.0], 0.95) == 7.0
+
+    def test_parse_import_times_top_level(self):
+        stderr = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       100 |        100 |   typer.core\n"
+            "import time:       300 |        900 | typer\n"
+            "import time:        50 |       2000 | superclaude.cli.app\n"
+        )
+        assert benchmark_cli.parse_import_times(stderr) == [
+            ("superclaude.cli.app", 2000),
+            ("typer", 900),
+        ]
+
+    @pytest.mark.benchmark
+    def test_budget_is_enforced(self, tmp_path):
+        results = tmp_path / "results.json"
+        argv = ["--runs", "1", "--only", "version", "--json", str(results)]
+
+        assert benchmark_cli.main(argv + ["--budget", "version=0.001"]) == 1
+        assert benchmark_cli.main(argv + ["--budget-scale", "1000"]) == 0
+
+        version = json.loads(results.read_text())["version"]
+        assert version["exit_codes"] == [0]
+        assert version["median_ms"] > 0
+
+    def test_unexpected_exit_code_fails(self, tmp_path, monkeypatch, capsys):
+        results = tmp_path / "results.json"
+        monkeypatch.setitem(
+            benchmark_cli.SCENARIOS, "broken", ("import sys; sys.exit(3)", [])
+        )
+        monkeypatch.setitem(
+            benchmark_cli.SCENARIOS, "expected", ("import sys; sys.exit(2)", [])
+        )
+        monkeypatch.setitem(benchmark_cli.EXPECTED_EXIT_CODES, "expected", 2)
+        argv = ["--runs", "1", "--budget-scale", "1000", "--json", str(results)]
+
+        assert benchmark_cli.main(argv + ["--only", "expected"]) == 0
+        assert benchmark_cli.main(argv + ["--only", "broken"]) == 1
+
+        assert "FAILED (exit 3)" in capsys.readouterr().out
+        broken = json.loads(results.read_text())["broken"]
+        assert broken["exit_codes"] == [3]
+        assert broken["expected_exit_code"] == 0
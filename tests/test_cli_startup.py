@@ -0,0 +1,77 @@
+"""
+Import-time regression tests for the typer CLI entry point
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Cumulative import time allowed for superclaude.cli.app (typer itself is
+# most of it); generous so slow CI machines don't flake
+STARTUP_BUDGET_US = 250_000
+
+# Modules that only the subcommands need
+DEFERRED_MODULES = (
+    "setup",
+    "rich.panel",
+    "rich.progress",
+    "rich.table",
+    "superclaude.cli.commands.install",
+    "superclaude.cli.commands.doctor",
+    "superclaude.cli.commands.config",
+    "superclaude.cli.commands.mcp",
+    "superclaude.cli.commands.serve",
+)
+
+
+def import_times(code):
+    """Run code under -X importtime and return {module: cumulative_us}"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+class TestCLIStartup:
+    def test_import_defers_subcommands(self):
+        times = import_times("import superclaude.cli.app")
+
+        assert not [name for name in DEFERRED_MODULES if name in times]
+        assert times["superclaude.cli.app"] < STARTUP_BUDGET_US
+
+    def test_version_defers_subcommands(self):
+        times = import_times(
+            "import sys\n"
+            "from superclaude.cli.app import app\n"
+            "sys.argv = ['superclaude', '--version']\n"
+            "app()\n"
+        )
+
+        assert not [name for name in DEFERRED_MODULES if name in times]
+
+    def test_subcommand_is_imported_when_run(self):
+        times = import_times(
+            "import sys\n"
+            "from superclaude.cli.app import app\n"
+            "sys.argv = ['superclaude', 'install', '--help']\n"
+            "try:\n"
+            "    app()\n"
+            "except SystemExit:\n"
+            "    pass\n"
+        )
+
+        assert "superclaude.cli.commands.install" in times
+        assert "superclaude.cli.commands.mcp" not in times
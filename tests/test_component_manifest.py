@@ -0,0 +1,114 @@
+"""
+Tests for manifest-driven component uninstall
+"""
+
+import hashlib
+import json
+import pytest
+from setup.components.agents import AgentsComponent
+from setup.components.commands import CommandsComponent
+from setup.services.settings import SettingsService
+from setup.utils.security import SecurityValidator
+
+
+@pytest.fixture
+def install_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("USERPROFILE", str(tmp_path))
+    # tmp_path lives under /tmp, which the installer refuses as a system
+    # directory; containment and traversal checks stay in force
+    monkeypatch.setattr(
+        SecurityValidator,
+        "UNIX_SYSTEM_PATTERNS",
+        [p for p in SecurityValidator.UNIX_SYSTEM_PATTERNS if p != r"^/tmp/"],
+    )
+    monkeypatch.setattr(
+        SecurityValidator, "validate_installation_target", lambda target: (True, [])
+    )
+    root = tmp_path / ".claude"
+    root.mkdir()
+    return root
+
+
+def manifest_of(install_dir, component):
+    metadata = json.loads((install_dir / ".superclaude-metadata.json").read_text())
+    return metadata.get("file_manifest", {}).get(component)
+
+
+class TestComponentManifest:
+    def test_install_records_hashes(self, install_dir):
+        component = AgentsComponent(install_dir)
+        assert component.install({})
+
+        manifest = manifest_of(install_dir, "agents")
+        assert sorted(manifest) == [f"agents/{name}" for name in component.component_files]
+        assert all(len(digest) == 64 for digest in manifest.values())
+
+    def test_uninstall_preserves_user_edits_and_files(self, install_dir):
+        component = AgentsComponent(install_dir)
+        assert component.install({})
+        agents_dir = install_dir / "agents"
+        edited = agents_dir / component.component_files[0]
+        edited.write_text("my tweaks")
+        (agents_dir / "my-agent.md").write_text("mine")
+
+        assert component.uninstall()
+
+        assert sorted(p.name for p in agents_dir.iterdir()) == sorted(
+            [edited.name, "my-agent.md"]
+        )
+        assert edited.read_text() == "my tweaks"
+        assert manifest_of(install_dir, "agents") is None
+
+    def test_uninstall_prunes_emptied_directories(self, install_dir):
+        (install_dir / "commands").mkdir()  # Claude Code creates it
+        component = CommandsComponent(install_dir)
+        assert component.install({})
+        assert (install_dir / "commands" / "sc").is_dir()
+
+        assert component.uninstall()
+
+        assert not (install_dir / "commands").exists()
+
+    def test_uninstall_without_manifest_uses_component_files(self, install_dir):
+        component = AgentsComponent(install_dir)
+        assert component.install({})
+        SettingsService(install_dir).set_file_manifest("agents", None)
+
+        assert component.uninstall()
+
+        assert not (install_dir / "agents").exists()
+
+    def test_manifest_entries_outside_install_dir_are_ignored(self, install_dir):
+        component = AgentsComponent(install_dir)
+        assert component.install({})
+        victim = install_dir.parent / ".bashrc"
+        victim.write_text("export PATH\n")
+        digest = hashlib.sha256(victim.read_bytes()).hexdigest()
+        settings = SettingsService(install_dir)
+        manifest = settings.get_file_manifest("agents")
+        manifest["../.bashrc"] = digest
+        settings.set_file_manifest("agents", manifest)
+
+        assert component.uninstall()
+
+        assert victim.read_text() == "export PATH\n"
+        assert not (install_dir / "agents").exists()
+
+    def test_update_keeps_files_dropped_by_new_version(self, install_dir):
+        component = AgentsComponent(install_dir)
+        assert component.install({})
+        dropped = install_dir / "agents" / "retired-agent.md"
+        dropped.write_text("shipped by an older version")
+        settings = SettingsService(install_dir)
+        manifest = settings.get_file_manifest("agents")
+        manifest["agents/retired-agent.md"] = hashlib.sha256(
+            dropped.read_bytes()
+        ).hexdigest()
+        settings.set_file_manifest("agents", manifest)
+
+        assert component.update({})
+        assert "agents/retired-agent.md" in manifest_of(install_dir, "agents")
+
+        assert component.uninstall()
+        assert not (install_dir / "agents").exists()
@@ -0,0 +1,121 @@
+"""
+Tests for the `superclaude serve` daemon and its thin client
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import threading
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+from superclaude.cli import client
+from superclaude.cli.daemon import DaemonServer, DaemonState
+
+
+@pytest.fixture
+def socket_path():
+    # Unix socket paths are limited to ~100 bytes, so keep the directory short
+    directory = Path(tempfile.mkdtemp(prefix="sc-"))
+    yield directory / "d.sock"
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+@pytest.fixture
+def daemon(socket_path):
+    server = DaemonServer(socket_path, idle_timeout=60)
+    thread = threading.Thread(target=server.serve_until_idle, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    thread.join(5)
+
+
+class TestDaemon:
+    def test_status(self, daemon, socket_path):
+        response = client.request("status", socket_path=socket_path)
+
+        assert response["ok"]
+        assert response["result"]["pid"] == os.getpid()
+        assert oct(os.stat(socket_path).st_mode & 0o777) == "0o600"
+
+    def test_unknown_operation_is_an_error(self, daemon, socket_path):
+        response = client.request("explode", socket_path=socket_path)
+
+        assert not response["ok"]
+        assert "Unknown operation" in response["error"]
+
+    def test_install_check_follows_metadata_changes(self, daemon, socket_path, tmp_path):
+        available = daemon.state.registry().get_component_metadata("modes")["version"]
+        metadata_file = tmp_path / ".superclaude-metadata.json"
+        metadata_file.write_text(
+            json.dumps({"components": {"modes": {"version": available}}})
+        )
+        params = {"install_dir": str(tmp_path)}
+
+        result = client.request("install_check", params, socket_path)["result"]
+        assert result["components"]["modes"]["up_to_date"]
+        assert result["up_to_date"]
+
+        metadata_file.write_text(json.dumps({"components": {"modes": {"version": "0.1"}}}))
+        os.utime(metadata_file, ns=(0, 1))
+        result = client.request("install_check", params, socket_path)["result"]
+        assert not result["components"]["modes"]["up_to_date"]
+        assert not result["up_to_date"]
+
+    def test_doctor_refresh_bypasses_probe_cache(self, daemon, socket_path):
+        used = []
+
+        def check_tools(validator):
+            used.append(validator)
+            return {}
+
+        with patch(
+            "superclaude.cli.commands.doctor.run_diagnostics", return_value={}
+        ), patch("superclaude.cli.commands.doctor.check_tools", check_tools):
+            assert client.request("doctor", socket_path=socket_path)["ok"]
+            assert client.main(["doctor", "--refresh", "--socket", str(socket_path)]) == 0
+            assert client.request("doctor", socket_path=socket_path)["ok"]
+
+        shared, refreshed, after = used
+        assert shared is after and not shared.refresh
+        assert refreshed.refresh
+
+    def test_pm_init_outside_git(self, daemon, socket_path, tmp_path):
+        response = client.request("pm_init", {"cwd": str(tmp_path)}, socket_path)
+
+        assert response["result"]["status"] == "not_git_repo"
+        status = client.request("status", socket_path=socket_path)["result"]
+        assert status["cached_pm_projects"] == [str(tmp_path.resolve())]
+
+    def test_refuses_second_daemon(self, daemon, socket_path):
+        with pytest.raises(RuntimeError):
+            DaemonServer(socket_path)
+
+    def test_shuts_down_when_idle(self, socket_path):
+        server = DaemonServer(socket_path, state=DaemonState(), idle_timeout=0.2)
+        thread = threading.Thread(target=server.serve_until_idle, daemon=True)
+        thread.start()
+
+        thread.join(5)
+        assert not thread.is_alive()
+        assert not socket_path.exists()
+
+    def test_replaces_stale_socket(self, socket_path):
+        socket_path.write_text("")
+        server = DaemonServer(socket_path, idle_timeout=60)
+        server.server_close()
+
+        assert not socket_path.exists()
+
+
+class TestClient:
+    def test_no_daemon(self, socket_path, capsys):
+        assert not client.is_running(socket_path)
+        assert client.main(["status", "--socket", str(socket_path)]) == 2
+        assert "not running" in capsys.readouterr().err
+
+    def test_main_prints_result(self, daemon, socket_path, capsys):
+        assert client.main(["status", "--socket", str(socket_path)]) == 0
+        assert json.loads(capsys.readouterr().out)["requests"] == 1
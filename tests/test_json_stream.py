@@ -0,0 +1,87 @@
+import json
+import pytest
+from setup.utils.json_stream import read_json_keys
+
+
+class TestReadJsonKeys:
+    def _write(self, tmp_path, data):
+        path = tmp_path / "claude.json"
+        path.write_text(data if isinstance(data, str) else json.dumps(data, indent=2))
+        return path
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 64 * 1024])
+    def test_matches_full_parse(self, tmp_path, chunk_size):
+        config = {
+            "numStartups": 12,
+            "projects": {
+                "/home/user/app": {
+                    "history": [
+                        {"display": 'quote " brace } bracket ] \\ back', "n": -1.5e3},
+                        {"display": "unicode é中", "ok": True, "none": None},
+                    ],
+                    "allowedTools": [],
+                }
+            },
+            "mcpServers": {
+                "context7": {"command": "npx", "args": ["-y", "@upstash/context7-mcp"]}
+            },
+            "autoUpdates": False,
+        }
+        path = self._write(tmp_path, config)
+
+        result = read_json_keys(
+            path, ["mcpServers", "autoUpdates", "missing"], chunk_size=chunk_size
+        )
+
+        assert result == {
+            "mcpServers": config["mcpServers"],
+            "autoUpdates": False,
+        }
+
+    def test_stops_after_last_requested_key(self, tmp_path):
+        path = self._write(tmp_path, '{"mcpServers": {}, "projects": {not json')
+
+        assert read_json_keys(path, ["mcpServers"]) == {"mcpServers": {}}
+
+    def test_skips_large_unrequested_values(self, tmp_path):
+        history = [{"display": "x" * 200, "pastedContents": {}}] * 20000
+        path = self._write(
+            tmp_path, {"projects": {"/p": {"history": history}}, "mcpServers": {"a": {}}}
+        )
+
+        assert read_json_keys(path, ["mcpServers"], chunk_size=4096) == {
+            "mcpServers": {"a": {}}
+        }
+
+    @pytest.mark.parametrize("chunk_size", [1, 64 * 1024])
+    def test_nested_key_path(self, tmp_path, chunk_size):
+        history = [{"display": "x" * 200}] * 100
+        config = {
+            "projects": {
+                "/other": {"history": history, "mcpServers": {"b": {}}},
+                "/app": {"history": history, "mcpServers": {"a": {}}},
+                "/scalar": 3,
+            },
+            "mcpServers": {"user": {}},
+        }
+        path = self._write(tmp_path, config)
+
+        result = read_json_keys(
+            path,
+            ["mcpServers", ("projects", "/app", "mcpServers"), ("projects", "/none")],
+            chunk_size=chunk_size,
+        )
+
+        assert result == {
+            "mcpServers": {"user": {}},
+            "projects": {"/app": {"mcpServers": {"a": {}}}},
+        }
+
+    @pytest.mark.parametrize(
+        "data", ["[1, 2]", '{"a": 1', '{"a" 1}', '{"a": 1 "b": 2}', ""]
+    )
+    def test_invalid_input_raises(self, tmp_path, data):
+        path = self._write(tmp_path, data)
+
+        with pytest.raises(json.JSONDecodeError):
+            read_json_keys(path, ["b"])
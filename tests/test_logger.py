@@ -0,0 +1,152 @@
+"""
+Tests for the queue-backed setup logger
+"""
+
+import io
+import logging
+import os
+import sys
+import threading
+import time
+import pytest
+from setup.cli.commands.backup import display_backup_estimate
+from setup.utils import logger as logger_module
+from setup.utils.logger import LOG_CLEANUP_INTERVAL, Logger, LogLevel
+
+
+@pytest.fixture
+def logger(tmp_path):
+    logger = Logger(
+        "superclaude-test", log_dir=tmp_path / "logs", console_level=LogLevel.CRITICAL
+    )
+    yield logger
+    logger.stop()
+
+
+class TestQueuedLogger:
+    def test_flush_writes_file_records(self, logger):
+        for i in range(500):
+            logger.debug(f"Copying file {i}")
+        logger.flush()
+
+        lines = logger.log_file.read_text().splitlines()
+        assert len(lines) == 500
+        assert lines[-1].endswith("Copying file 499")
+
+    def test_close_drains_queue(self, logger):
+        logger.info("last words")
+        logger.close()
+
+        assert "last words" in logger.log_file.read_text()
+
+    def test_caller_does_not_wait_for_handlers(self, logger):
+        release = threading.Event()
+        handled = []
+
+        class SlowHandler(logging.Handler):
+            def emit(self, record):
+                release.wait(5)
+                handled.append(record.getMessage())
+
+        logger._handlers.append(SlowHandler())
+        logger.info("one")
+        logger.info("two")
+        assert handled == []
+
+        release.set()
+        logger.flush()
+        assert handled == ["one", "two"]
+
+    def test_direct_output_waits_for_queued_records(
+        self, logger, monkeypatch, tmp_path
+    ):
+        events = []
+
+        class SlowHandler(logging.Handler):
+            def emit(self, record):
+                time.sleep(0.2)
+                events.append("log")
+
+        class RecordingStream(io.StringIO):
+            def write(self, text):
+                events.append("print")
+                return super().write(text)
+
+        logger._handlers.append(SlowHandler())
+        monkeypatch.setattr(sys, "stdout", RecordingStream())
+
+        logger.info("Scanning installation")
+        display_backup_estimate(tmp_path, [], [])
+        logger.info("Writing archive")
+        print("Done")
+
+        runs = [event for i, event in enumerate(events) if events[i - 1 : i] != [event]]
+        assert runs == ["log", "print", "log", "print"]
+        assert "Done" in sys.stdout.getvalue()
+
+    def test_disabled_level_skips_formatting(self, logger):
+        class Expensive:
+            formatted = 0
+
+            def __str__(self):
+                Expensive.formatted += 1
+                return "expensive"
+
+        logger.set_file_level(LogLevel.WARNING)
+        logger.logger.debug("%s", Expensive())
+        logger.success("quiet")
+        logger.flush()
+
+        assert Expensive.formatted == 0
+        assert logger.log_file is None
+        assert not logger.logger.isEnabledFor(logging.INFO)
+
+
+class TestLazyLogger:
+    def test_nothing_is_created_until_a_record_is_emitted(self, logger):
+        assert not logger.log_dir.exists()
+        assert logger._handlers == []
+        assert logger._listener._thread is None
+
+        logger.close()
+        assert not logger.log_dir.exists()
+
+    def test_handlers_are_created_by_records_they_accept(self, logger):
+        logger.set_file_level(LogLevel.ERROR)
+        logger.info("dropped")
+        logger.set_console_level(LogLevel.WARNING)
+        logger.warning("console only")
+        logger.flush()
+        assert logger._console_handler is not None
+        assert not logger.log_dir.exists()
+
+        logger.error("both")
+        logger.flush()
+        assert logger.log_file.read_text().count("|") == 3  # Just one record
+
+    def test_retention_cleanup_runs_once_per_interval(self, tmp_path):
+        log_dir = tmp_path / "logs"
+        log_dir.mkdir()
+
+        def add_old_logs(count):
+            for i in range(count):
+                path = log_dir / f"superclaude-test_2000010{i % 10}_00000{i}.log"
+                path.write_text("old")
+                os.utime(path, (1000 + i, 1000 + i))
+
+        def log_once():
+            logger = Logger("superclaude-test", log_dir=log_dir)
+            logger.debug("hello")
+            logger.stop()
+            return len(list(log_dir.glob("superclaude-test_*.log")))
+
+        add_old_logs(15)
+        assert log_once() == 10
+
+        add_old_logs(5)
+        assert log_once() > 10  # Marker is fresh, cleanup skipped
+
+        marker = log_dir / ".superclaude-test-last-cleanup"
+        stale = time.time() - LOG_CLEANUP_INTERVAL - 60
+        os.utime(marker, (stale, stale))
+        assert log_once() == 10
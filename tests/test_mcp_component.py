@@ -1,7 +1,20 @@
+import json
+import shutil
+import subprocess
+import time
 import pytest
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 from setup.components.mcp import MCPComponent
+from setup.services.mcp_config import MCPConfigService
+
+
+@pytest.fixture(autouse=True)
+def isolated_home(tmp_path, monkeypatch):
+    """Keep MCPComponent away from the real ~/.claude.json"""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("USERPROFILE", str(tmp_path))
+    return tmp_path
 
 
 class TestMCPComponent:
@@ -85,3 +98,357 @@ class TestMCPComponent:
         assert success is False
         assert len(errors) == 1
         assert "playwright" in errors[0]
+
+    @patch("subprocess.run")
+    def test_mcp_list_fetched_once_and_invalidated_after_add(
+        self, mock_subprocess_run
+    ):
+        component = MCPComponent(install_dir=Path("/fake/dir"))
+        component.mcp_servers = component.mcp_servers_legacy
+
+        list_result = MagicMock(returncode=0, stderr="")
+        list_result.stdout = (
+            "Checking MCP server health...\n\n"
+            "context7: npx -y @upstash/context7-mcp - ✓ Connected\n"
+        )
+        add_result = MagicMock(returncode=0, stdout="", stderr="")
+
+        def fake_run(cmd, **kwargs):
+            cmd_str = " ".join(cmd) if isinstance(cmd, list) else cmd
+            return add_result if " add " in cmd_str else list_result
+
+        mock_subprocess_run.side_effect = fake_run
+
+        assert component._check_mcp_server_installed("context7") is True
+        assert component._check_mcp_server_installed("magic") is False
+        assert component._detect_existing_mcp_servers_from_cli() == []
+        assert mock_subprocess_run.call_count == 1
+
+        # Installing mutates the server set, so the next check re-lists
+        assert component._install_mcp_server(
+            component.mcp_servers["magic"], {}
+        ) is True
+        list_result.stdout += "magic: npx -y @21st-dev/magic - ✓ Connected\n"
+        assert component._check_mcp_server_installed("magic") is True
+        assert mock_subprocess_run.call_count == 3
+
+    @patch("subprocess.run")
+    def test_native_config_used_without_spawning_cli(
+        self, mock_subprocess_run, tmp_path
+    ):
+        config_file = tmp_path / "claude.json"
+        config_file.write_text('{"numStartups": 3}')
+
+        component = MCPComponent(install_dir=Path("/fake/dir"))
+        component.mcp_config = MCPConfigService(config_file)
+
+        registered, _ = component._add_mcp_server(
+            "magic", ["npx", "-y", "@21st-dev/magic"]
+        )
+
+        assert registered is True
+        assert component._check_mcp_server_installed("magic") is True
+        mock_subprocess_run.assert_not_called()
+
+        saved = json.loads(config_file.read_text())
+        assert saved["numStartups"] == 3
+        assert saved["mcpServers"]["magic"]["command"] == "npx"
+        assert saved["mcpServers"]["magic"]["args"] == ["-y", "@21st-dev/magic"]
+
+        removed, _ = component._remove_mcp_server("magic")
+        assert removed is True
+        assert component._check_mcp_server_installed("magic") is False
+        mock_subprocess_run.assert_not_called()
+
+        # The lock lives with SuperClaude's state, not next to the config
+        assert sorted(p.name for p in tmp_path.iterdir()) == [".claude", "claude.json"]
+        assert (tmp_path / ".claude" / "claude.json.lock").is_file()
+
+    @patch("subprocess.run")
+    def test_project_and_local_scopes_are_visible(
+        self, mock_subprocess_run, tmp_path, monkeypatch
+    ):
+        project = tmp_path / "project"
+        project.mkdir()
+        monkeypatch.chdir(project)
+        (project / ".mcp.json").write_text(
+            json.dumps({"mcpServers": {"context7": {"command": "npx"}}})
+        )
+        config_file = tmp_path / "claude.json"
+        config_file.write_text(
+            json.dumps(
+                {
+                    "projects": {
+                        str(Path.cwd()): {"mcpServers": {"magic": {"command": "npx"}}},
+                        "/elsewhere": {"mcpServers": {"serena": {"command": "uvx"}}},
+                    },
+                    "mcpServers": {"playwright": {"command": "npx"}},
+                }
+            )
+        )
+
+        component = MCPComponent(install_dir=Path("/fake/dir"))
+        component.mcp_config = MCPConfigService(config_file)
+
+        assert component._check_mcp_server_installed("magic") is True
+        assert component._check_mcp_server_installed("context7") is True
+        assert component._check_mcp_server_installed("playwright") is True
+        assert component._check_mcp_server_installed("serena") is False
+        mock_subprocess_run.assert_not_called()
+
+    def test_write_retries_when_config_changes_underneath(self, tmp_path):
+        config_file = tmp_path / "claude.json"
+        config_file.write_text('{"numStartups": 1}')
+        service = MCPConfigService(config_file)
+        load_config = service._load_config
+        loads = []
+
+        def load_then_cli_writes():
+            config = load_config()
+            if not loads:
+                # Simulate `claude` rewriting the file mid-edit without the lock
+                config_file.write_text('{"numStartups": 2, "cliKey": true}')
+            loads.append(config)
+            return config
+
+        with patch.object(service, "_load_config", load_then_cli_writes):
+            assert service.add_server("magic", "npx", ["-y", "@21st-dev/magic"])
+
+        saved = json.loads(config_file.read_text())
+        assert len(loads) == 2
+        assert saved["cliKey"] is True
+        assert saved["numStartups"] == 2
+        assert "magic" in saved["mcpServers"]
+
+    @patch("subprocess.run")
+    def test_unrecognized_config_falls_back_to_cli(
+        self, mock_subprocess_run, tmp_path
+    ):
+        config_file = tmp_path / "claude.json"
+        config_file.write_text('{"mcpServers": ["not", "a", "dict"]}')
+
+        component = MCPComponent(install_dir=Path("/fake/dir"))
+        component.mcp_config = MCPConfigService(config_file)
+
+        mock_subprocess_run.return_value.returncode = 0
+        mock_subprocess_run.return_value.stdout = "magic: npx -y @21st-dev/magic\n"
+
+        registered, _ = component._add_mcp_server(
+            "magic", ["npx", "-y", "@21st-dev/magic"]
+        )
+
+        assert registered is True
+        assert component._check_mcp_server_installed("magic") is True
+        assert mock_subprocess_run.call_count == 2
+        assert config_file.read_text() == '{"mcpServers": ["not", "a", "dict"]}'
+
+    def _legacy_component(self):
+        component = MCPComponent(install_dir=Path("/fake/dir"))
+        component.settings_manager = MagicMock()
+        component.settings_manager.get_metadata_setting.return_value = []
+        component.validate_prerequisites = MagicMock(return_value=(True, []))
+        component._detect_existing_mcp_servers_from_config = MagicMock(
+            return_value=[]
+        )
+        component._detect_existing_mcp_servers_from_cli = MagicMock(return_value=[])
+        component._check_mcp_server_installed = MagicMock(return_value=False)
+        # Keep the selection order instead of the set-based merge order
+        component._merge_server_lists = lambda existing, selected, previous: list(
+            selected
+        )
+        return component
+
+    def test_legacy_servers_installed_concurrently(self):
+        component = self._legacy_component()
+        servers = ["sequential-thinking", "context7", "magic", "playwright"]
+
+        def slow_install(server_info, config):
+            time.sleep(0.3)
+            return True
+
+        component._install_mcp_server = MagicMock(side_effect=slow_install)
+
+        start = time.monotonic()
+        success = component._install(
+            {"legacy_mode": True, "selected_mcp_servers": servers, "mcp_jobs": 4}
+        )
+        elapsed = time.monotonic() - start
+
+        assert success is True
+        # Serial installs would take at least 1.2 seconds
+        assert elapsed < 0.9
+        assert component.installed_servers_in_session == servers
+
+    def test_cli_registrations_are_serialized(self):
+        component = self._legacy_component()
+        component.use_native_mcp_config = False
+        servers = ["sequential-thinking", "context7", "magic", "playwright"]
+        active = []
+        overlaps = []
+
+        def claude_mcp_add(cmd, **kwargs):
+            if cmd[:3] != ["claude", "mcp", "add"]:
+                return subprocess.CompletedProcess(cmd, 0, "", "")
+            active.append(cmd)
+            overlaps.append(len(active))
+            time.sleep(0.05)
+            active.remove(cmd)
+            return subprocess.CompletedProcess(cmd, 0, "", "")
+
+        component._run_command_cross_platform = MagicMock(side_effect=claude_mcp_add)
+
+        success = component._install(
+            {"legacy_mode": True, "selected_mcp_servers": servers, "mcp_jobs": 4}
+        )
+
+        assert success is True
+        assert len(overlaps) == len(servers)
+        assert max(overlaps) == 1
+
+    def test_required_server_failure_aborts_remaining_installs(self):
+        component = self._legacy_component()
+        component._install_mcp_server = MagicMock(
+            side_effect=lambda server_info, config: server_info["name"] != "context7"
+        )
+
+        success = component._install(
+            {
+                "legacy_mode": True,
+                "selected_mcp_servers": [
+                    "sequential-thinking",
+                    "context7",
+                    "magic",
+                    "playwright",
+                ],
+                "mcp_jobs": 1,
+            }
+        )
+
+        assert success is False
+        attempted = [
+            call.args[0]["name"] for call in component._install_mcp_server.call_args_list
+        ]
+        assert attempted == ["sequential-thinking", "context7"]
+
+    @patch("setup.components.mcp.platform.system", return_value="Linux")
+    @patch("subprocess.run")
+    def test_commands_exec_directly_without_shell(self, mock_run, mock_system):
+        component = MCPComponent(install_dir=Path("/fake/dir"))
+
+        with patch(
+            "setup.components.mcp.shutil.which", return_value="/usr/bin/git"
+        ) as mock_which:
+            component._run_command_cross_platform(["git", "--version"])
+            component._run_command_cross_platform(["git", "status"])
+
+        assert mock_which.call_count == 1
+        args, kwargs = mock_run.call_args
+        assert args[0] == ["/usr/bin/git", "status"]
+        assert "shell" not in kwargs
+
+    @patch("setup.components.mcp.platform.system", return_value="Linux")
+    @patch("subprocess.run")
+    def test_command_alias_map_overrides_path(
+        self, mock_run, mock_system, monkeypatch
+    ):
+        monkeypatch.setenv(
+            "SUPERCLAUDE_COMMAND_ALIASES",
+            '{"claude": "/opt/claude/bin/claude --no-color"}',
+        )
+        component = MCPComponent(install_dir=Path("/fake/dir"))
+
+        component._run_command_cross_platform(["claude", "mcp", "list"])
+
+        args, _ = mock_run.call_args
+        assert args[0] == ["/opt/claude/bin/claude", "--no-color", "mcp", "list"]
+
+    @patch("setup.components.mcp.platform.system", return_value="Linux")
+    @patch("subprocess.run")
+    def test_unresolved_command_fails_fast(self, mock_run, mock_system):
+        component = MCPComponent(install_dir=Path("/fake/dir"))
+
+        with patch("setup.components.mcp.shutil.which", return_value=None):
+            with pytest.raises(FileNotFoundError, match="Command not found: my-alias"):
+                component._run_command_cross_platform(["my-alias", "arg"])
+
+        mock_run.assert_not_called()
+
+
+def _git(*args, cwd=None):
+    subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True)
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+class TestAirisGatewaySync:
+    @pytest.fixture
+    def upstream(self, tmp_path, monkeypatch):
+        """Local bare repository standing in for the GitHub remote"""
+        for var in ("GIT_AUTHOR", "GIT_COMMITTER"):
+            monkeypatch.setenv(f"{var}_NAME", "Test")
+            monkeypatch.setenv(f"{var}_EMAIL", "test@example.com")
+
+        bare = tmp_path / "airis.git"
+        work = tmp_path / "work"
+        _git("init", "-q", "--bare", "-b", "master", str(bare))
+        _git("clone", "-q", str(bare), str(work))
+        (work / "mcp.json").write_text("{}")
+        _git("add", "mcp.json", cwd=work)
+        _git("commit", "-q", "-m", "initial", cwd=work)
+        _git("push", "-q", "origin", "HEAD:master", cwd=work)
+        return bare, work
+
+    def _component(self, tmp_path, bare):
+        component = MCPComponent(install_dir=tmp_path / "claude")
+        component.airis_repo_url = bare.as_uri()
+        component.airis_gateway_dir = tmp_path / "airis-checkout"
+        component.airis_config_path = tmp_path / "claude" / "mcp.json"
+        component._check_mcp_server_installed = MagicMock(return_value=False)
+
+        run_command = component._run_command_cross_platform
+        component.make_runs = 0
+
+        def fake_make(cmd, **kwargs):
+            if cmd[0] != "make":
+                return run_command(cmd, **kwargs)
+            # Stand-in for make install-claude: link Claude's MCP config
+            component.make_runs += 1
+            component.airis_config_path.parent.mkdir(parents=True, exist_ok=True)
+            if not component.airis_config_path.is_symlink():
+                component.airis_config_path.symlink_to(
+                    component.airis_gateway_dir / "mcp.json"
+                )
+            return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+
+        component._run_command_cross_platform = fake_make
+        return component
+
+    def _head(self, path):
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=path, capture_output=True, text=True
+        ).stdout.strip()
+
+    def test_make_skipped_until_upstream_changes(self, tmp_path, upstream):
+        bare, work = upstream
+        component = self._component(tmp_path, bare)
+        server_info = component.mcp_servers_default["airis-mcp-gateway"]
+
+        assert component._install_airis_gateway(server_info, {}) is True
+        assert component.make_runs == 1
+        assert self._head(component.airis_gateway_dir) == self._head(work)
+        assert (component.airis_gateway_dir / ".git" / "shallow").exists()
+
+        # Nothing new upstream: fetch, compare, no installer run
+        assert component._install_airis_gateway(server_info, {}) is True
+        assert component.make_runs == 1
+
+        (work / "README.md").write_text("update")
+        _git("add", "README.md", cwd=work)
+        _git("commit", "-q", "-m", "update", cwd=work)
+        _git("push", "-q", "origin", "HEAD:master", cwd=work)
+
+        assert component._install_airis_gateway(server_info, {}) is True
+        assert component.make_runs == 2
+        assert self._head(component.airis_gateway_dir) == self._head(work)
+        assert component.settings_manager.get_metadata_setting(
+            "mcp.airis_gateway_commit"
+        ) == self._head(work)
@@ -0,0 +1,123 @@
+"""
+Tests for `superclaude mcp probe` against local stub MCP servers
+"""
+
+import json
+import sys
+import time
+import pytest
+from typer.testing import CliRunner
+from superclaude.cli.app import app
+from superclaude.cli.commands.mcp import probe_server, probe_servers
+
+runner = CliRunner()
+
+STUB_SERVER = """
+import json, sys, time
+time.sleep(float(sys.argv[1]))
+print("starting up (not JSON)", flush=True)
+request = json.loads(sys.stdin.readline())
+print(json.dumps({"jsonrpc": "2.0", "method": "notifications/message"}), flush=True)
+print(json.dumps({
+    "jsonrpc": "2.0",
+    "id": request["id"],
+    "result": {
+        "protocolVersion": request["params"]["protocolVersion"],
+        "capabilities": {},
+        "serverInfo": {"name": "stub", "version": "1.0"},
+    },
+}), flush=True)
+sys.stdin.read()
+"""
+
+
+@pytest.fixture
+def stub(tmp_path):
+    script = tmp_path / "stub_server.py"
+    script.write_text(STUB_SERVER)
+
+    def entry(delay=0.0, **extra):
+        return {"command": sys.executable, "args": [str(script), str(delay)], **extra}
+
+    return entry
+
+
+class TestMCPProbe:
+    def test_successful_handshake(self, stub):
+        result = probe_server(stub(), timeout=10)
+
+        assert result["ok"] is True
+        assert result["server"] == {"name": "stub", "version": "1.0"}
+        assert result["startup_ms"] >= 0
+        assert result["handshake_ms"] > 0
+
+    def test_startup_measured_to_first_output(self, stub):
+        result = probe_server(stub(delay=0.3), timeout=10)
+
+        assert result["ok"] is True
+        assert result["startup_ms"] >= 300
+
+    def test_non_object_error_reported(self):
+        script = (
+            "import json, sys; sys.stdin.readline();"
+            " print(json.dumps({'jsonrpc': '2.0', 'id': 1, 'error': 'boom'}), flush=True)"
+        )
+        result = probe_server({"command": sys.executable, "args": ["-c", script]})
+
+        assert result["ok"] is False
+        assert result["error"] == "boom"
+
+    def test_silent_server_hits_deadline(self, stub):
+        start = time.monotonic()
+        result = probe_server(stub(delay=30), timeout=0.5)
+
+        assert time.monotonic() - start < 5
+        assert result["ok"] is False
+        assert "No initialize response" in result["error"]
+        assert result["startup_ms"] is None
+
+    def test_missing_command_and_early_exit_reported(self):
+        missing = probe_server({"command": "/nonexistent/mcp-server"}, timeout=2)
+        exited = probe_server(
+            {"command": sys.executable, "args": ["-c", "pass"]}, timeout=5
+        )
+
+        assert "Failed to start" in missing["error"]
+        assert "Exited with code 0" in exited["error"]
+
+    def test_servers_probed_concurrently_with_stats(self, stub):
+        servers = {f"stub{i}": stub(delay=0.4) for i in range(4)}
+
+        start = time.monotonic()
+        summaries = probe_servers(servers, runs=2, timeout=10, jobs=4)
+        elapsed = time.monotonic() - start
+
+        # Serial probing would take at least 8 x 0.4 seconds
+        assert elapsed < 3
+        for summary in summaries.values():
+            assert summary["ok"] is True
+            assert summary["runs"] == 2
+            assert summary["handshake"]["max"] >= summary["handshake"]["p50"]
+
+    def test_probe_command_reports_failures(self, stub, tmp_path):
+        config_file = tmp_path / "claude.json"
+        config_file.write_text(
+            json.dumps(
+                {
+                    "mcpServers": {
+                        "good": stub(),
+                        "broken": {"command": "/nonexistent/mcp-server"},
+                        "remote": {"type": "http", "url": "http://localhost"},
+                    }
+                }
+            )
+        )
+
+        result = runner.invoke(
+            app, ["mcp", "probe", "--config", str(config_file), "--timeout", "10"]
+        )
+
+        assert result.exit_code == 1
+        assert "good" in result.stdout
+        assert "broken" in result.stdout
+        assert "remote" not in result.stdout
@@ -0,0 +1,38 @@
+"""
+Tests for gitignore-style backup path filtering
+"""
+
+import pytest
+from setup.utils.path_filter import PathFilter
+
+
+class TestPathFilter:
+    @pytest.mark.parametrize(
+        "pattern,path,is_dir,excluded",
+        [
+            ("*.log", "debug.log", False, True),
+            ("*.log", "logs/deep/debug.log", False, True),
+            ("/*.log", "logs/debug.log", False, False),
+            ("cache/", "plugins/cache", True, True),
+            ("cache/", "cache", False, False),
+            ("/projects/", "projects", True, True),
+            ("/projects/", "old/projects", True, False),
+            ("docs/*.md", "docs/a.md", False, True),
+            ("docs/*.md", "docs/sub/a.md", False, False),
+            ("docs/**/*.md", "docs/sub/deep/a.md", False, True),
+            ("**/tmp", "a/b/tmp", True, True),
+            ("file?.txt", "file1.txt", False, True),
+            ("file[!0-9].txt", "file1.txt", False, False),
+        ],
+    )
+    def test_pattern_semantics(self, pattern, path, is_dir, excluded):
+        assert PathFilter([pattern]).is_excluded(path, is_dir) is excluded
+
+    def test_last_matching_rule_wins(self):
+        rules = PathFilter(["/*", "!/commands/", "# comment", "", "!/*.md", "/NOTES.md"])
+
+        assert rules.is_excluded("projects", is_dir=True)
+        assert not rules.is_excluded("commands", is_dir=True)
+        assert not rules.is_excluded("CLAUDE.md")
+        assert rules.is_excluded("NOTES.md")
+        assert rules.patterns == ["/*", "!/commands/", "!/*.md", "/NOTES.md"]
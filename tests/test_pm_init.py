@@ -0,0 +1,99 @@
+"""
+Tests for in-process git root discovery used by PMInitializer
+"""
+
+import shutil
+import subprocess
+import pytest
+from unittest.mock import patch
+from superclaude.core.pm_init import init_hook
+from superclaude.core.pm_init.init_hook import (
+    PMInitializer,
+    clear_git_root_cache,
+    find_git_root,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    for name in init_hook.GIT_LOCATION_ENV:
+        monkeypatch.delenv(name, raising=False)
+    clear_git_root_cache()
+    yield
+    clear_git_root_cache()
+
+
+def make_git_dir(path):
+    path.mkdir(parents=True)
+    (path / "HEAD").write_text("ref: refs/heads/main\n")
+    return path
+
+
+class TestFindGitRoot:
+    def test_repository_subdirectory(self, tmp_path):
+        make_git_dir(tmp_path / "repo" / ".git")
+        nested = tmp_path / "repo" / "src" / "pkg"
+        nested.mkdir(parents=True)
+
+        with patch.object(init_hook.subprocess, "run") as run:
+            assert find_git_root(nested) == tmp_path / "repo"
+        run.assert_not_called()
+
+    def test_worktree_gitdir_file(self, tmp_path):
+        gitdir = make_git_dir(tmp_path / "main" / ".git" / "worktrees" / "feature")
+        worktree = tmp_path / "feature"
+        worktree.mkdir()
+        (worktree / ".git").write_text(f"gitdir: {gitdir}\n")
+
+        assert find_git_root(worktree) == worktree
+
+    def test_submodule_relative_gitdir(self, tmp_path):
+        make_git_dir(tmp_path / "repo" / ".git" / "modules" / "lib")
+        submodule = tmp_path / "repo" / "lib"
+        submodule.mkdir()
+        (submodule / ".git").write_text("gitdir: ../.git/modules/lib\n")
+
+        assert find_git_root(submodule) == submodule
+
+    def test_outside_repository(self, tmp_path):
+        with patch.object(init_hook.subprocess, "run") as run:
+            assert find_git_root(tmp_path) is None
+        run.assert_not_called()
+
+    def test_missing_root_is_not_cached(self, tmp_path):
+        assert find_git_root(tmp_path) is None
+        make_git_dir(tmp_path / ".git")
+        assert find_git_root(tmp_path) == tmp_path
+
+    def test_cached_root_is_reused_until_removed(self, tmp_path):
+        make_git_dir(tmp_path / ".git")
+        assert find_git_root(tmp_path) == tmp_path
+
+        with patch.object(init_hook, "_walk_for_git_root") as walk:
+            assert find_git_root(tmp_path) == tmp_path
+        walk.assert_not_called()
+
+        shutil.rmtree(tmp_path / ".git")
+        assert find_git_root(tmp_path) is None
+
+    def test_falls_back_to_git_when_undetermined(self, tmp_path):
+        (tmp_path / ".git").write_text("not a gitdir pointer\n")
+
+        with patch.object(
+            init_hook, "_git_root_from_subprocess", return_value=None
+        ) as fallback:
+            assert find_git_root(tmp_path) is None
+        fallback.assert_called_once_with(tmp_path.resolve())
+
+    @pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+    def test_matches_git(self, tmp_path):
+        subprocess.run(["git", "init", "-q", str(tmp_path / "repo")], check=True)
+        nested = tmp_path / "repo" / "a" / "b"
+        nested.mkdir(parents=True)
+
+        assert find_git_root(nested) == init_hook._git_root_from_subprocess(nested)
+
+    def test_pm_initializer_uses_walk(self, tmp_path):
+        with patch.object(init_hook.subprocess, "run") as run:
+            assert PMInitializer(tmp_path).detect_git_root() is None
+        run.assert_not_called()
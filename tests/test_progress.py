@@ -0,0 +1,107 @@
+"""
+Tests for install/update/uninstall progress events and renderers
+"""
+
+import io
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+from setup.core.installer import Installer
+from setup.utils.progress import (
+    COMPONENT_FINISHED,
+    COMPONENT_STARTED,
+    FILE_DONE,
+    LineProgressRenderer,
+    ProgressEvent,
+    create_progress_renderer,
+    is_interactive,
+)
+
+
+def make_component(name, installs=True):
+    component = MagicMock()
+    component.get_metadata.return_value = {"name": name}
+    component.get_dependencies.return_value = []
+    component.get_files_to_install.return_value = [
+        (Path("a.md"), Path("a.md")),
+        (Path("b.md"), Path("b.md")),
+    ]
+    component.validate_prerequisites.return_value = (True, [])
+    component.validate_installation.return_value = (True, [])
+
+    def install(config):
+        callback = component.progress_callback
+        callback(ProgressEvent(FILE_DONE, name, files=1, nbytes=10))
+        callback(ProgressEvent(FILE_DONE, name, files=1, nbytes=20))
+        return installs
+
+    component.install.side_effect = install
+    return component
+
+
+class TestInstallerProgress:
+    def test_events_for_each_component(self, tmp_path):
+        events = []
+        installer = Installer(install_dir=tmp_path, progress=events.append)
+        installer.register_components(
+            [make_component("core"), make_component("extra", installs=False)]
+        )
+
+        assert not installer.install_components(["core", "extra"])
+
+        kinds = [(event.kind, event.component) for event in events]
+        assert kinds == [
+            (COMPONENT_STARTED, "core"),
+            (FILE_DONE, "core"),
+            (FILE_DONE, "core"),
+            (COMPONENT_FINISHED, "core"),
+            (COMPONENT_STARTED, "extra"),
+            (FILE_DONE, "extra"),
+            (FILE_DONE, "extra"),
+            (COMPONENT_FINISHED, "extra"),
+        ]
+        assert events[0].total_files == 2
+        assert [event.ok for event in events if event.kind == COMPONENT_FINISHED] == [
+            True,
+            False,
+        ]
+        assert installer.components["core"].progress_callback is None
+
+    def test_finished_event_when_install_raises(self, tmp_path):
+        events = []
+        installer = Installer(install_dir=tmp_path, progress=events.append)
+        component = make_component("core")
+        component.install.side_effect = RuntimeError("boom")
+        installer.register_component(component)
+
+        assert not installer.install_component("core", {})
+        assert events[-1].kind == COMPONENT_FINISHED
+        assert events[-1].ok is False
+
+
+class TestRenderers:
+    def test_line_renderer_writes_one_line_per_component(self):
+        stream = io.StringIO()
+        with LineProgressRenderer("Installing", 2, stream) as progress:
+            progress(ProgressEvent(COMPONENT_STARTED, "core", total_files=2))
+            progress(ProgressEvent(FILE_DONE, "core", files=1, nbytes=512))
+            progress(ProgressEvent(FILE_DONE, "core", files=1, nbytes=512))
+            progress(ProgressEvent(COMPONENT_FINISHED, "core", ok=True))
+            progress(ProgressEvent(COMPONENT_STARTED, "mcp"))
+            progress(ProgressEvent(COMPONENT_FINISHED, "mcp", ok=False))
+
+        lines = stream.getvalue().splitlines()
+        assert len(lines) == 2
+        assert lines[0].startswith("[1/2] Installing core: ok (2 files, 1.0 KB, ")
+        assert lines[1].startswith("[2/2] Installing mcp: failed (")
+
+    def test_ci_environment_is_not_interactive(self):
+        stream = MagicMock()
+        stream.isatty.return_value = True
+        with patch.dict("os.environ", {"CI": "true"}):
+            assert not is_interactive(stream)
+            assert isinstance(
+                create_progress_renderer("Installing", 1, stream), LineProgressRenderer
+            )
+
+    def test_pipe_is_not_interactive(self):
+        assert not is_interactive(io.StringIO())
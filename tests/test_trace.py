@@ -0,0 +1,108 @@
+"""
+Tests for span tracing
+"""
+
+import json
+import pytest
+from setup.core.base import Component
+from setup.services.settings import SettingsService
+from setup.utils import trace
+from superclaude.core.pm_init.init_hook import PMInitializer
+
+
+@pytest.fixture
+def trace_file(tmp_path, monkeypatch):
+    path = tmp_path / "trace.json"
+    monkeypatch.setenv(trace.TRACE_ENV, str(path))
+    trace.configure(str(path))
+    yield path
+    trace.configure(None)
+
+
+def read_spans(path):
+    events = json.loads(path.read_text())["traceEvents"]
+    return [event for event in events if event["ph"] == "X"]
+
+
+class TinyComponent(Component):
+    def get_metadata(self):
+        return {"name": "tiny"}
+
+    def _install(self, config):
+        return True
+
+    def _post_install(self):
+        return True
+
+    def uninstall(self):
+        return True
+
+    def get_dependencies(self):
+        return []
+
+    def _get_source_dir(self):
+        return None
+
+
+class TestSpans:
+    def test_disabled_records_nothing(self):
+        tracer = trace.configure(None)
+        with trace.span("quiet") as args:
+            args["x"] = 1
+        assert tracer.events == []
+
+    def test_nested_spans_export_chrome_trace(self, trace_file):
+        with trace.span("outer", "test", step=1):
+            with trace.span("inner", "test"):
+                pass
+        trace.get_tracer().flush()
+
+        document = json.loads(trace_file.read_text())
+        assert document["traceEvents"][0]["ph"] == "M"
+        inner, outer = read_spans(trace_file)
+        assert (inner["name"], outer["name"]) == ("inner", "outer")
+        assert outer["args"] == {"step": 1}
+        assert outer["ts"] <= inner["ts"]
+        assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+
+    def test_exception_is_recorded_and_raised(self, trace_file):
+        with pytest.raises(KeyError):
+            with trace.span("failing"):
+                raise KeyError("x")
+        trace.get_tracer().flush()
+
+        assert read_spans(trace_file)[0]["args"] == {"error": "KeyError"}
+
+    def test_jsonl_appends_one_event_per_line(self, tmp_path):
+        path = tmp_path / "fleet.jsonl"
+        for _ in range(2):
+            trace.configure(str(path))
+            with trace.span("run"):
+                pass
+        trace.configure(None)
+
+        events = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [event["ph"] for event in events] == ["M", "X", "M", "X"]
+
+
+class TestWiring:
+    def test_component_lifecycle_and_settings_io(self, trace_file, tmp_path):
+        component = TinyComponent.__new__(TinyComponent)
+        component.uninstall()
+        settings = SettingsService(tmp_path)
+        settings.save_metadata({"a": 1})
+        settings.load_metadata()
+        trace.get_tracer().flush()
+
+        spans = {(span["name"], span["cat"]) for span in read_spans(trace_file)}
+        assert ("TinyComponent.uninstall", "component") in spans
+        assert ("SettingsService.save_metadata", "io") in spans
+        assert ("SettingsService.load_metadata", "io") in spans
+
+    def test_pm_initializer(self, trace_file, tmp_path):
+        result = PMInitializer(tmp_path).initialize()
+        trace.get_tracer().flush()
+
+        (span,) = read_spans(trace_file)
+        assert span["name"] == "PMInitializer.initialize"
+        assert span["args"]["status"] == result["status"]
@@ -0,0 +1,118 @@
+"""
+Tests for the cached, background update check
+"""
+
+import json
+import threading
+import time
+import pytest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest.mock import patch
+from setup.utils.updater import UpdateChecker
+
+
+class FakePyPI(BaseHTTPRequestHandler):
+    """Stand-in for https://pypi.org/pypi/superclaude/json"""
+
+    latest = "9.9.9"
+    requests = 0
+
+    def do_GET(self):
+        type(self).requests += 1
+        if self.path != "/pypi/superclaude/json":
+            self.send_error(404)
+            return
+        body = json.dumps({"info": {"version": self.latest}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def pypi_url():
+    FakePyPI.requests = 0
+    server = HTTPServer(("127.0.0.1", 0), FakePyPI)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/pypi/superclaude/json"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def checker(tmp_path, pypi_url):
+    return UpdateChecker("4.1.6", tmp_path / ".update_check", pypi_url)
+
+
+class TestUpdateChecker:
+    def test_refresh_caches_verdict(self, checker):
+        with patch.object(checker, "detect_installation_method", return_value="pipx"):
+            assert checker.refresh_cache()
+
+        cache = checker.read_cache()
+        assert cache["latest_version"] == "9.9.9"
+        assert cache["install_method"] == "pipx"
+        assert checker.cached_update() == "9.9.9"
+        assert checker.get_update_command() == "pipx upgrade SuperClaude"
+
+    def test_refresh_failure_keeps_retry_window(self, tmp_path):
+        checker = UpdateChecker("4.1.6", tmp_path / "cache", "http://127.0.0.1:9/none")
+
+        assert not checker.refresh_cache()
+        assert "last_check" not in checker.read_cache()
+        assert not checker.should_check_update()
+
+    def test_foreground_reads_only_the_cache(self, checker):
+        checker.write_cache({"last_check": 0, "latest_version": "9.9.9"})
+
+        with patch.object(checker, "start_background_refresh") as refresh, patch.object(
+            checker, "show_update_banner", return_value=False
+        ) as banner:
+            assert not checker.check_and_notify()
+
+        refresh.assert_called_once_with()
+        banner.assert_called_once_with("9.9.9", False)
+        assert FakePyPI.requests == 0
+
+    def test_banner_shown_once_per_interval(self, checker):
+        checker.write_cache({"last_check": time.time(), "latest_version": "9.9.9"})
+
+        with patch.object(checker, "show_update_banner", return_value=False) as banner:
+            checker.check_and_notify()
+            checker.check_and_notify()
+            assert banner.call_count == 1
+
+            # An even newer release is announced right away
+            checker.write_cache({"latest_version": "10.0.0"})
+            checker.check_and_notify()
+            assert banner.call_count == 2
+
+            checker.write_cache(
+                {"last_notified": time.time() - checker.CHECK_INTERVAL - 1}
+            )
+            checker.check_and_notify()
+            assert banner.call_count == 3
+
+    def test_fresh_cache_skips_refresh(self, checker):
+        checker.write_cache({"last_check": time.time(), "latest_version": "4.1.6"})
+
+        with patch.object(checker, "start_background_refresh") as refresh:
+            assert not checker.check_and_notify()
+
+        refresh.assert_not_called()
+
+    def test_background_process_writes_cache(self, checker):
+        assert checker.start_background_refresh()
+
+        deadline = time.monotonic() + 30
+        while "latest_version" not in checker.read_cache():
+            assert time.monotonic() < deadline, "background refresh did not finish"
+            time.sleep(0.05)
+
+        assert checker.cached_update() == "9.9.9"
+        assert FakePyPI.requests == 1
@@ -0,0 +1,147 @@
+import sys
+import threading
+import time
+import pytest
+from unittest.mock import patch
+from setup.core.validator import Validator
+from setup.utils.probe_cache import ProbeCache
+
+
+def _slow_check(delay, result):
+    def check(*args, **kwargs):
+        time.sleep(delay)
+        return result
+
+    return check
+
+
+class TestDiagnoseSystem:
+    @patch("setup.core.validator.shutil.which", return_value="/usr/bin/tool")
+    def test_probes_run_concurrently(self, mock_which):
+        validator = Validator()
+
+        with patch.object(
+            validator, "check_node", _slow_check(0.5, (True, "Node.js ok"))
+        ), patch.object(
+            validator, "check_claude_cli", _slow_check(0.5, (True, "Claude ok"))
+        ), patch.object(
+            validator, "check_disk_space", _slow_check(0.5, (True, "Disk ok"))
+        ):
+            start = time.monotonic()
+            diagnostics = validator.diagnose_system()
+            elapsed = time.monotonic() - start
+
+        # Serial execution would take at least 1.5 seconds
+        assert elapsed < 1.2
+        assert diagnostics["checks"]["node"]["status"] == "pass"
+        assert diagnostics["checks"]["claude_cli"]["status"] == "pass"
+        assert diagnostics["checks"]["disk_space"]["status"] == "pass"
+        assert diagnostics["issues"] == []
+
+    @patch("setup.core.validator.shutil.which", return_value="/usr/bin/tool")
+    def test_hung_probe_reported_after_deadline(self, mock_which):
+        validator = Validator()
+
+        with patch.object(
+            validator, "check_claude_cli", _slow_check(2, (True, "Claude ok"))
+        ), patch.object(validator, "check_node", return_value=(True, "Node.js ok")):
+            start = time.monotonic()
+            diagnostics = validator.diagnose_system(deadline=0.3)
+            elapsed = time.monotonic() - start
+
+        assert elapsed < 1.5
+        assert diagnostics["checks"]["node"]["status"] == "pass"
+        assert diagnostics["checks"]["claude_cli"]["status"] == "fail"
+        assert "timed out" in diagnostics["checks"]["claude_cli"]["message"]
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="uses a shell script tool")
+    def test_hung_subprocess_bounded_by_deadline(self, tmp_path, monkeypatch):
+        tool = tmp_path / "bin" / "claude"
+        tool.parent.mkdir()
+        tool.write_text("#!/bin/sh\nexec sleep 5\n")
+        tool.chmod(0o755)
+        monkeypatch.setenv("PATH", str(tool.parent))
+        validator = Validator(probe_cache=ProbeCache(tmp_path / "probe_cache.json"))
+
+        start = time.monotonic()
+        diagnostics = validator.diagnose_system(deadline=0.5)
+        assert diagnostics["checks"]["claude_cli"]["status"] == "fail"
+
+        # The worker must not outlive the deadline by much, or it would
+        # hold up interpreter exit
+        for thread in threading.enumerate():
+            if thread.name.startswith("superclaude-diagnose"):
+                thread.join(3)
+        assert time.monotonic() - start < 2.5
+        assert validator._probe_timeout() == 10
+
+    @patch("setup.core.validator.subprocess.run")
+    @patch("setup.core.validator.shutil.which", return_value=None)
+    def test_missing_tools_resolved_without_spawning(self, mock_which, mock_run):
+        validator = Validator()
+
+        diagnostics = validator.diagnose_system()
+
+        mock_run.assert_not_called()
+        assert diagnostics["checks"]["node"]["status"] == "fail"
+        assert diagnostics["checks"]["claude_cli"]["status"] == "fail"
+        assert "npm not found in PATH" in diagnostics["issues"]
+
+
+class TestCheckExternalTool:
+    @pytest.mark.parametrize("command", ["", "   "])
+    def test_empty_command_is_a_failure(self, command, tmp_path):
+        validator = Validator(probe_cache=ProbeCache(tmp_path / "probe_cache.json"))
+
+        success, message = validator.check_external_tool("Tool", command)
+
+        assert success is False
+        assert "Tool" in message
+
+
+class TestProbeCache:
+    def _make_tool(self, tmp_path):
+        tool = tmp_path / "bin" / "node"
+        tool.parent.mkdir()
+        tool.write_text("#!/bin/sh\necho v20.1.0\n")
+        tool.chmod(0o755)
+        return tool
+
+    def test_probe_result_reused_across_validators(self, tmp_path, monkeypatch):
+        tool = self._make_tool(tmp_path)
+        monkeypatch.setenv("PATH", str(tool.parent))
+        cache = ProbeCache(tmp_path / "probe_cache.json")
+
+        with patch("setup.core.validator.subprocess.run") as mock_run:
+            mock_run.return_value.returncode = 0
+            mock_run.return_value.stdout = "v20.1.0\n"
+            assert Validator(probe_cache=cache).check_node()[0] is True
+            assert mock_run.call_count == 1
+
+            # Fresh validator and cache instance simulate a new CLI invocation
+            fresh_cache = ProbeCache(tmp_path / "probe_cache.json")
+            assert Validator(probe_cache=fresh_cache).check_node()[0] is True
+            assert mock_run.call_count == 1
+
+            # --refresh forces a re-probe
+            Validator(probe_cache=fresh_cache, refresh=True).check_node()
+            assert mock_run.call_count == 2
+
+    def test_toolchain_change_invalidates_entry(self, tmp_path, monkeypatch):
+        tool = self._make_tool(tmp_path)
+        monkeypatch.setenv("PATH", str(tool.parent))
+        cache = ProbeCache(tmp_path / "probe_cache.json")
+        cache.set("node_16.0_None", "node", (True, "Node.js 20.1.0 meets requirements"))
+
+        assert cache.get("node_16.0_None", "node") is not None
+
+        tool.write_text("#!/bin/sh\necho v22.0.0-upgraded\n")
+        assert cache.get("node_16.0_None", "node") is None
+
+    def test_expired_entry_is_a_miss(self, tmp_path, monkeypatch):
+        tool = self._make_tool(tmp_path)
+        monkeypatch.setenv("PATH", str(tool.parent))
+        cache = ProbeCache(tmp_path / "probe_cache.json", ttl=0)
+        cache.set("node_16.0_None", "node", (True, "Node.js ok"))
+
+        assert cache.get("node_16.0_None", "node") is None